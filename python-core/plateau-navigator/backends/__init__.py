@@ -1,6 +1,7 @@
 from .qubit_flow.java_backend import JavaBackend
 from .qiskit_runtime.qiskit_backend import QiskitBackend
 from .qiskit_runtime.aer_backend import AerBackend
+from .numpy_statevector.numpy_backend import NumpyStatevectorBackend
 from .strawberry_fields.sf_backend import StrawberryFieldsBackend
 from .backend_interface import DVBackend, CVBackend
 
@@ -8,6 +9,7 @@ __all__ = [
     "DVBackend",
     "CVBackend",
     "AerBackend",
+    "NumpyStatevectorBackend",
     "QiskitBackend",
     "JavaBackend",
     "StrawberryFieldsBackend",
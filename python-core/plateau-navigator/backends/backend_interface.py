@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Union
+from typing import Callable, Dict, Any, List, Tuple, Union
 import numpy as np
+from .metric import block_diagonal_metric
+from .profiling import NULL_PROFILER
+from .tracing import GateTape, compile_ansatz
 
 
 class DVBackend(ABC):
@@ -17,6 +20,9 @@ class DVBackend(ABC):
         Parametric gates pass angles via **params: theta, phi, lam (lambda)
     """
 
+    # Phase timers / counters; VQE(profile=True) lends its profiler per run
+    profiler = NULL_PROFILER
+
     @abstractmethod
     def create_circuit(self, num_qubits: int) -> Dict[str, Any]:
         """Initialize an empty circuit for num_qubits qubits."""
@@ -77,6 +83,130 @@ class DVBackend(ABC):
         """
         pass
 
+    def prepare_observable(
+        self,
+        observable: Union[np.ndarray, List[tuple]]
+    ) -> Union[np.ndarray, List[tuple]]:
+        """
+        Form of observable this backend evaluates fastest, computed once
+        and then passed to every expectation and gradient call of a run
+        (VQE does this per run()). Backends that decompose matrices into
+        Pauli terms override it so the decomposition lookup — a content
+        hash of the full matrix — is not repeated on every evaluation.
+        The default returns observable unchanged.
+        """
+        return observable
+
+    def compute_expectations(
+        self,
+        observables: List[Union[np.ndarray, List[tuple]]]
+    ) -> np.ndarray:
+        """
+        Compute ⟨ψ|O_k|ψ⟩ for every observable O_k on the executed state.
+
+        Used by the block-diagonal metric to measure all Pauli strings of a
+        layer at once. The default implementation calls compute_expectation()
+        per observable; backends that pay per call (remote jobs, state
+        transfers) should override it.
+
+        Args:
+            observables: List of observables, each in a form accepted by
+                         compute_expectation().
+        Returns:
+            Real-valued np.ndarray of shape (len(observables),).
+        """
+        return np.array([self.compute_expectation(o) for o in observables], dtype=float)
+
+    def batch_expectation(
+        self,
+        param_sets: np.ndarray,
+        observable: Union[np.ndarray, List[tuple]],
+        ansatz: Callable,
+    ) -> np.ndarray:
+        """
+        Compute ⟨ψ(θ)|H|ψ(θ)⟩ for every parameter vector θ in param_sets.
+
+        Used by VQE to submit all shifted circuits of a gradient at once.
+        The default implementation evaluates the circuits one at a time;
+        backends that can run many circuits per call should override it.
+
+        Args:
+            param_sets: Array of shape (B, n_params), one row per circuit.
+            observable: Same forms accepted by compute_expectation().
+            ansatz:     Callable ansatz(backend, params) that queues the
+                        gates for a single parameter vector.
+        Returns:
+            Real-valued np.ndarray of shape (B,).
+        """
+        energies = np.empty(len(param_sets))
+        for k, params in enumerate(param_sets):
+            self.clear_circuit()
+            self.reset_state()
+            ansatz(self, params)
+            self.execute_circuit()
+            energies[k] = self.compute_expectation(observable)
+        return energies
+
+    def adjoint_gradient(
+        self,
+        params: np.ndarray,
+        observable: Union[np.ndarray, List[tuple]],
+        ansatz: Callable,
+    ) -> Tuple[float, np.ndarray]:
+        """
+        Return (⟨ψ(θ)|H|ψ(θ)⟩, ∇θ E) by adjoint differentiation: one forward
+        pass plus one backward pass over the recorded gate tape.
+
+        Only available on statevector simulator backends — raises
+        NotImplementedError elsewhere. Gate angles must be affine in a
+        single parameter (see backends.tracing.TracedParameter).
+        """
+        raise NotImplementedError(
+            f"{self.name} does not support adjoint differentiation. "
+            f"Use a statevector simulator backend or gradient_method="
+            f"'parameter_shift'."
+        )
+
+    def metric_tensor(self, params: np.ndarray, ansatz: Callable) -> np.ndarray:
+        """
+        Block-diagonal Fubini–Study metric g(θ), shape (P, P), for quantum
+        natural gradient.
+
+        Parametrised rotations are grouped into layers (see
+        backends.metric.metric_layers); each layer contributes the
+        covariance of its generators on the state before it. The default
+        executes one prefix circuit per layer and measures the generators
+        as Pauli strings; statevector backends override it with a single
+        forward pass.
+
+        Args:
+            ansatz: Ansatz callable or compiled GateTape. Callables are
+                    compiled first, so gate angles must be affine in a
+                    single parameter.
+        """
+        params = np.asarray(params, dtype=float)
+        tape = ansatz if isinstance(ansatz, GateTape) else self.compile_ansatz(ansatz, params)
+        return block_diagonal_metric(self, tape, params)
+
+    def compile_ansatz(self, ansatz: Callable, params: np.ndarray) -> GateTape:
+        """
+        Trace ansatz(backend, params) once into an immutable GateTape.
+
+        Gate validation happens here, once; the returned tape can then be
+        used in place of the ansatz and rebinds new parameters without
+        re-entering Python ansatz code. See backends.tracing.compile_ansatz.
+        """
+        return compile_ansatz(self, ansatz, params)
+
+    def load_tape(self, tape: GateTape, params: np.ndarray) -> None:
+        """
+        Queue every gate of a compiled tape with angles bound to params.
+
+        The default replays the tape through add_gate(); simulator backends
+        override it to append pre-resolved operations without validation.
+        """
+        tape.replay(self, params)
+
     @abstractmethod
     def reset_state(self) -> None:
         """
@@ -116,6 +246,9 @@ class CVBackend(ABC):
     Supported backend engines: Strawberry Fields (fock/gaussian/bosonic/tf)
     """
 
+    # Phase timers / counters; VQE(profile=True) lends its profiler per run
+    profiler = NULL_PROFILER
+
     @abstractmethod
     def create_circuit(self, n_modes: int, cutoff_dim: int = 10) -> Dict[str, Any]:
         """
@@ -225,6 +358,8 @@ class CVBackend(ABC):
                 - 'p2' : P̂²
                 - np.ndarray: arbitrary Hermitian matrix in Fock basis,
                               shape (cutoff_dim, cutoff_dim) for single mode
+                - [(coeff, ((mode, O), ...)), ...]: multi-mode sum of
+                              products of single-mode Hermitian matrices
             mode: Which mode to measure (for string observables).
 
         Returns:
@@ -232,6 +367,35 @@ class CVBackend(ABC):
         """
         pass
 
+    def batch_expectation(
+        self,
+        param_sets: np.ndarray,
+        observable: Union[str, np.ndarray],
+        ansatz: Callable,
+    ) -> np.ndarray:
+        """
+        Compute ⟨ψ(θ)|O|ψ(θ)⟩ for every parameter vector θ in param_sets.
+
+        CV counterpart of DVBackend.batch_expectation(). The default
+        implementation evaluates the circuits one at a time.
+
+        Args:
+            param_sets: Array of shape (B, n_params), one row per circuit.
+            observable: Same forms accepted by compute_expectation().
+            ansatz:     Callable ansatz(backend, params) that queues the
+                        operations for a single parameter vector.
+        Returns:
+            Real-valued np.ndarray of shape (B,).
+        """
+        energies = np.empty(len(param_sets))
+        for k, params in enumerate(param_sets):
+            self.clear_circuit()
+            self.reset_state()
+            ansatz(self, params)
+            self.execute_circuit()
+            energies[k] = self.compute_expectation(observable)
+        return energies
+
     @abstractmethod
     def reset_state(self) -> None:
         """Reset all modes to vacuum |0⟩."""
@@ -0,0 +1,110 @@
+from typing import Any, List, Tuple
+import numpy as np
+from .tracing import GateTape
+
+# Rotation gates R_G(θ) = exp(-iθG/2) and their Pauli generator G
+_ROTATION_GENERATORS = {"rx": "X", "ry": "Y", "rz": "Z"}
+
+# (qubit, Pauli generator, parameter index, d angle / d parameter)
+MetricEntry = Tuple[int, str, int, float]
+
+
+def metric_layers(tape: GateTape) -> List[Tuple[int, List[MetricEntry]]]:
+    """
+    Split a tape's parametrised rotations into layers for the
+    block-diagonal Fubini–Study metric.
+
+    A layer is a maximal run of consecutive parametrised rotations on
+    distinct qubits: they commute, so all their generators can be measured
+    on the state just before the run. Any fixed gate, or a second rotation
+    on a qubit already in the run, starts a new layer.
+
+    Returns:
+        [(index of the layer's first gate, entries), ...] in tape order.
+
+    Raises:
+        ValueError: A parametrised gate is not an rx/ry/rz rotation.
+    """
+    layers: List[Tuple[int, List[MetricEntry]]] = []
+    entries = None
+    used = set()
+    for g, (gate, qubits, names, start) in enumerate(
+        zip(tape.gates, tape.qubits, tape.param_names, tape.slot_start.tolist())
+    ):
+        traced = [s for s in range(start, start + len(names)) if tape.param_index[s] >= 0]
+        if not traced:
+            entries = None
+            continue
+        if gate not in _ROTATION_GENERATORS or len(traced) != 1:
+            raise ValueError(
+                f"No metric generator for parametrised gate '{gate}'. "
+                f"Supported: {sorted(_ROTATION_GENERATORS)}"
+            )
+        q = qubits[0]
+        if entries is None or q in used:
+            entries = []
+            used = set()
+            layers.append((g, entries))
+        used.add(q)
+        s = traced[0]
+        entries.append((q, _ROTATION_GENERATORS[gate], int(tape.param_index[s]), float(tape.coeff[s])))
+    return layers
+
+
+def _pauli_label(n: int, *terms: Tuple[int, str]) -> str:
+    # Little-endian: qubit q is character n-1-q
+    chars = ["I"] * n
+    for q, pauli in terms:
+        chars[n - 1 - q] = pauli
+    return "".join(chars)
+
+
+def accumulate_block(
+    metric: np.ndarray,
+    entries: List[MetricEntry],
+    means: np.ndarray,
+    products: np.ndarray,
+) -> None:
+    """
+    Add one layer's block to metric in place:
+
+        g_ab = (c_a c_b / 4) (⟨G_a G_b⟩ - ⟨G_a⟩⟨G_b⟩)
+
+    with means[a] = ⟨G_a⟩ and products[a, b] = ⟨G_a G_b⟩ on the state
+    before the layer. Parameters feeding several rotations accumulate.
+    """
+    index = np.array([e[2] for e in entries])
+    coeff = np.array([e[3] for e in entries])
+    block = (products - np.outer(means, means)) * np.outer(coeff, coeff) / 4
+    np.add.at(metric, (index[:, None], index[None, :]), block)
+
+
+def block_diagonal_metric(backend: Any, tape: GateTape, params: np.ndarray) -> np.ndarray:
+    """
+    Block-diagonal Fubini–Study metric from Pauli expectation values.
+
+    For every layer the tape prefix is executed once and the generators
+    and their pairwise products — single Pauli strings, since the qubits
+    differ — are measured in one backend.compute_expectations() call, so
+    a remote backend submits one job per layer.
+    """
+    params = np.asarray(params, dtype=float).reshape(-1)
+    n = tape.n_qubits
+    metric = np.zeros((params.size, params.size))
+    for first_gate, entries in metric_layers(tape):
+        backend.clear_circuit()
+        backend.reset_state()
+        tape.replay(backend, params, stop=first_gate)
+        backend.execute_circuit()
+
+        k = len(entries)
+        upper = np.triu_indices(k, 1)
+        labels = [_pauli_label(n, (q, p)) for q, p, _, _ in entries]
+        labels += [_pauli_label(n, entries[a][:2], entries[b][:2]) for a, b in zip(*upper)]
+        values = backend.compute_expectations([[(label, 1.0)] for label in labels])
+        means = values[:k]
+        products = np.eye(k)
+        products[upper] = values[k:]
+        products.T[upper] = values[k:]
+        accumulate_block(metric, entries, means, products)
+    return metric
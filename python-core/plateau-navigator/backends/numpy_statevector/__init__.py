@@ -0,0 +1,3 @@
+from .numpy_backend import NumpyStatevectorBackend
+
+__all__ = ["NumpyStatevectorBackend"]
\ No newline at end of file
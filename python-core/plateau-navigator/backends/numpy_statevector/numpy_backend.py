@@ -0,0 +1,598 @@
+import cmath
+import math
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from ..backend_interface import DVBackend
+from ..metric import accumulate_block, metric_layers
+from ..tracing import GateTape, TracedParameter, trace_parameters
+from ..qiskit_runtime.utils import pauly
+import numpy as np
+import scipy.sparse as sp
+
+# Same gate set as AerBackend._GATE_DISPATCH, mapped to local kernel names
+_GATE_DISPATCH: Dict[str, Tuple[str, int, List[str]]] = {
+    "h":       ("h",    1, []),
+    "x":       ("x",    1, []),
+    "y":       ("y",    1, []),
+    "z":       ("z",    1, []),
+    "s":       ("s",    1, []),
+    "t":       ("t",    1, []),
+    "rx":      ("rx",   1, ["theta"]),
+    "ry":      ("ry",   1, ["theta"]),
+    "rz":      ("rz",   1, ["phi"]),
+    "cx":      ("cx",   2, []),
+    "cnot":    ("cx",   2, []),
+    "cz":      ("cz",   2, []),
+    "swap":    ("swap", 2, []),
+    "ccx":     ("ccx",  3, []),
+    "toffoli": ("ccx",  3, []),
+}
+
+_PARAM_DEFAULTS = {"theta": 0.0, "phi": 0.0, "lam": 0.0}
+
+_SQRT1_2 = 1.0 / np.sqrt(2.0)
+
+_FIXED_MATRICES = {
+    "h": np.array([[_SQRT1_2, _SQRT1_2], [_SQRT1_2, -_SQRT1_2]], dtype=complex),
+    "y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+}
+
+_FIXED_PHASES = {
+    "z": -1.0 + 0j,
+    "s": 1j,
+    "t": np.exp(1j * np.pi / 4),
+}
+
+# Rotation gates R_G(θ) = exp(-iθG/2) and their Pauli generator G
+_GENERATORS = {"rx": "x", "ry": "y", "rz": "z"}
+
+# Upper bound on B · 2^n amplitudes held by one batched simulation (64 MiB)
+_BATCH_MAX_AMPLITUDES = 1 << 22
+
+
+@lru_cache(maxsize=None)
+def _index(n: int, fixed: Tuple[Tuple[int, int], ...]) -> Tuple[Any, ...]:
+    """
+    Index tuple selecting the sub-tensor where qubit q takes value v for
+    every (q, v) in fixed. Qubit q lives on axis n-1-q, counted from the
+    right, so the same index works with extra leading (batch) axes.
+    """
+    idx: List[Any] = [slice(None)] * n
+    for q, v in fixed:
+        idx[n - 1 - q] = v
+    return (Ellipsis, *idx)
+
+
+class NumpyStatevectorBackend(DVBackend):
+    """
+    Local DV backend with a pure-NumPy statevector engine.
+
+    The state lives in a preallocated complex tensor of shape (2,) * n and
+    gates are applied in place as contractions over the target axes —
+    no QuantumCircuit or Statevector objects are built per evaluation.
+    Buffers are allocated in create_circuit() and reused by every
+    subsequent execute_circuit(), which makes this the fastest backend
+    for the 4–14 qubit circuits used in plateau sweeps.
+
+    Qubit ordering follows Qiskit (qubit 0 is the least significant bit),
+    so statevectors, Pauli labels and Hamiltonians are interchangeable
+    with AerBackend.
+
+    Usage:
+        backend = NumpyStatevectorBackend()
+        backend.create_circuit(num_qubits=4)
+        backend.add_gate("ry", [0], theta=0.5)
+        backend.add_gate("cx", [0, 1])
+        backend.execute_circuit()
+        energy = backend.compute_expectation(hamiltonian)
+    """
+
+    def __init__(self):
+        self._num_qubits: int = 0
+        # (kernel, qubits, angle, source) — source is the TracedParameter
+        # the angle came from, or None for fixed angles
+        self._operations: List[Tuple[str, Tuple[int, ...], float, Optional[TracedParameter]]] = []
+        self._state: Optional[np.ndarray] = None
+        self._scratch: Optional[np.ndarray] = None
+        self._adjoint: Optional[np.ndarray] = None
+        self._mask_cache: Optional[Tuple[list, Tuple[np.ndarray, np.ndarray, np.ndarray]]] = None
+        # (tape, kernel per gate, angle slot per gate) for the last tape loaded
+        self._tape_cache: Optional[Tuple[GateTape, List[str], np.ndarray]] = None
+        # (ansatz, n_params, tape or None if not traceable) for batch mode
+        self._batch_tape: Optional[Tuple[Callable, int, Optional[GateTape]]] = None
+        self._executed: bool = False
+
+    @property
+    def name(self) -> str:
+        return "NumpyStatevectorBackend"
+
+    @property
+    def n_qubits(self) -> int:
+        return self._num_qubits
+
+    def create_circuit(self, num_qubits: int) -> Dict[str, Any]:
+        """Allocate the state and scratch buffers for num_qubits."""
+        if num_qubits < 1:
+            raise ValueError(f"num_qubits must be >= 1, got {num_qubits}.")
+        self._num_qubits = num_qubits
+        self._operations = []
+        self._state = np.zeros((2,) * num_qubits, dtype=complex)
+        self._scratch = np.zeros((2, 2 ** (num_qubits - 1)), dtype=complex)
+        self._adjoint = None
+        self._tape_cache = None
+        self._batch_tape = None
+        self._executed = False
+        return {
+            "status": "circuit_created",
+            "num_qubits": num_qubits,
+            "backend": self.name,
+        }
+
+    def add_gate(self, gate_type: str, qubits: List[int], **params) -> Dict[str, Any]:
+        if not self._num_qubits:
+            raise RuntimeError("Must call create_circuit() before adding gates.")
+        gate_key = gate_type.lower()
+        if gate_key not in _GATE_DISPATCH:
+            raise ValueError(
+                f"Gate '{gate_type}' not supported. "
+                f"Supported: {sorted(_GATE_DISPATCH.keys())}"
+            )
+        kernel, expected_n, param_names = _GATE_DISPATCH[gate_key]
+        if len(qubits) != expected_n:
+            raise ValueError(
+                f"Gate '{gate_type}' requires {expected_n} qubit(s), "
+                f"got {len(qubits)}."
+            )
+        if any(q < 0 or q >= self._num_qubits for q in qubits):
+            raise IndexError(
+                f"Qubit indices {qubits} out of range for "
+                f"{self._num_qubits}-qubit circuit."
+            )
+        if len(set(qubits)) != len(qubits):
+            raise ValueError(f"Gate '{gate_type}' got repeated qubits {qubits}.")
+        angle, source = 0.0, None
+        if param_names:
+            p = param_names[0]
+            value = params.get(p, _PARAM_DEFAULTS.get(p, 0.0))
+            angle = float(value)
+            if isinstance(value, TracedParameter):
+                source = value
+        self._operations.append((kernel, tuple(qubits), angle, source))
+        return {"status": "gate_queued", "gate_type": gate_type, "qubits": qubits}
+
+    def load_tape(self, tape: GateTape, params: np.ndarray) -> None:
+        """
+        Append a compiled tape's gates with angles bound to params.
+
+        Gate names are resolved to kernels once per tape; each call only
+        evaluates the tape's affine angles and extends the op queue.
+        """
+        if not self._num_qubits:
+            raise RuntimeError("Must call create_circuit() before adding gates.")
+        kernels, slots = self._tape_kernels(tape)
+        angles = np.append(tape.angles(params), 0.0)[slots].tolist()
+        self._operations.extend(zip(kernels, tape.qubits, angles, repeat(None)))
+
+    def _tape_kernels(self, tape: GateTape) -> Tuple[List[str], np.ndarray]:
+        if self._tape_cache is None or self._tape_cache[0] is not tape:
+            self._tape_cache = (tape, *self._resolve_tape(tape))
+        return self._tape_cache[1], self._tape_cache[2]
+
+    def _resolve_tape(self, tape: GateTape) -> Tuple[List[str], np.ndarray]:
+        """
+        Kernel name and angle slot of every tape gate. Gates whose angle
+        argument was not passed read slot -1, the 0.0 appended by
+        load_tape(), matching the add_gate() default.
+        """
+        if tape.n_qubits != self._num_qubits:
+            raise ValueError(
+                f"Tape was compiled for {tape.n_qubits} qubits, "
+                f"circuit has {self._num_qubits}."
+            )
+        kernels, slots = [], []
+        for gate, names, start in zip(tape.gates, tape.param_names, tape.slot_start.tolist()):
+            if gate not in _GATE_DISPATCH:
+                raise ValueError(
+                    f"Gate '{gate}' not supported. "
+                    f"Supported: {sorted(_GATE_DISPATCH.keys())}"
+                )
+            kernel, _, param_names = _GATE_DISPATCH[gate]
+            kernels.append(kernel)
+            if param_names and param_names[0] in names:
+                slots.append(start + names.index(param_names[0]))
+            else:
+                slots.append(-1)
+        return kernels, np.array(slots, dtype=np.int64)
+
+    def execute_circuit(self) -> Dict[str, Any]:
+        """
+        Reset the state buffer to |0...0⟩ in place and apply the op queue.
+        """
+        if not self._num_qubits:
+            raise RuntimeError("No circuit. Call create_circuit() first.")
+        psi = self._state
+        with self.profiler.phase("numpy.simulate"):
+            psi.fill(0.0)
+            psi.flat[0] = 1.0
+            for kernel, qubits, angle, _ in self._operations:
+                self._apply(psi, kernel, qubits, angle)
+        self._executed = True
+        return {
+            "status": "completed",
+            "backend": self.name,
+            "num_qubits": self._num_qubits,
+            "num_gates": len(self._operations),
+        }
+
+    def compute_expectation(
+        self,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
+    ) -> float:
+        """
+        Exact ⟨ψ|H|ψ⟩ from the state buffer.
+
+        Args:
+            observable: Hermitian np.ndarray or scipy.sparse matrix of shape
+                        (2^n, 2^n), evaluated as a matvec, or Pauli list
+                        [(pauli_str, coeff)] evaluated from bit-flip and
+                        phase masks.
+        """
+        self._require_state()
+        psi = self._state.reshape(-1)
+        if isinstance(observable, list):
+            masks = self._get_pauli_masks(observable)
+            with self.profiler.phase("numpy.expectation"):
+                return pauly._pauli_expectation(psi, *masks)
+        if not isinstance(observable, np.ndarray) and not sp.issparse(observable):
+            raise TypeError(
+                f"observable must be np.ndarray, scipy.sparse matrix or "
+                f"List[Tuple[str, complex]], got {type(observable)}."
+            )
+        if observable.shape != (psi.size, psi.size):
+            raise ValueError(
+                f"Observable shape {observable.shape} does not match "
+                f"{self._num_qubits}-qubit state."
+            )
+        with self.profiler.phase("numpy.expectation"):
+            return float(np.vdot(psi, observable @ psi).real)
+
+    def _get_pauli_masks(
+        self,
+        pauli_terms: List[Tuple[str, complex]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Holding the list keeps its id from being recycled
+        if self._mask_cache is None or self._mask_cache[0] is not pauli_terms:
+            with self.profiler.phase("numpy.pauli_masks"):
+                masks = pauly._labels_to_masks(pauli_terms)
+            if len(pauli_terms[0][0]) != self._num_qubits:
+                raise ValueError(
+                    f"Pauli strings have length {len(pauli_terms[0][0])}, "
+                    f"expected {self._num_qubits}."
+                )
+            self._mask_cache = (pauli_terms, masks)
+        return self._mask_cache[1]
+
+    def _apply_observable(
+        self,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]],
+        psi: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """out ← H psi, for a dense or sparse matrix or a Pauli list."""
+        if isinstance(observable, list):
+            masks = self._get_pauli_masks(observable)
+            out.reshape(-1)[:] = pauly._pauli_apply(psi.reshape(-1), *masks)
+            return
+        if not isinstance(observable, np.ndarray) and not sp.issparse(observable):
+            raise TypeError(
+                f"observable must be np.ndarray, scipy.sparse matrix or "
+                f"List[Tuple[str, complex]], got {type(observable)}."
+            )
+        dim = psi.size
+        if observable.shape != (dim, dim):
+            raise ValueError(
+                f"Observable shape {observable.shape} does not match "
+                f"{self._num_qubits}-qubit state."
+            )
+        if sp.issparse(observable):
+            out.reshape(-1)[:] = observable @ psi.reshape(-1)
+        else:
+            np.matmul(observable, psi.reshape(-1), out=out.reshape(-1))
+
+    def batch_expectation(
+        self,
+        param_sets: np.ndarray,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]],
+        ansatz: Callable,
+    ) -> np.ndarray:
+        """
+        Simulate every row of param_sets at once on a (B, 2^n) state stack.
+
+        The ansatz is compiled to a GateTape (or used as is if it already
+        is one). Rotations with a traced angle are applied with per-row
+        angles in one vectorised operation; every other gate is applied
+        once across the whole batch. Energies for all rows come from one
+        batched observable evaluation. Ansätze that cannot be traced fall
+        back to one simulation per row.
+
+        Rows are processed in chunks of at most _BATCH_MAX_AMPLITUDES
+        amplitudes. The op queue and state are left cleared afterwards.
+        """
+        if not self._num_qubits:
+            raise RuntimeError("No circuit. Call create_circuit() first.")
+        param_sets = np.asarray(param_sets, dtype=float)
+        if not len(param_sets):
+            return np.empty(0)
+        tape = self._compile_for_batch(ansatz, param_sets[0])
+        if tape is None:
+            return super().batch_expectation(param_sets, observable, ansatz)
+        rows = max(1, _BATCH_MAX_AMPLITUDES >> self._num_qubits)
+        energies = np.empty(len(param_sets))
+        for start in range(0, len(param_sets), rows):
+            with self.profiler.phase("numpy.simulate_batch"):
+                states = self._simulate_batch(tape, param_sets[start:start + rows])
+            with self.profiler.phase("numpy.expectation_batch"):
+                energies[start:start + rows] = self._batch_energies(states, observable)
+        self.reset_state()
+        return energies
+
+    def _compile_for_batch(self, ansatz: Callable, params: np.ndarray) -> Optional[GateTape]:
+        if isinstance(ansatz, GateTape):
+            return ansatz
+        cached = self._batch_tape
+        if cached is None or cached[0] is not ansatz or cached[1] != params.size:
+            try:
+                with self.profiler.phase("numpy.compile"):
+                    tape = self.compile_ansatz(ansatz, params)
+            except (TypeError, ValueError):
+                # Not affine in the parameters — simulate row by row
+                tape = None
+            self._batch_tape = cached = (ansatz, params.size, tape)
+        return cached[2]
+
+    def _simulate_batch(self, tape: GateTape, param_sets: np.ndarray) -> np.ndarray:
+        """Final statevectors for every row of param_sets, shape (B, 2^n)."""
+        n = self._num_qubits
+        B = len(param_sets)
+        kernels, slots = self._tape_kernels(tape)
+        # (G, B): angle of every gate for every row; slot -1 reads 0.0
+        angles = np.concatenate(
+            [tape.batch_angles(param_sets), np.zeros((B, 1))], axis=1
+        )[:, slots].T.copy()
+        traced = np.append(tape.param_index, -1)[slots] >= 0
+        if self._scratch.shape[1] < B << (n - 1):
+            self._scratch = np.zeros((2, B << (n - 1)), dtype=complex)
+        psi = np.zeros((B,) + (2,) * n, dtype=complex)
+        psi[(slice(None),) + (0,) * n] = 1.0
+        for kernel, qubits, row_angles, per_row in zip(kernels, tape.qubits, angles, traced):
+            if per_row and kernel in _GENERATORS:
+                self._apply_rotation_batch(psi, kernel, qubits[0], row_angles)
+            else:
+                self._apply(psi, kernel, qubits, float(row_angles[0]))
+        return psi.reshape(B, -1)
+
+    def _batch_energies(
+        self,
+        states: np.ndarray,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]],
+    ) -> np.ndarray:
+        """⟨ψ_k|H|ψ_k⟩ for every row ψ_k of states, shape (B, 2^n)."""
+        if isinstance(observable, list):
+            return pauly._pauli_expectation(states, *self._get_pauli_masks(observable))
+        if not isinstance(observable, np.ndarray) and not sp.issparse(observable):
+            raise TypeError(
+                f"observable must be np.ndarray, scipy.sparse matrix or "
+                f"List[Tuple[str, complex]], got {type(observable)}."
+            )
+        dim = states.shape[1]
+        if observable.shape != (dim, dim):
+            raise ValueError(
+                f"Observable shape {observable.shape} does not match "
+                f"{self._num_qubits}-qubit state."
+            )
+        if sp.issparse(observable):
+            h_states = (observable @ states.T).T
+        else:
+            h_states = states @ observable.T
+        return np.einsum("ki,ki->k", states.conj(), h_states).real
+
+    def adjoint_gradient(
+        self,
+        params: np.ndarray,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]],
+        ansatz: Callable,
+    ) -> Tuple[float, np.ndarray]:
+        """
+        Energy and full gradient from one forward and one backward pass.
+
+        The ansatz is run on TracedParameter angles so every rotation on the
+        tape knows which parameter it came from. Walking the tape backwards
+        with ψ_k (state after gate k) and λ_k = U_{k+1}†…U_N† H ψ_N:
+
+            ∂E/∂angle_k = 2 Re⟨λ_k| ∂U_k |ψ_{k-1}⟩ = Im⟨λ_k| G_k |ψ_k⟩
+
+        then ψ and λ are both stepped back through U_k†. Cost is O(G) gate
+        applications plus one H application, independent of P.
+        """
+        params = np.asarray(params, dtype=float)
+        self.reset_state()
+        with self.profiler.phase("numpy.trace"):
+            ansatz(self, trace_parameters(params))
+        self.execute_circuit()
+        if self._adjoint is None:
+            self._adjoint = np.zeros((2,) + self._state.shape, dtype=complex)
+        psi = self._state
+        lam, mu = self._adjoint[0], self._adjoint[1]
+        self._apply_observable(observable, psi, lam)
+        energy = float(np.vdot(psi, lam).real)
+        gradients = np.zeros(params.size)
+        with self.profiler.phase("numpy.adjoint_backward"):
+            for kernel, qubits, angle, source in reversed(self._operations):
+                if source is not None and kernel in _GENERATORS:
+                    np.copyto(mu, psi)
+                    self._apply(mu, _GENERATORS[kernel], qubits, 0.0)
+                    gradients[source.index] += source.coeff * np.vdot(lam, mu).imag
+                self._apply_inverse(psi, kernel, qubits, angle)
+                self._apply_inverse(lam, kernel, qubits, angle)
+        # The state buffer has been rolled back to |0...0⟩
+        self.reset_state()
+        return energy, gradients.reshape(params.shape)
+
+    def metric_tensor(self, params: np.ndarray, ansatz: Callable) -> np.ndarray:
+        """
+        Block-diagonal Fubini–Study metric from one forward pass.
+
+        At the start of every layer, each generator is applied to a copy of
+        the current state, v_a = G_a ψ, and the block follows from inner
+        products: ⟨G_a⟩ = Re⟨ψ|v_a⟩, ⟨G_a G_b⟩ = Re⟨v_a|v_b⟩.
+        """
+        params = np.asarray(params, dtype=float)
+        tape = ansatz if isinstance(ansatz, GateTape) else self.compile_ansatz(ansatz, params)
+        with self.profiler.phase("numpy.metric"):
+            return self._metric_blocks(tape, params)
+
+    def _metric_blocks(self, tape: GateTape, params: np.ndarray) -> np.ndarray:
+        layers = metric_layers(tape)
+        kernels, slots = self._tape_kernels(tape)
+        angles = np.append(tape.angles(params), 0.0)[slots].tolist()
+        metric = np.zeros((params.size, params.size))
+        psi = self._state
+        psi.fill(0.0)
+        psi.flat[0] = 1.0
+        g = 0
+        for first_gate, entries in layers:
+            for kernel, qubits, angle in zip(kernels[g:first_gate], tape.qubits[g:first_gate], angles[g:first_gate]):
+                self._apply(psi, kernel, qubits, angle)
+            g = first_gate
+            vectors = np.empty((len(entries), psi.size), dtype=complex)
+            for a, (q, pauli, _, _) in enumerate(entries):
+                v = vectors[a].reshape(psi.shape)
+                np.copyto(v, psi)
+                self._apply(v, pauli.lower(), (q,), 0.0)
+            means = (vectors @ psi.reshape(-1).conj()).real
+            products = (vectors.conj() @ vectors.T).real
+            accumulate_block(metric, entries, means, products)
+        # The state buffer no longer matches the op queue
+        self.reset_state()
+        return metric
+
+    def get_state_vector(self) -> np.ndarray:
+        self._require_state()
+        return self._state.reshape(-1).copy()
+
+    def get_probabilities(self) -> np.ndarray:
+        sv = self.get_state_vector()
+        return np.abs(sv) ** 2
+
+    def reset_state(self) -> None:
+        """Reset to |0...0⟩. Clears op queue and invalidates the state."""
+        self._operations = []
+        self._executed = False
+
+    def clear_circuit(self) -> None:
+        """Clear op queue only. State from last execution remains."""
+        self._operations = []
+
+    def _require_state(self) -> None:
+        if not self._executed:
+            raise RuntimeError("No statevector. Call execute_circuit() first.")
+
+    # ── Gate kernels ──────────────────────────────────────────────────
+
+    def _apply(self, psi: np.ndarray, kernel: str, qubits: Tuple[int, ...], angle: float) -> None:
+        """Apply one gate to psi in place."""
+        n = self._num_qubits
+        if kernel == "x":
+            self._swap(psi[_index(n, ((qubits[0], 0),))], psi[_index(n, ((qubits[0], 1),))])
+        elif kernel in _FIXED_PHASES:
+            psi[_index(n, ((qubits[0], 1),))] *= _FIXED_PHASES[kernel]
+        elif kernel == "rz":
+            psi[_index(n, ((qubits[0], 0),))] *= cmath.exp(-0.5j * angle)
+            psi[_index(n, ((qubits[0], 1),))] *= cmath.exp(0.5j * angle)
+        elif kernel in _FIXED_MATRICES:
+            self._apply_matrix(psi, qubits[0], _FIXED_MATRICES[kernel])
+        elif kernel == "rx":
+            c, s = math.cos(angle / 2), math.sin(angle / 2)
+            self._apply_matrix(psi, qubits[0], np.array([[c, -1j * s], [-1j * s, c]]))
+        elif kernel == "ry":
+            c, s = math.cos(angle / 2), math.sin(angle / 2)
+            self._apply_matrix(psi, qubits[0], np.array([[c, -s], [s, c]], dtype=complex))
+        elif kernel == "cx":
+            c, t = qubits
+            self._swap(psi[_index(n, ((c, 1), (t, 0)))], psi[_index(n, ((c, 1), (t, 1)))])
+        elif kernel == "cz":
+            psi[_index(n, ((qubits[0], 1), (qubits[1], 1)))] *= -1.0
+        elif kernel == "swap":
+            a, b = qubits
+            self._swap(psi[_index(n, ((a, 0), (b, 1)))], psi[_index(n, ((a, 1), (b, 0)))])
+        elif kernel == "ccx":
+            c1, c2, t = qubits
+            self._swap(
+                psi[_index(n, ((c1, 1), (c2, 1), (t, 0)))],
+                psi[_index(n, ((c1, 1), (c2, 1), (t, 1)))],
+            )
+        else:
+            raise ValueError(f"No kernel for gate '{kernel}'.")
+
+    def _apply_rotation_batch(
+        self, psi: np.ndarray, kernel: str, q: int, angles: np.ndarray
+    ) -> None:
+        """
+        Rotation on qubit q with one angle per batch row, in place.
+        psi has shape (B,) + (2,) * n and angles shape (B,).
+        """
+        n = self._num_qubits
+        a = angles.reshape((-1,) + (1,) * (n - 1))
+        if kernel == "rz":
+            psi[_index(n, ((q, 0),))] *= np.exp(-0.5j * a)
+            psi[_index(n, ((q, 1),))] *= np.exp(0.5j * a)
+            return
+        c, s = np.cos(a / 2), np.sin(a / 2)
+        if kernel == "rx":
+            m = np.array([[c, -1j * s], [-1j * s, c]])
+        else:
+            m = np.array([[c, -s], [s, c]], dtype=complex)
+        self._apply_matrix(psi, q, m)
+
+    def _apply_inverse(self, psi: np.ndarray, kernel: str, qubits: Tuple[int, ...], angle: float) -> None:
+        """Apply the adjoint of one gate to psi in place."""
+        if kernel in ("rx", "ry", "rz"):
+            self._apply(psi, kernel, qubits, -angle)
+        elif kernel in ("s", "t"):
+            n = self._num_qubits
+            psi[_index(n, ((qubits[0], 1),))] *= np.conj(_FIXED_PHASES[kernel])
+        else:
+            # Remaining gates are Hermitian and self-inverse
+            self._apply(psi, kernel, qubits, angle)
+
+    def _scratch_like(self, k: int, view: np.ndarray) -> np.ndarray:
+        return self._scratch[k, :view.size].reshape(view.shape)
+
+    def _swap(self, a: np.ndarray, b: np.ndarray) -> None:
+        tmp = self._scratch_like(0, a)
+        np.copyto(tmp, a)
+        np.copyto(a, b)
+        np.copyto(b, tmp)
+
+    def _apply_matrix(self, psi: np.ndarray, q: int, m: np.ndarray) -> None:
+        """
+        In-place 2x2 contraction on qubit q:
+            a0' = m00·a0 + m01·a1
+            a1' = m10·a0 + m11·a1
+
+        m may carry trailing axes that broadcast against the batch axis,
+        giving one matrix per batch row.
+        """
+        n = self._num_qubits
+        a0 = psi[_index(n, ((q, 0),))]
+        a1 = psi[_index(n, ((q, 1),))]
+        old_a0 = self._scratch_like(0, a0)
+        tmp = self._scratch_like(1, a0)
+        np.copyto(old_a0, a0)
+        a0 *= m[0, 0]
+        np.multiply(a1, m[0, 1], out=tmp)
+        a0 += tmp
+        a1 *= m[1, 1]
+        np.multiply(old_a0, m[1, 0], out=tmp)
+        a1 += tmp
@@ -0,0 +1,27 @@
+from contextlib import nullcontext
+
+
+class NullProfiler:
+    """
+    Default profiler of backends and of VQEs built without profile=True:
+    instrumented phases cost one method call. VQE(profile=True) uses a
+    vqe.profiling.Profiler (same phase() / count() / reset() interface)
+    and lends it to the backend for the duration of a run.
+    """
+
+    enabled = False
+
+    def __init__(self):
+        self._null = nullcontext()
+
+    def phase(self, name: str):
+        return self._null
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def reset(self) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
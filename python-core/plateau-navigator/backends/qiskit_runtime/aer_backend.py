@@ -1,11 +1,14 @@
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from ..backend_interface import DVBackend
+from ..numpy_statevector.numpy_backend import NumpyStatevectorBackend
+from ..tracing import GateTape
 import numpy as np
+import scipy.sparse as sp
 from qiskit import QuantumCircuit
-from qiskit.primitives import StatevectorEstimator
-from qiskit.quantum_info import SparsePauliOp, Statevector
-from utils import pauly
+from qiskit.circuit import ParameterVector
+from qiskit.quantum_info import Statevector
+from .utils import pauli_cache, pauly
 
 _GATE_DISPATCH: Dict[str, Tuple[str, int, List[str]]] = {
     "h":       ("h",    1, []),
@@ -35,8 +38,9 @@ class AerBackend(DVBackend):
     with zero shot noise. This is the correct DV counterpart to
     StrawberryFieldsBackend for barren plateau comparison studies.
 
-    Uses StatevectorEstimator (qiskit.primitives) which computes ⟨ψ|H|ψ⟩
-    exactly from the full statevector, bypassing shot sampling entirely.
+    ⟨ψ|H|ψ⟩ is evaluated exactly on the statevector cached by
+    execute_circuit(), term by term from Pauli bit masks — the circuit is
+    simulated once per evaluation and shot sampling is bypassed entirely.
 
     For hardware validation of findings, use QiskitBackend (IBM Runtime).
 
@@ -52,18 +56,25 @@ class AerBackend(DVBackend):
     def __init__(self, seed: Optional[int] = None):
         """
         Args:
-            seed: Random seed for reproducibility across experiments.
-                  Fix this per-experiment to ensure comparable initial
-                  conditions between DV and CV runs.
+            seed: Accepted for API compatibility and shown in name, but
+                  ignored: expectations are computed exactly on the
+                  statevector without sampling, so results are
+                  deterministic. Seed the optimizer and the initial
+                  parameters to make DV and CV runs comparable.
         """
         self.seed = seed
         self._num_qubits: int = 0
         self._operations: List[Dict[str, Any]] = []
         self._circuit: Optional[QuantumCircuit] = None
         self._last_statevector: Optional[np.ndarray] = None
-        self._estimator = StatevectorEstimator(seed=seed)
-        self._pauli_cache: Optional[List[Tuple[str, complex]]] = None
-        self._cached_observable_id: Optional[int] = None
+        # (terms list, masks) — the list is held so its id stays unique
+        self._mask_cache: Optional[Tuple[list, Tuple[np.ndarray, np.ndarray, np.ndarray]]] = None
+        # NumPy kernels for batch mode and adjoint differentiation
+        self._engine: Optional[NumpyStatevectorBackend] = None
+        # (tape, parameterized template, tape slot feeding each Parameter)
+        self._tape_cache: Optional[Tuple[GateTape, QuantumCircuit, np.ndarray]] = None
+        # Bound circuit from load_tape(); queued gates are appended after it
+        self._tape_circuit: Optional[QuantumCircuit] = None
 
     @property
     def name(self) -> str:
@@ -79,6 +90,8 @@ class AerBackend(DVBackend):
         self._num_qubits = num_qubits
         self._operations = []
         self._circuit = None
+        self._tape_circuit = None
+        self._tape_cache = None
         self._last_statevector = None
         return {
             "status": "circuit_created",
@@ -113,6 +126,59 @@ class AerBackend(DVBackend):
         })
         return {"status": "gate_queued", "gate_type": gate_type, "qubits": qubits}
 
+    def load_tape(self, tape: GateTape, params: np.ndarray) -> None:
+        """
+        Bind params into a QuantumCircuit template built once per tape.
+
+        The template holds one qiskit Parameter per traced angle, so each
+        call is a single assign_parameters() with no gate dispatch or
+        validation. Gates already queued keep their order by falling back
+        to add_gate().
+        """
+        if not self._num_qubits:
+            raise RuntimeError("Must call create_circuit() before adding gates.")
+        if self._operations or self._tape_circuit is not None:
+            super().load_tape(tape, params)
+            return
+        if self._tape_cache is None or self._tape_cache[0] is not tape:
+            self._tape_cache = (tape, *self._build_template(tape))
+        _, template, slots = self._tape_cache
+        if len(slots):
+            self._tape_circuit = template.assign_parameters(tape.angles(params)[slots])
+        else:
+            self._tape_circuit = template
+
+    def _build_template(self, tape: GateTape) -> Tuple[QuantumCircuit, np.ndarray]:
+        if tape.n_qubits != self._num_qubits:
+            raise ValueError(
+                f"Tape was compiled for {tape.n_qubits} qubits, "
+                f"circuit has {self._num_qubits}."
+            )
+        # First pass: resolve every gate argument to a constant or a slot
+        gates, traced = [], []
+        for gate, qubits, names, start in zip(
+            tape.gates, tape.qubits, tape.param_names, tape.slot_start.tolist()
+        ):
+            method_name, _, param_names = _GATE_DISPATCH[gate]
+            args = []
+            for p in param_names:
+                if p not in names:
+                    args.append(_PARAM_DEFAULTS.get(p, 0.0))
+                    continue
+                slot = start + names.index(p)
+                if tape.param_index[slot] >= 0:
+                    args.append(len(traced))
+                    traced.append(slot)
+                else:
+                    args.append(float(tape.offset[slot]))
+            gates.append((method_name, args, qubits))
+        theta = ParameterVector("theta", len(traced))
+        qc = QuantumCircuit(self._num_qubits)
+        for method_name, args, qubits in gates:
+            resolved_params = [theta[a] if isinstance(a, int) else a for a in args]
+            getattr(qc, method_name)(*resolved_params, *qubits)
+        return qc, np.array(traced, dtype=np.int64)
+
     def execute_circuit(self) -> Dict[str, Any]:
         """
         Build the QuantumCircuit from the op queue and compute the statevector.
@@ -121,60 +187,135 @@ class AerBackend(DVBackend):
         """
         if not self._num_qubits:
             raise RuntimeError("No circuit. Call create_circuit() first.")
-        self._circuit = self._build_circuit()
-        sv = Statevector(self._circuit)
-        self._last_statevector = np.array(sv.data)
+        with self.profiler.phase("aer.build_circuit"):
+            self._circuit = self._build_circuit()
+        with self.profiler.phase("aer.simulate"):
+            sv = Statevector(self._circuit)
+            self._last_statevector = np.array(sv.data)
         return {
             "status": "completed",
             "backend": self.name,
             "num_qubits": self._num_qubits,
-            "num_gates": len(self._operations),
+            "num_gates": self._circuit.size(),
         }
 
     def compute_expectation(
         self,
-        observable: Union[np.ndarray, List[Tuple[str, complex]]]
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
     ) -> float:
         """
-        Compute exact ⟨ψ|H|ψ⟩ via StatevectorEstimator.
+        Compute exact ⟨ψ|H|ψ⟩ from the cached statevector.
 
-        No shot noise. No sampling. The result is the true mathematical
-        expectation value of H in state |ψ⟩.
+        No shot noise. No sampling. No second simulation. The result is the
+        true mathematical expectation value of H in state |ψ⟩.
 
         Args:
             observable: Hermitian np.ndarray of shape (2^n, 2^n), or
                         pre-decomposed Pauli list [(pauli_str, coeff), ...].
                         Pass pre-decomposed terms to skip recomputation
-                        across VQE iterations.
-        """
-        if self._circuit is None:
-            raise RuntimeError("No circuit ready. Call execute_circuit() first.")
-        pauli_terms = self._get_pauli_terms(observable)
-        sparse_op = SparsePauliOp.from_list(
-            [(label, coeff) for label, coeff in pauli_terms]
-        )
-        pub = (self._circuit, sparse_op)
-        result = self._estimator.run([pub]).result()
-        return float(result[0].data.evs)
+                        across VQE iterations. A scipy.sparse matrix is
+                        applied directly (O(nnz)) with no decomposition.
+        """
+        if self._last_statevector is None:
+            raise RuntimeError("No statevector. Call execute_circuit() first.")
+        if sp.issparse(observable):
+            psi = self._last_statevector
+            with self.profiler.phase("aer.expectation"):
+                return float(np.vdot(psi, observable @ psi).real)
+        x_masks, z_masks, coeffs = self._get_pauli_masks(observable)
+        with self.profiler.phase("aer.expectation"):
+            return pauly._pauli_expectation(self._last_statevector, x_masks, z_masks, coeffs)
+
+    def batch_expectation(
+        self,
+        param_sets: np.ndarray,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]],
+        ansatz: Callable,
+    ) -> np.ndarray:
+        """
+        Evaluate ⟨ψ(θ)|H|ψ(θ)⟩ for every row of param_sets in batch mode.
+
+        Building one QuantumCircuit and Statevector per row dominates
+        sweep and gradient cost, so the batch is simulated as a (B, 2^n)
+        state stack on the NumPy statevector kernels (same gate
+        definitions and qubit ordering), with per-row rotation angles
+        applied in single vectorised operations.
+
+        The op queue and statevector are left cleared afterwards.
+        """
+        if not self._num_qubits:
+            raise RuntimeError("No circuit. Call create_circuit() first.")
+        self.reset_state()
+        return self._statevector_engine().batch_expectation(param_sets, observable, ansatz)
+
+    def adjoint_gradient(
+        self,
+        params: np.ndarray,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]],
+        ansatz: Callable,
+    ) -> Tuple[float, np.ndarray]:
+        """
+        Adjoint-differentiation gradient (see DVBackend.adjoint_gradient).
+
+        Qiskit's Statevector cannot step backwards through a circuit in
+        place, so the tape is replayed on the NumPy statevector kernels,
+        which follow the same gate definitions and qubit ordering.
+        """
+        if not self._num_qubits:
+            raise RuntimeError("No circuit. Call create_circuit() first.")
+        return self._statevector_engine().adjoint_gradient(params, observable, ansatz)
+
+    def metric_tensor(self, params: np.ndarray, ansatz: Callable) -> np.ndarray:
+        """Block-diagonal metric (see DVBackend.metric_tensor) on the NumPy engine."""
+        if not self._num_qubits:
+            raise RuntimeError("No circuit. Call create_circuit() first.")
+        return self._statevector_engine().metric_tensor(params, ansatz)
+
+    def _statevector_engine(self) -> NumpyStatevectorBackend:
+        """NumPy engine sized to this circuit, created on first use."""
+        engine = self._engine
+        if engine is None or engine.n_qubits != self._num_qubits:
+            engine = NumpyStatevectorBackend()
+            engine.create_circuit(self._num_qubits)
+            self._engine = engine
+        # Engine phases report to whichever profiler this backend has now
+        engine.profiler = self.profiler
+        return engine
+
+    def prepare_observable(
+        self,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
+    ) -> Union[sp.spmatrix, List[Tuple[str, complex]]]:
+        """Dense matrices as Pauli terms; sparse matrices are applied directly."""
+        if sp.issparse(observable):
+            return observable
+        return self._get_pauli_terms(observable)
+
+    def _get_pauli_masks(
+        self,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if not isinstance(observable, list):
+            with self.profiler.phase("aer.pauli_decomposition"):
+                return pauli_cache.get_pauli_masks(observable)
+        if self._mask_cache is None or self._mask_cache[0] is not observable:
+            with self.profiler.phase("aer.pauli_masks"):
+                self._mask_cache = (observable, pauly._labels_to_masks(observable))
+        return self._mask_cache[1]
 
     def _get_pauli_terms(
         self,
-        observable: Union[np.ndarray, List[Tuple[str, complex]]]
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
     ) -> List[Tuple[str, complex]]:
         if isinstance(observable, list):
             return observable
-        if not isinstance(observable, np.ndarray):
+        if not isinstance(observable, np.ndarray) and not sp.issparse(observable):
             raise TypeError(
-                f"observable must be np.ndarray or List[Tuple[str, complex]], "
-                f"got {type(observable)}."
+                f"observable must be np.ndarray, scipy.sparse matrix or "
+                f"List[Tuple[str, complex]], got {type(observable)}."
             )
-        obs_id = id(observable)
-        if obs_id != self._cached_observable_id or self._pauli_cache is None:
-            if not np.allclose(observable, observable.conj().T, atol=1e-10):
-                raise ValueError("Observable must be Hermitian (H = H†).")
-            self._pauli_cache = pauly._pauli_decompose(observable)
-            self._cached_observable_id = obs_id
-        return self._pauli_cache
+        with self.profiler.phase("aer.pauli_decomposition"):
+            return pauli_cache.get_pauli_terms(observable)
 
     def get_state_vector(self) -> np.ndarray:
         """
@@ -198,16 +339,23 @@ class AerBackend(DVBackend):
         """Reset to |0...0⟩. Clears op queue, circuit, and statevector."""
         self._operations = []
         self._circuit = None
+        self._tape_circuit = None
         self._last_statevector = None
 
     def clear_circuit(self) -> None:
         """Clear op queue only. Statevector from last execution remains."""
         self._operations = []
         self._circuit = None
+        self._tape_circuit = None
 
     def _build_circuit(self) -> QuantumCircuit:
-        """Construct a QuantumCircuit from the queued operations."""
-        qc = QuantumCircuit(self._num_qubits)
+        """Construct a QuantumCircuit from the loaded tape and queued operations."""
+        if self._tape_circuit is not None:
+            if not self._operations:
+                return self._tape_circuit
+            qc = self._tape_circuit.copy()
+        else:
+            qc = QuantumCircuit(self._num_qubits)
         for op in self._operations:
             method_name, _, param_names = _GATE_DISPATCH[op["gate_type"]]
             method = getattr(qc, method_name)
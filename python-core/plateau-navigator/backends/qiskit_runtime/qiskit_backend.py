@@ -1,9 +1,11 @@
-from .utils import serialize_qasm, pauly
+from .utils import serialize_qasm, pauli_cache
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from .qiskit_api import QiskitRuntimeAPI
 from ..backend_interface import DVBackend 
+from ..tracing import GateTape
 import numpy as np
+import scipy.sparse as sp
 
 
 class QiskitBackend(DVBackend):
@@ -58,10 +60,6 @@ class QiskitBackend(DVBackend):
         self._current_qasm: Optional[str] = None
         self._last_result: Optional[Dict[str, Any]] = None
         self._session_id: Optional[str] = None
-        # Cache Pauli decomposition — recomputed only when observable changes,
-        # not on every VQE iteration
-        self._pauli_cache: Optional[List[Tuple[str, complex]]] = None
-        self._cached_observable_id: Optional[int] = None
         self._verify_backend()
 
     def __enter__(self) -> "QiskitBackend":
@@ -130,6 +128,33 @@ class QiskitBackend(DVBackend):
         })
         return {"status": "gate_queued", "gate_type": gate_type, "qubits": qubits}
 
+    def load_tape(self, tape: GateTape, params: np.ndarray) -> None:
+        """
+        Append a compiled tape's gates with angles bound to params.
+
+        The tape was validated against this backend when it was compiled,
+        so ops are queued directly — no per-gate lookup or range checks
+        while building the circuits of a batched Estimator job.
+        """
+        if not self._num_qubits:
+            raise RuntimeError("Must call create_circuit() before adding gates.")
+        if tape.n_qubits != self._num_qubits:
+            raise ValueError(
+                f"Tape was compiled for {tape.n_qubits} qubits, "
+                f"circuit has {self._num_qubits}."
+            )
+        values = tape.angles(params).tolist()
+        self._operations.extend(
+            {
+                "gate_type": gate,
+                "qubits": list(qubits),
+                "params": dict(zip(names, values[start:start + len(names)])),
+            }
+            for gate, qubits, names, start in zip(
+                tape.gates, tape.qubits, tape.param_names, tape.slot_start.tolist()
+            )
+        )
+
     def execute_circuit(self) -> Dict[str, Any]:
         """
         Build QASM from op queue and submit as an Estimator job.
@@ -140,7 +165,8 @@ class QiskitBackend(DVBackend):
         """
         if not self._num_qubits:
             raise RuntimeError("No circuit. Call create_circuit() first.")
-        self._current_qasm = serialize_qasm._build_qasm(self._num_qubits, self._operations)
+        with self.profiler.phase("qiskit.build_qasm"):
+            self._current_qasm = serialize_qasm._build_qasm(self._num_qubits, self._operations)
         return {
             "status": "circuit_ready",
             "backend": self._backend_name,
@@ -150,59 +176,149 @@ class QiskitBackend(DVBackend):
 
     def compute_expectation(
         self,
-        observable: Union[np.ndarray, List[Tuple[str, complex]]]
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
     ) -> float:
         """
         Submit an Estimator job and return ⟨ψ|H|ψ⟩.
 
-        If observable is an np.ndarray, it is Pauli-decomposed on first call
-        and the result is cached. Subsequent calls with the same observable
-        object (by id) skip decomposition — important for VQE where the
-        Hamiltonian is fixed but this method is called O(n_params) times
-        per gradient step.
+        If observable is an np.ndarray or scipy.sparse matrix, it is
+        Pauli-decomposed once and cached by content hash (see
+        utils.pauli_cache). Sparse input is decomposed from its nonzeros
+        only, never densified. Later calls with an equal matrix skip
+        decomposition — important for VQE where the Hamiltonian is fixed
+        but this method is called O(n_params) times per gradient step.
         """
         if self._current_qasm is None:
             raise RuntimeError("No circuit ready. Call execute_circuit() first.")
-        pauli_terms = self._get_pauli_terms(observable)
-        observables_payload = {
-            "paulis": [t[0] for t in pauli_terms],
-            "coeffs": [t[1].real for t in pauli_terms],
-        }
-        job_response = self.api.submit_job(
-            program_id="estimator",
-            backend=self._backend_name,
-            params={
-                "circuits": [self._current_qasm],
-                "observables": [observables_payload],
-                "shots": self.shots,
-            },
-            session_id=self._session_id,
-        )
+        return float(self._run_estimator([(self._current_qasm, [observable])])[0][0])
+
+    def compute_expectations(
+        self,
+        observables: List[Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]]
+    ) -> np.ndarray:
+        """
+        Submit one Estimator job measuring every observable on the current
+        circuit; the job's single result holds one expectation value per
+        observable.
+        """
+        if self._current_qasm is None:
+            raise RuntimeError("No circuit ready. Call execute_circuit() first.")
+        if not observables:
+            return np.empty(0)
+        return self._run_estimator([(self._current_qasm, list(observables))])[0]
+
+    def batch_expectation(
+        self,
+        param_sets: np.ndarray,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]],
+        ansatz: Callable,
+    ) -> np.ndarray:
+        """
+        Submit one Estimator job covering every row of param_sets.
+
+        A parameter-shift gradient over P parameters becomes a single
+        Runtime job with 2P circuits instead of 2P separate jobs, each
+        paying its own queue and polling latency.
+        """
+        if not self._num_qubits:
+            raise RuntimeError("No circuit. Call create_circuit() first.")
+        observable = self._get_pauli_terms(observable)
+        circuits = []
+        for params in param_sets:
+            self.reset_state()
+            with self.profiler.phase("qiskit.ansatz"):
+                ansatz(self, params)
+            with self.profiler.phase("qiskit.build_qasm"):
+                circuits.append(
+                    serialize_qasm._build_qasm(self._num_qubits, self._operations)
+                )
+        self.reset_state()
+        if not circuits:
+            return np.empty(0)
+        evs = self._run_estimator([(qasm, [observable]) for qasm in circuits])
+        return np.array([e[0] for e in evs])
+
+    def _run_estimator(
+        self,
+        pubs: List[Tuple[str, List[Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]]]]
+    ) -> List[np.ndarray]:
+        """
+        Submit one Estimator job for pubs [(bound circuit QASM, observables),
+        ...] and return, per pub, the expectation value of each of its
+        observables. A pub with one observable sends it bare, as
+        single-observable jobs always have; several go as a list.
+        """
+        observables = []
+        # The pubs keep every observable alive, so id() is unique here;
+        # a batch sharing one observable builds its payload once
+        built: Dict[int, Dict[str, list]] = {}
+        for _, pub_observables in pubs:
+            payloads = []
+            for observable in pub_observables:
+                payload = built.get(id(observable))
+                if payload is None:
+                    pauli_terms = self._get_pauli_terms(observable)
+                    payload = built[id(observable)] = {
+                        "paulis": [t[0] for t in pauli_terms],
+                        "coeffs": [t[1].real for t in pauli_terms],
+                    }
+                payloads.append(payload)
+            observables.append(payloads[0] if len(payloads) == 1 else payloads)
+        with self.profiler.phase("qiskit.submit_job"):
+            job_response = self.api.submit_job(
+                program_id="estimator",
+                backend=self._backend_name,
+                params={
+                    "circuits": [qasm for qasm, _ in pubs],
+                    "observables": observables,
+                    "shots": self.shots,
+                },
+                session_id=self._session_id,
+            )
         job_id = job_response.get("id")
         result = self._wait_for_job(job_id)
         self._last_result = result
-        evs = result.get("results", [{}])[0].get("data", {}).get("evs", [0.0])
-        return float(evs[0] if isinstance(evs, list) else evs)
+        entries = result.get("results", [])
+        if len(entries) != len(pubs):
+            raise RuntimeError(
+                f"Job {job_id} returned {len(entries)} results "
+                f"for {len(pubs)} circuits."
+            )
+        values = []
+        for entry, (_, pub_observables) in zip(entries, pubs):
+            evs = np.atleast_1d(np.asarray(entry.get("data", {}).get("evs", []), dtype=float))
+            if len(evs) < len(pub_observables):
+                raise RuntimeError(
+                    f"Job {job_id} returned {len(evs)} expectation values "
+                    f"for {len(pub_observables)} observables."
+                )
+            values.append(evs[:len(pub_observables)])
+        return values
+
+    def prepare_observable(
+        self,
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
+    ) -> List[Tuple[str, complex]]:
+        """Matrices as Pauli terms, the form every Estimator job sends."""
+        return self._get_pauli_terms(observable)
 
     def _get_pauli_terms(
         self,
-        observable: Union[np.ndarray, List[Tuple[str, complex]]]
+        observable: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
     ) -> List[Tuple[str, complex]]:
-        """Return Pauli terms, using cache if observable hasn't changed."""
+        """
+        Return Pauli terms. Matrices go through the process-wide
+        content-hashed cache, so each Hamiltonian is decomposed once.
+        """
         if isinstance(observable, list):
             return observable
-        if not isinstance(observable, np.ndarray):
+        if not isinstance(observable, np.ndarray) and not sp.issparse(observable):
             raise TypeError(
-                f"observable must be np.ndarray or List[Tuple[str, complex]], "
-                f"got {type(observable)}."
+                f"observable must be np.ndarray, scipy.sparse matrix or "
+                f"List[Tuple[str, complex]], got {type(observable)}."
             )
-        obs_id = id(observable)
-        if obs_id != self._cached_observable_id or self._pauli_cache is None:
-            if not np.allclose(observable, observable.conj().T, atol=1e-10):
-                raise ValueError("Observable must be Hermitian (H = H†).")
-            self._pauli_cache = pauly._pauli_decompose(observable)
-            self._cached_observable_id = obs_id
-        return self._pauli_cache
+        with self.profiler.phase("qiskit.pauli_decomposition"):
+            return pauli_cache.get_pauli_terms(observable)
 
     def get_state_vector(self) -> np.ndarray:
         """
@@ -276,12 +392,19 @@ class QiskitBackend(DVBackend):
     def _wait_for_job(
         self, job_id: str, poll_interval: int = 5
     ) -> Dict[str, Any]:
+        with self.profiler.phase("qiskit.wait_for_job"):
+            return self._poll_job(job_id, poll_interval)
+
+    def _poll_job(self, job_id: str, poll_interval: int) -> Dict[str, Any]:
         deadline = time.time() + self.job_timeout
         while time.time() < deadline:
-            info = self.api.get_job(job_id)
+            with self.profiler.phase("qiskit.poll"):
+                info = self.api.get_job(job_id)
+            self.profiler.count("qiskit.job_polls")
             status = info.get("status")
             if status == "Completed":
-                return self.api.get_job_results(job_id)
+                with self.profiler.phase("qiskit.fetch_results"):
+                    return self.api.get_job_results(job_id)
             if status in ("Failed", "Cancelled"):
                 raise RuntimeError(
                     f"Job {job_id} {status.lower()}: "
@@ -0,0 +1,181 @@
+"""
+Process-wide Pauli decomposition cache shared by all DV backends.
+
+Entries are keyed by a SHA-256 hash of the matrix contents (shape and
+values), so a fresh array with the same entries hits the cache and a
+recycled id() can never return another matrix's terms. An optional
+on-disk store keeps one .npz per decomposition so new processes start
+warm across experiment-grid runs:
+
+    pauli_cache.configure(cache_dir="~/.cache/plateau-navigator/pauli")
+
+or set PLATEAU_PAULI_CACHE_DIR before import.
+
+Every lookup re-hashes the matrix, so mutating an array in place can
+never serve the terms of its old contents. Hashing costs O(4^n), more
+than a simulation, so hot loops resolve the matrix once through
+backend.prepare_observable() and pass the terms instead.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
+
+from . import pauly
+
+
+Masks = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+_lock = threading.Lock()
+_entries: "OrderedDict[str, Tuple[List[Tuple[str, complex]], Masks]]" = OrderedDict()
+_max_entries: int = 32
+_cache_dir: Optional[Path] = None
+_stats: Dict[str, int] = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def configure(
+    max_entries: Optional[int] = None,
+    cache_dir: Union[str, Path, None] = None,
+) -> None:
+    """
+    Args:
+        max_entries: In-memory LRU capacity (number of decompositions).
+        cache_dir:   Directory for the on-disk .npz store. Pass "" to
+                     disable disk persistence.
+    """
+    global _max_entries, _cache_dir
+    with _lock:
+        if max_entries is not None:
+            if max_entries < 1:
+                raise ValueError(f"max_entries must be >= 1, got {max_entries}.")
+            _max_entries = max_entries
+            while len(_entries) > _max_entries:
+                _entries.popitem(last=False)
+        if cache_dir is not None:
+            _cache_dir = Path(cache_dir).expanduser() if str(cache_dir) else None
+            if _cache_dir is not None:
+                _cache_dir.mkdir(parents=True, exist_ok=True)
+
+
+def clear(disk: bool = False) -> None:
+    """Drop all in-memory entries, and the .npz store too if disk=True."""
+    with _lock:
+        _entries.clear()
+        for key in _stats:
+            _stats[key] = 0
+        if disk and _cache_dir is not None:
+            for path in _cache_dir.glob("*.npz"):
+                path.unlink()
+
+
+def stats() -> Dict[str, int]:
+    """Counters since the last clear(): hits, disk_hits, misses, entries."""
+    with _lock:
+        return {**_stats, "entries": len(_entries)}
+
+
+def content_hash(H: Union[np.ndarray, sp.spmatrix]) -> str:
+    """
+    SHA-256 of a matrix's contents. Sparse matrices are hashed in
+    canonical CSR form, so equal matrices hash equally regardless of
+    storage format or duplicate entries.
+    """
+    h = hashlib.sha256()
+    if sp.issparse(H):
+        csr = sp.csr_matrix(H, dtype=complex, copy=True)
+        csr.sum_duplicates()
+        csr.eliminate_zeros()
+        csr.sort_indices()
+        h.update(b"csr")
+        h.update(np.asarray(csr.shape, dtype=np.int64).tobytes())
+        h.update(csr.indptr.astype(np.int64).tobytes())
+        h.update(csr.indices.astype(np.int64).tobytes())
+        h.update(csr.data.tobytes())
+    else:
+        arr = np.ascontiguousarray(H, dtype=complex)
+        h.update(b"dense")
+        h.update(np.asarray(arr.shape, dtype=np.int64).tobytes())
+        h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def get_pauli_terms(H: Union[np.ndarray, sp.spmatrix]) -> List[Tuple[str, complex]]:
+    """Pauli terms of H, as a new list the caller may modify."""
+    return list(_lookup(H)[0])
+
+
+def get_pauli_masks(H: Union[np.ndarray, sp.spmatrix]) -> Masks:
+    """
+    (x_masks, z_masks, coeffs) of H, as produced by _pauli_decompose().
+    The arrays are shared between callers and read-only.
+    """
+    return _lookup(H)[1]
+
+
+def _lookup(H: Union[np.ndarray, sp.spmatrix]) -> Tuple[List[Tuple[str, complex]], Masks]:
+    if not isinstance(H, np.ndarray) and not sp.issparse(H):
+        raise TypeError(
+            f"observable must be np.ndarray or scipy.sparse matrix, got {type(H)}."
+        )
+    key = content_hash(H)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            return entry
+        cache_dir = _cache_dir
+
+    masks = _load(cache_dir, key) if cache_dir is not None else None
+    if masks is not None:
+        stat = "disk_hits"
+    else:
+        stat = "misses"
+        if not pauly._is_hermitian(H):
+            raise ValueError("Observable must be Hermitian (H = H†).")
+        masks = pauly._pauli_decompose(H, as_masks=True)
+        if cache_dir is not None:
+            _store(cache_dir, key, masks)
+    for arr in masks:
+        arr.setflags(write=False)
+    n = pauly._num_qubits(H.shape[0])
+    labels = pauly._masks_to_labels(masks[0], masks[1], n)
+    entry = (list(zip(labels, masks[2].tolist())), masks)
+
+    with _lock:
+        _stats[stat] += 1
+        _entries[key] = entry
+        _entries.move_to_end(key)
+        while len(_entries) > _max_entries:
+            _entries.popitem(last=False)
+    return entry
+
+
+def _load(cache_dir: Path, key: str) -> Optional[Masks]:
+    path = cache_dir / f"{key}.npz"
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            return data["x_masks"], data["z_masks"], data["coeffs"]
+    except (OSError, KeyError, ValueError):
+        # Truncated or foreign file — recompute and overwrite
+        return None
+
+
+def _store(cache_dir: Path, key: str, masks: Masks) -> None:
+    """Write atomically so concurrent processes never read a partial file."""
+    tmp = cache_dir / f".{key}.{os.getpid()}.{threading.get_ident()}.npz"
+    np.savez(tmp, x_masks=masks[0], z_masks=masks[1], coeffs=masks[2])
+    os.replace(tmp, cache_dir / f"{key}.npz")
+
+
+_env_dir = os.environ.get("PLATEAU_PAULI_CACHE_DIR")
+if _env_dir:
+    configure(cache_dir=_env_dir)
@@ -1,5 +1,8 @@
 from ..backend_interface import DVBackend
+from ..qiskit_runtime.utils import pauly
+from typing import Callable, List, Tuple, Union
 import numpy as np
+import scipy.sparse as sp
 import requests
 
 class JavaBackend(DVBackend):
@@ -7,22 +10,32 @@ class JavaBackend(DVBackend):
     def __init__(self, base_url: str = "http://localhost:8080"):
         self.base_url = base_url
         self.api_base = f"{base_url}/api/quantum"
+        # Keep-alive session: every gate is its own HTTP call, so reusing
+        # the TCP connection matters more than anything else here
+        self._session = requests.Session()
         self._verify_connection()
 
     def _verify_connection(self):
         try:
-            response = requests.get(f"{self.base_url}/api/quantum/circuit/info")
-            response.raise_for_status()
+            self._call("get", f"{self.base_url}/api/quantum/circuit/info")
             print("Connected to Java backends successfully.")
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Failed to connect to Java backends at {self.base_url}") from e
 
+    def _call(self, method: str, url: str, **kwargs) -> requests.Response:
+        # Every QubitFlow round trip goes through here to be timed
+        with self.profiler.phase("java.http"):
+            response = self._session.request(method, url, **kwargs)
+        self.profiler.count("java.http_requests")
+        response.raise_for_status()
+        return response
+
     def create_circuit(self, num_qubits: int) -> dict:
-        response = requests.post(
+        response = self._call(
+            "post",
             f"{self.api_base}/circuit/create",
             params={"qubits": num_qubits}
         )
-        response.raise_for_status()
         return response.json()
 
     def add_gate(self, gate_type: str, qubits: list, **params) -> dict:
@@ -74,18 +87,15 @@ class JavaBackend(DVBackend):
         if "phi" in params:
             request_params["phi"] = params["phi"]
 
-        response = requests.post(endpoint, params=request_params)
-        response.raise_for_status()
+        response = self._call("post", endpoint, params=request_params)
         return response.json()
 
     def execute_circuit(self) -> dict:
-        response = requests.post(f"{self.api_base}/simulate/execute")
-        response.raise_for_status()
+        response = self._call("post", f"{self.api_base}/simulate/execute")
         return response.json()
 
     def get_state_vector(self) -> np.ndarray:
-        response = requests.get(f"{self.api_base}/state/current")
-        response.raise_for_status()
+        response = self._call("get", f"{self.api_base}/state/current")
         state_data = response.json()
         amplitudes = state_data.get("amplitudes", [])
         state_vector = []
@@ -97,32 +107,76 @@ class JavaBackend(DVBackend):
         return np.array(state_vector, dtype=complex)
 
     def get_probabilities(self) -> np.ndarray:
-        response = requests.get(f"{self.api_base}/state/probabilities")
-        response.raise_for_status()
+        response = self._call("get", f"{self.api_base}/state/probabilities")
         prob_data = response.json()
         return np.array(prob_data.get("probabilities", []), dtype=float)
 
     def reset_state(self) -> str:
-        response = requests.post(f"{self.api_base}/state/reset")
-        response.raise_for_status()
+        response = self._call("post", f"{self.api_base}/state/reset")
         return response.json()
 
-    def compute_expectation(self, hamiltonian: np.ndarray) -> float:
+    def compute_expectation(
+        self,
+        hamiltonian: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
+    ) -> float:
         """
         For now, we'll compute this client-side:
             1. Get state vector from Java backends
-            2. Compute H|ψ> locally
-            3. Compute <ψ|H|ψ>
+            2. Compute <ψ|H|ψ> locally — dense or sparse matvec, or
+               Pauli bit masks for a [(pauli_str, coeff), ...] list
         Later: Add dedicated endpoint to QubitFlow API
         """
         psi = self.get_state_vector()
-        H_psi = hamiltonian @ psi
-        expectation = np.vdot(psi, H_psi).real
-        return float(expectation)
+        with self.profiler.phase("java.expectation"):
+            return float(self._expectations(psi[None, :], hamiltonian)[0])
+
+    def compute_expectations(
+        self,
+        observables: List[Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]]
+    ) -> np.ndarray:
+        """Fetch the state vector once and evaluate every observable locally."""
+        psi = self.get_state_vector()[None, :]
+        with self.profiler.phase("java.expectation"):
+            return np.array([self._expectations(psi, o)[0] for o in observables], dtype=float)
+
+    @staticmethod
+    def _expectations(
+        psi: np.ndarray,
+        hamiltonian: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]]
+    ) -> np.ndarray:
+        """E_k = Re <ψ_k|H|ψ_k> for a (B, 2^n) stack of state vectors."""
+        if isinstance(hamiltonian, list):
+            return pauly._pauli_expectation(psi, *pauly._labels_to_masks(hamiltonian))
+        H_psi = (hamiltonian @ psi.T).T
+        return np.einsum("ki,ki->k", psi.conj(), H_psi).real
+
+    def batch_expectation(
+        self,
+        param_sets: np.ndarray,
+        hamiltonian: Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]]],
+        ansatz: Callable,
+    ) -> np.ndarray:
+        """
+        QubitFlow has no batch endpoint yet, so circuits are still built and
+        simulated one after another over the keep-alive session. The state
+        vectors are collected and all ⟨ψ|H|ψ⟩ are evaluated in one pass:
+            E_k = Re Σ_ij conj(ψ_ki) H_ij ψ_kj
+        Later: submit the whole batch to a dedicated QubitFlow endpoint
+        """
+        states = []
+        for params in param_sets:
+            self.clear_circuit()
+            self.reset_state()
+            ansatz(self, params)
+            self.execute_circuit()
+            states.append(self.get_state_vector())
+        if not states:
+            return np.empty(0)
+        with self.profiler.phase("java.expectation"):
+            return self._expectations(np.array(states), hamiltonian)
 
     def clear_circuit(self):
-        response = requests.post(f"{self.api_base}/circuit/clear")
-        response.raise_for_status()
+        response = self._call("post", f"{self.api_base}/circuit/clear")
         if response.text.strip():
             return response.json()
         return {"status": "cleared"}
@@ -1,5 +1,5 @@
 from ..backend_interface import CVBackend
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import numpy as np
 import strawberryfields as sf
 from strawberryfields import ops
@@ -189,11 +189,13 @@ class StrawberryFieldsBackend(CVBackend):
             raise RuntimeError("No circuit found. Call create_circuit() first.")
         if self._engine is None:
             raise RuntimeError("Engine not initialized. Call create_circuit() first.")
-        prog = sf.Program(self._num_modes)
-        with prog.context as q:
-            for op in self._operations:
-                self._dispatch_gate(op, q)
-        result = self._engine.run(prog, reset=True)
+        with self.profiler.phase("sf.build_program"):
+            prog = sf.Program(self._num_modes)
+            with prog.context as q:
+                for op in self._operations:
+                    self._dispatch_gate(op, q)
+        with self.profiler.phase("sf.simulate"):
+            result = self._engine.run(prog, reset=True)
         self._last_state = result.state
 
         return {
@@ -252,28 +254,35 @@ class StrawberryFieldsBackend(CVBackend):
 
     def compute_expectation(
         self,
-        observable: Union[str, np.ndarray],
+        observable: Union[str, np.ndarray, List[Tuple[float, Tuple[Tuple[int, np.ndarray], ...]]]],
         mode: int = 0,
     ) -> float:
         """
         Compute ⟨ψ|O|ψ⟩.
         Args:
-            observable: String shortcut ('x', 'p', 'n', 'x2', 'p2') or
-                        Hermitian np.ndarray of shape (cutoff_dim, cutoff_dim).
+            observable: String shortcut ('x', 'p', 'n', 'x2', 'p2'),
+                        Hermitian np.ndarray of shape (cutoff_dim, cutoff_dim),
+                        or a multi-mode sum of local products
+                        [(coeff, ((mode, O), ...)), ...] with O of that
+                        shape (e.g. vqe.models.bose_hubbard()).
             mode:       Target mode index (for single-mode observables on
                         multi-mode states).
         Raises:
             ValueError: Observable string unknown, or matrix dimension mismatch.
-            TypeError:  Observable is neither str nor np.ndarray.
+            TypeError:  Observable is neither str, np.ndarray nor a term list.
         """
         self._require_state()
-        H = self._resolve_observable(observable)
-        self._validate_observable(H)
-        ket = np.array(self._last_state.ket())
-        if ket.ndim == 1:
-            return self._expectation_single_mode(H, ket)
-        else:
-            return self._expectation_reduced(H, ket, mode)
+        with self.profiler.phase("sf.expectation"):
+            if isinstance(observable, list):
+                ket = np.array(self._last_state.ket())
+                return self._expectation_local_terms(observable, ket)
+            H = self._resolve_observable(observable)
+            self._validate_observable(H)
+            ket = np.array(self._last_state.ket())
+            if ket.ndim == 1:
+                return self._expectation_single_mode(H, ket)
+            else:
+                return self._expectation_reduced(H, ket, mode)
 
     def _resolve_observable(self, observable: Union[str, np.ndarray]) -> np.ndarray:
         if isinstance(observable, str):
@@ -307,6 +316,30 @@ class StrawberryFieldsBackend(CVBackend):
     def _expectation_single_mode(self, H: np.ndarray, ket: np.ndarray) -> float:
         return float(np.real(ket.conj() @ H @ ket))
 
+    def _expectation_local_terms(
+        self,
+        terms: List[Tuple[float, Tuple[Tuple[int, np.ndarray], ...]]],
+        ket: np.ndarray,
+    ) -> float:
+        """
+        Σ c ⟨ψ|Π_m O_m|ψ⟩, applying each local factor along its mode axis
+        of the ket, so the full cutoff^n operator is never formed.
+        """
+        d = self._cutoff_dim
+        ket = ket.reshape((d,) * self._num_modes)
+        total = 0.0
+        for coeff, factors in terms:
+            phi = ket
+            for mode, O in factors:
+                if mode < 0 or mode >= self._num_modes:
+                    raise IndexError(
+                        f"mode {mode} out of range for {self._num_modes}-mode state."
+                    )
+                self._validate_observable(O)
+                phi = np.moveaxis(np.tensordot(O, phi, axes=([1], [mode])), 0, mode)
+            total += float(np.real(coeff)) * float(np.real(np.vdot(ket, phi)))
+        return total
+
     def _expectation_reduced(self, H: np.ndarray, ket: np.ndarray, mode: int) -> float:
         """Compute Tr(H * ρ_mode) where ρ_mode is the reduced density matrix."""
         d = self._cutoff_dim
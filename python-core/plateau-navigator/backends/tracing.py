@@ -0,0 +1,282 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+
+class TracedParameter:
+    """
+    Gate angle recorded as an affine function of one ansatz parameter:
+
+        angle = coeff * params[index] + offset
+
+    Instances behave like floats under +, -, * and / by scalars, so an
+    ansatz written as ansatz(backend, params) can be run unchanged on an
+    array of TracedParameter. Backends read float(angle) for simulation and
+    (index, coeff) to map angle derivatives back onto parameters.
+
+    Products of two parameters, or angles mixing several parameters, are
+    rejected — they have no single-parameter derivative.
+    """
+
+    __slots__ = ("index", "coeff", "offset", "value")
+
+    # Make numpy scalars defer to our reflected operators (np.pi * p etc.)
+    __array_ufunc__ = None
+
+    def __init__(self, index: int, coeff: float, offset: float, value: float):
+        self.index = index
+        self.coeff = coeff
+        self.offset = offset
+        self.value = value
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __add__(self, other: Any) -> "TracedParameter":
+        if isinstance(other, TracedParameter):
+            if other.index != self.index:
+                raise TypeError(
+                    f"Gate angle mixes parameters {self.index} and {other.index}; "
+                    f"traced angles must depend on a single parameter."
+                )
+            return TracedParameter(
+                self.index,
+                self.coeff + other.coeff,
+                self.offset + other.offset,
+                self.value + other.value,
+            )
+        other = float(other)
+        return TracedParameter(self.index, self.coeff, self.offset + other, self.value + other)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "TracedParameter":
+        return TracedParameter(self.index, -self.coeff, -self.offset, -self.value)
+
+    def __pos__(self) -> "TracedParameter":
+        return self
+
+    def __sub__(self, other: Any) -> "TracedParameter":
+        return self + (-other)
+
+    def __rsub__(self, other: Any) -> "TracedParameter":
+        return (-self) + other
+
+    def __mul__(self, other: Any) -> "TracedParameter":
+        if isinstance(other, TracedParameter):
+            raise TypeError(
+                f"Gate angle multiplies parameters {self.index} and {other.index}; "
+                f"traced angles must be affine in a single parameter."
+            )
+        k = float(other)
+        return TracedParameter(self.index, self.coeff * k, self.offset * k, self.value * k)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Any) -> "TracedParameter":
+        if isinstance(other, TracedParameter):
+            raise TypeError("Gate angle divides by a parameter; not affine.")
+        return self * (1.0 / float(other))
+
+    def __repr__(self) -> str:
+        return (
+            f"TracedParameter({self.coeff:g}*params[{self.index}]"
+            f"{self.offset:+g} = {self.value:g})"
+        )
+
+
+def trace_parameters(params: np.ndarray) -> np.ndarray:
+    """
+    Wrap a parameter vector as an object array of TracedParameter.
+
+    The result supports indexing, slicing, reshape and len() like the
+    original array, so it can be passed straight to ansatz(backend, params).
+    """
+    values = np.asarray(params, dtype=float)
+    traced = np.empty(values.shape, dtype=object)
+    for i, v in enumerate(values.flat):
+        traced.flat[i] = TracedParameter(i, 1.0, 0.0, float(v))
+    return traced
+
+
+class GateTape:
+    """
+    Immutable, array-backed record of one ansatz trace.
+
+    Gates, qubits and angle-argument names are fixed at compile time; every
+    angle is stored as an affine slot
+
+        angle[s] = coeff[s] * params[param_index[s]] + offset[s]
+
+    with param_index[s] = -1 (and coeff[s] = 0) for constant angles. Binding
+    new parameters is a single vectorised expression, so backends can run
+    the tape without re-entering the ansatz or re-validating its gates.
+
+    Build with compile_ansatz(). A tape is itself an ansatz callable:
+    tape(backend, params) queues the gates through backend.load_tape().
+    """
+
+    __slots__ = (
+        "n_qubits", "n_params", "gates", "qubits", "param_names",
+        "slot_start", "param_index", "coeff", "offset",
+    )
+
+    def __init__(
+        self,
+        n_qubits: int,
+        n_params: int,
+        gates: Tuple[str, ...],
+        qubits: Tuple[Tuple[int, ...], ...],
+        param_names: Tuple[Tuple[str, ...], ...],
+        param_index: np.ndarray,
+        coeff: np.ndarray,
+        offset: np.ndarray,
+    ):
+        self.n_qubits = n_qubits
+        self.n_params = n_params
+        self.gates = gates
+        self.qubits = qubits
+        self.param_names = param_names
+        self.slot_start = np.cumsum([0] + [len(names) for names in param_names])
+        self.param_index = np.asarray(param_index, dtype=np.int64)
+        self.coeff = np.asarray(coeff, dtype=float)
+        self.offset = np.asarray(offset, dtype=float)
+        for arr in (self.slot_start, self.param_index, self.coeff, self.offset):
+            arr.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.gates)
+
+    def __call__(self, backend: Any, params: np.ndarray) -> None:
+        params = np.asarray(params)
+        if params.dtype == object:
+            # Traced parameters (adjoint differentiation) need per-gate
+            # provenance, which only the add_gate path records
+            self.replay(backend, params)
+        else:
+            backend.load_tape(self, params)
+
+    def angles(self, params: np.ndarray) -> np.ndarray:
+        """Angle of every slot, shape (n_slots,), at the given parameters."""
+        params = np.asarray(params, dtype=float).reshape(-1)
+        if params.size != self.n_params:
+            raise ValueError(
+                f"Tape was compiled for {self.n_params} parameters, "
+                f"got {params.size}."
+            )
+        if not self.n_params:
+            return self.offset.copy()
+        return self.coeff * params[np.maximum(self.param_index, 0)] + self.offset
+
+    def batch_angles(self, param_sets: np.ndarray) -> np.ndarray:
+        """Slot angles for every row of param_sets, shape (B, n_slots)."""
+        param_sets = np.asarray(param_sets, dtype=float)
+        if param_sets.ndim != 2 or param_sets.shape[1] != self.n_params:
+            raise ValueError(
+                f"Expected param_sets of shape (B, {self.n_params}), "
+                f"got {param_sets.shape}."
+            )
+        if not self.n_params:
+            return np.broadcast_to(self.offset, (len(param_sets), len(self.offset))).copy()
+        return self.coeff * param_sets[:, np.maximum(self.param_index, 0)] + self.offset
+
+    def replay(self, backend: Any, params: np.ndarray, stop: Optional[int] = None) -> None:
+        """
+        Queue the tape through backend.add_gate(), validating every gate.
+        With stop, only the first `stop` gates are queued.
+        """
+        params = np.asarray(params)
+        if params.dtype == object:
+            params = params.reshape(-1)
+            values = [
+                off if idx < 0 else c * params[idx] + off
+                for idx, c, off in zip(self.param_index, self.coeff.tolist(), self.offset.tolist())
+            ]
+        else:
+            values = self.angles(params).tolist()
+        for gate, qubits, names, start in zip(
+            self.gates[:stop], self.qubits[:stop], self.param_names[:stop], self.slot_start.tolist()
+        ):
+            backend.add_gate(gate, list(qubits), **dict(zip(names, values[start:start + len(names)])))
+
+    def __repr__(self) -> str:
+        return (
+            f"GateTape(n_qubits={self.n_qubits}, n_params={self.n_params}, "
+            f"gates={len(self.gates)}, slots={len(self.coeff)})"
+        )
+
+
+class _TapeRecorder:
+    """Stand-in backend that records add_gate() calls; all else is forwarded."""
+
+    def __init__(self, backend: Any):
+        self._backend = backend
+        self.ops: List[Tuple[str, Tuple[int, ...], Dict[str, Any]]] = []
+
+    def add_gate(self, gate_type: str, qubits: List[int], **params) -> Dict[str, Any]:
+        self.ops.append((gate_type.lower(), tuple(int(q) for q in qubits), params))
+        return {"status": "gate_queued", "gate_type": gate_type, "qubits": qubits}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._backend, name)
+
+
+def compile_ansatz(backend: Any, ansatz: Callable, params: np.ndarray) -> GateTape:
+    """
+    Trace ansatz(backend, params) once into a GateTape.
+
+    The ansatz is run on TracedParameter angles to record which parameter
+    feeds every gate, then the tape is replayed once through
+    backend.add_gate() so the backend's own validation runs exactly once.
+    A second trace at shifted plain-float parameters checks that the gate
+    sequence does not depend on parameter values and that every angle is
+    affine in a single parameter.
+
+    Raises:
+        ValueError: The ansatz cannot be represented as a fixed tape.
+        (plus whatever backend.add_gate() raises for invalid gates)
+    """
+    params = np.asarray(params, dtype=float)
+    recorder = _TapeRecorder(backend)
+    ansatz(recorder, trace_parameters(params))
+
+    gates, qubits, names = [], [], []
+    param_index, coeff, offset = [], [], []
+    for gate, gate_qubits, gate_params in recorder.ops:
+        gates.append(gate)
+        qubits.append(gate_qubits)
+        names.append(tuple(gate_params))
+        for value in gate_params.values():
+            if isinstance(value, TracedParameter):
+                param_index.append(value.index)
+                coeff.append(value.coeff)
+                offset.append(value.offset)
+            else:
+                param_index.append(-1)
+                coeff.append(0.0)
+                offset.append(float(value))
+    tape = GateTape(
+        backend.n_qubits, params.size, tuple(gates), tuple(qubits), tuple(names),
+        np.array(param_index, dtype=np.int64), np.array(coeff), np.array(offset),
+    )
+
+    probe = params + np.random.default_rng(0).uniform(0.1, 1.0, params.shape)
+    check = _TapeRecorder(backend)
+    ansatz(check, probe)
+    if [(g, q, tuple(p)) for g, q, p in check.ops] != list(zip(gates, qubits, names)):
+        raise ValueError(
+            "Ansatz gate sequence depends on parameter values; "
+            "it cannot be compiled into a fixed tape."
+        )
+    probe_angles = [float(v) for _, _, p in check.ops for v in p.values()]
+    if not np.allclose(tape.angles(probe), probe_angles, rtol=1e-9, atol=1e-9):
+        raise ValueError(
+            "Ansatz computes gate angles outside TracedParameter arithmetic "
+            "(e.g. float() or np.cos() of a parameter); angles must be "
+            "affine in a single parameter to be compiled."
+        )
+
+    backend.clear_circuit()
+    backend.reset_state()
+    tape.replay(backend, params)
+    backend.reset_state()
+    return tape
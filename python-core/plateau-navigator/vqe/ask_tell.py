@@ -0,0 +1,165 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+import numpy as np
+
+
+class AskTellOptimizer(ABC):
+    """
+    Abstract base class for population-based optimizers driven from outside.
+
+    ask() proposes a whole generation of candidate points at once, so the
+    caller can evaluate them together (one batch_expectation() call, or
+    fanned out to a worker pool) before handing the energies back with
+    tell(). The optimizer never evaluates anything itself.
+
+    Loop:
+        while opt.stop() is None:
+            X = opt.ask()
+            opt.tell(X, evaluate(X))
+        opt.best_x, opt.best_f
+    """
+
+    def __init__(self, x0: np.ndarray):
+        self.best_x = np.array(x0, dtype=float)
+        self.best_f = np.inf
+        self.generation = 0
+        self.nfev = 0
+
+    @abstractmethod
+    def ask(self) -> np.ndarray:
+        """Candidate points of the next generation, shape (λ, n_params)."""
+        pass
+
+    @abstractmethod
+    def _update(self, X: np.ndarray, f: np.ndarray) -> None:
+        """Update the search distribution from evaluated candidates."""
+        pass
+
+    def tell(self, X: np.ndarray, f: np.ndarray) -> None:
+        """
+        Report the energies f of the candidates X returned by ask().
+
+        Args:
+            X: Shape (λ, n_params).
+            f: Shape (λ,).
+        """
+        X = np.asarray(X, dtype=float)
+        f = np.asarray(f, dtype=float)
+        i = int(np.argmin(f))
+        if f[i] < self.best_f:
+            self.best_f = float(f[i])
+            self.best_x = X[i].copy()
+        self.nfev += len(f)
+        self._update(X, f)
+        self.generation += 1
+
+    def stop(self) -> Optional[str]:
+        """Reason to terminate, or None to keep going."""
+        return None
+
+
+class CMAES(AskTellOptimizer):
+    """
+    Covariance matrix adaptation evolution strategy, (μ/μ_w, λ) with
+    rank-one and rank-μ updates and cumulative step-size adaptation,
+    following Hansen, "The CMA Evolution Strategy: A Tutorial" (2016).
+
+    Needs no gradients and is robust to the noise and ruggedness of
+    sampled energy landscapes; every generation is λ independent points.
+    """
+
+    def __init__(
+        self,
+        x0: np.ndarray,
+        sigma: float = 0.5,
+        population_size: Optional[int] = None,
+        tol: float = 1e-8,
+        seed: Union[int, np.random.Generator, None] = None,
+    ):
+        """
+        Args:
+            x0:              Initial mean.
+            sigma:           Initial step size, in parameter units.
+            population_size: λ; defaults to 4 + ⌊3 ln n⌋.
+            tol:             Stop when the spread of recent best energies
+                             and of the current generation, or σ times
+                             the widest axis, falls below tol.
+            seed:            Seed or Generator for the samples.
+        """
+        super().__init__(x0)
+        n = self.best_x.size
+        if n < 1:
+            raise ValueError("CMA-ES needs at least one parameter.")
+        self.rng = np.random.default_rng(seed)
+        self.mean = self.best_x.copy()
+        self.sigma = float(sigma)
+        self.tol = tol
+        self.lam = int(population_size) if population_size else 4 + int(3 * np.log(n))
+        if self.lam < 2:
+            raise ValueError(f"population_size must be >= 2, got {self.lam}.")
+        self.mu = self.lam // 2
+
+        weights = np.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = weights / weights.sum()
+        self.mu_eff = 1.0 / np.sum(self.weights ** 2)
+
+        self.cc = (4 + self.mu_eff / n) / (n + 4 + 2 * self.mu_eff / n)
+        self.cs = (self.mu_eff + 2) / (n + self.mu_eff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mu_eff)
+        self.cmu = min(1 - self.c1, 2 * (self.mu_eff - 2 + 1 / self.mu_eff) / ((n + 2) ** 2 + self.mu_eff))
+        self.damps = 1 + 2 * max(0.0, np.sqrt((self.mu_eff - 1) / (n + 1)) - 1) + self.cs
+        self.chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        self.pc = np.zeros(n)
+        self.ps = np.zeros(n)
+        self.C = np.eye(n)
+        self.B = np.eye(n)
+        self.D = np.ones(n)
+        self._best_per_generation = []
+        self._last_f = None
+
+    def ask(self) -> np.ndarray:
+        z = self.rng.standard_normal((self.lam, self.mean.size))
+        return self.mean + self.sigma * (z * self.D) @ self.B.T
+
+    def _update(self, X: np.ndarray, f: np.ndarray) -> None:
+        n = self.mean.size
+        order = np.argsort(f)[:self.mu]
+        old_mean = self.mean
+        y = (X[order] - old_mean) / self.sigma
+        y_w = self.weights @ y
+        self.mean = old_mean + self.sigma * y_w
+
+        # C^{-1/2} y_w through the cached eigendecomposition C = B D² Bᵀ
+        c_inv_sqrt_y = self.B @ ((self.B.T @ y_w) / self.D)
+        self.ps = (1 - self.cs) * self.ps + np.sqrt(self.cs * (2 - self.cs) * self.mu_eff) * c_inv_sqrt_y
+        ps_norm = np.linalg.norm(self.ps)
+        h_sig = ps_norm / np.sqrt(1 - (1 - self.cs) ** (2 * (self.generation + 1))) / self.chi_n < 1.4 + 2 / (n + 1)
+        self.pc = (1 - self.cc) * self.pc + h_sig * np.sqrt(self.cc * (2 - self.cc) * self.mu_eff) * y_w
+
+        self.C = (
+            (1 - self.c1 - self.cmu) * self.C
+            + self.c1 * (np.outer(self.pc, self.pc) + (1 - h_sig) * self.cc * (2 - self.cc) * self.C)
+            + self.cmu * (y.T * self.weights) @ y
+        )
+        self.sigma *= np.exp((self.cs / self.damps) * (ps_norm / self.chi_n - 1))
+
+        self.C = (self.C + self.C.T) / 2
+        d2, self.B = np.linalg.eigh(self.C)
+        self.D = np.sqrt(np.maximum(d2, 1e-300))
+        self._best_per_generation.append(float(f[order[0]]))
+        self._last_f = f
+
+    def stop(self) -> Optional[str]:
+        if self._last_f is None:
+            return None
+        n = self.mean.size
+        history = self._best_per_generation[-(10 + int(30 * n / self.lam)):]
+        if (len(history) > 1 and max(history) - min(history) < self.tol
+                and np.ptp(self._last_f) < self.tol):
+            return "Energy spread below tolerance"
+        if self.sigma * self.D.max() < self.tol:
+            return "Step size below tolerance"
+        if self.D.max() > 1e7 * self.D.min():
+            return "Covariance matrix ill-conditioned"
+        return None
@@ -0,0 +1,171 @@
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from .eval_cache import _params_key
+
+_FORMAT_VERSION = 3
+
+# Checkpoints are directories of numbered segments, read back in order
+_SEGMENT_NAME = "segment-{:06d}.npz"
+_SEGMENT_PATTERN = re.compile(r"segment-(\d{6})\.npz")
+
+
+class EvaluationLog:
+    """
+    Every backend evaluation of one VQE.run(), keyed on exact parameter
+    bytes: energies (single or batched), adjoint (energy, gradient) pairs
+    and metric tensors.
+
+    Checkpointing appends the entries added since the previous save to
+    the checkpoint directory as a new segment, so each save costs I/O
+    proportional to the new entries only; resuming loads and merges all
+    segments and re-runs the optimizer from the start. Optimizers are deterministic given their
+    inputs (stochastic ones get their seed back from the checkpoint), so
+    they revisit exactly the logged points, which are served from the log
+    instead of the backend until the run passes the point where it died.
+    """
+
+    def __init__(self):
+        self._energies: Dict[bytes, float] = {}
+        self._adjoint: Dict[bytes, Tuple[float, np.ndarray]] = {}
+        self._metrics: Dict[bytes, np.ndarray] = {}
+        self.replayed = 0
+        # Keys added since the last save to _directory, per column
+        self._pending: Dict[str, List[bytes]] = {"energy": [], "adjoint": [], "metric": []}
+        self._directory: Optional[str] = None
+        self._segments = 0
+
+    def __len__(self) -> int:
+        return len(self._energies) + len(self._adjoint) + len(self._metrics)
+
+    def energy(self, params: np.ndarray) -> Optional[float]:
+        value = self._energies.get(_params_key(params))
+        if value is not None:
+            self.replayed += 1
+        return value
+
+    def add_energy(self, params: np.ndarray, energy: float) -> None:
+        key = _params_key(params)
+        if key not in self._energies:
+            self._pending["energy"].append(key)
+        self._energies[key] = float(energy)
+
+    def adjoint(self, params: np.ndarray) -> Optional[Tuple[float, np.ndarray]]:
+        value = self._adjoint.get(_params_key(params))
+        if value is not None:
+            self.replayed += 1
+            return value[0], value[1].copy()
+        return None
+
+    def add_adjoint(self, params: np.ndarray, energy: float, gradients: np.ndarray) -> None:
+        key = _params_key(params)
+        if key not in self._adjoint:
+            self._pending["adjoint"].append(key)
+        self._adjoint[key] = (float(energy), np.array(gradients, dtype=float))
+
+    def metric(self, params: np.ndarray) -> Optional[np.ndarray]:
+        value = self._metrics.get(_params_key(params))
+        if value is not None:
+            self.replayed += 1
+            return value.copy()
+        return None
+
+    def add_metric(self, params: np.ndarray, metric: np.ndarray) -> None:
+        key = _params_key(params)
+        if key not in self._metrics:
+            self._pending["metric"].append(key)
+        self._metrics[key] = np.array(metric, dtype=float)
+
+    def save(self, path: str, meta: Dict[str, Any]) -> None:
+        """
+        Append the entries added since the last save, with meta, to the
+        checkpoint directory `path` as one atomically written segment.
+        Nothing is written when no entry is new. The first save to a
+        directory this log has not been saved to or loaded from replaces
+        any segments already there and writes every entry.
+        """
+        directory = os.path.abspath(path)
+        if directory != self._directory:
+            os.makedirs(directory, exist_ok=True)
+            for _, name in _segment_files(directory):
+                os.remove(os.path.join(directory, name))
+            self._directory, self._segments = directory, 0
+            self._pending = {
+                "energy": list(self._energies),
+                "adjoint": list(self._adjoint),
+                "metric": list(self._metrics),
+            }
+        elif self._segments and not any(self._pending.values()):
+            return
+        energy_keys = self._pending["energy"]
+        adjoint_keys = self._pending["adjoint"]
+        metric_keys = self._pending["metric"]
+        arrays = {"meta": np.array(json.dumps({"format": _FORMAT_VERSION, **meta}, default=repr))}
+        # Parameter vectors may differ in length between entries (plateau
+        # restarts on a reduced ansatz), so every column is stored flat
+        # with per-entry sizes
+        _pack(arrays, "energy_keys", [np.frombuffer(k, dtype=float) for k in energy_keys])
+        arrays["energy_values"] = np.array([self._energies[k] for k in energy_keys], dtype=float)
+        _pack(arrays, "adjoint_keys", [np.frombuffer(k, dtype=float) for k in adjoint_keys])
+        arrays["adjoint_energies"] = np.array([self._adjoint[k][0] for k in adjoint_keys], dtype=float)
+        _pack(arrays, "adjoint_gradients", [self._adjoint[k][1] for k in adjoint_keys])
+        _pack(arrays, "metric_keys", [np.frombuffer(k, dtype=float) for k in metric_keys])
+        _pack(arrays, "metric_values", [self._metrics[k].reshape(-1) for k in metric_keys])
+        fd, staging = tempfile.mkstemp(prefix=".segment-", suffix=".npz", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.savez(fh, **arrays)
+            os.replace(staging, os.path.join(directory, _SEGMENT_NAME.format(self._segments)))
+        except BaseException:
+            if os.path.exists(staging):
+                os.remove(staging)
+            raise
+        self._segments += 1
+        self._pending = {"energy": [], "adjoint": [], "metric": []}
+
+    @classmethod
+    def load(cls, path: str) -> Tuple["EvaluationLog", Dict[str, Any]]:
+        """Merge every segment of a checkpoint directory; meta is the last segment's."""
+        directory = os.path.abspath(path)
+        segments = _segment_files(directory) if os.path.isdir(directory) else []
+        if not segments:
+            raise ValueError(f"No checkpoint segments in {path}.")
+        log, meta = cls(), {}
+        for _, name in segments:
+            with np.load(os.path.join(directory, name), allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("format") != _FORMAT_VERSION:
+                    raise ValueError(f"Unsupported checkpoint format {meta.get('format')!r} in {path}.")
+                for k, v in zip(_unpack(data, "energy_keys"), data["energy_values"].tolist()):
+                    log.add_energy(k, v)
+                for k, e, g in zip(_unpack(data, "adjoint_keys"), data["adjoint_energies"].tolist(),
+                                   _unpack(data, "adjoint_gradients")):
+                    log.add_adjoint(k, e, g)
+                for k, m in zip(_unpack(data, "metric_keys"), _unpack(data, "metric_values")):
+                    log.add_metric(k, m.reshape(len(k), len(k)))
+        # Everything loaded is already on disk; later saves append to it
+        log._directory, log._segments = directory, segments[-1][0] + 1
+        log._pending = {"energy": [], "adjoint": [], "metric": []}
+        return log, meta
+
+
+def _segment_files(directory: str) -> List[Tuple[int, str]]:
+    """(index, file name) of every segment in directory, in order."""
+    found = []
+    for name in os.listdir(directory):
+        match = _SEGMENT_PATTERN.fullmatch(name)
+        if match:
+            found.append((int(match.group(1)), name))
+    return sorted(found)
+
+
+def _pack(arrays: Dict[str, np.ndarray], name: str, rows: List[np.ndarray]) -> None:
+    arrays[name] = np.concatenate(rows) if rows else np.empty(0)
+    arrays[f"{name}_sizes"] = np.array([len(r) for r in rows], dtype=np.int64)
+
+
+def _unpack(data, name: str) -> List[np.ndarray]:
+    return np.split(data[name], np.cumsum(data[f"{name}_sizes"])[:-1]) if len(data[f"{name}_sizes"]) else []
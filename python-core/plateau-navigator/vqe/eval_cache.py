@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import numpy as np
+
+
+def _params_key(params: np.ndarray) -> bytes:
+    """Exact byte key of a parameter vector — no rounding, no tolerance."""
+    return np.ascontiguousarray(params, dtype=float).tobytes()
+
+
+class EvaluationCache:
+    """
+    Bounded LRU memo of VQE evaluations keyed on exact parameter bytes.
+
+    SciPy's gradient optimizers call fun and jac at the same x and revisit
+    points during line searches; every hit here is one circuit simulation
+    (or QPU job) not submitted. Only bit-identical parameter vectors hit,
+    so cached values are exactly what a fresh evaluation would return on
+    a deterministic backend.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Capacity per cache. 0 disables caching; hits and
+                         misses are then not counted.
+        """
+        if max_entries < 0:
+            raise ValueError(f"max_entries must be >= 0, got {max_entries}.")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, params: np.ndarray, tag: Hashable = None) -> Hashable:
+        return (tag, _params_key(params))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if not self.max_entries:
+            return None
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.max_entries:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,238 @@
+import hashlib
+from typing import Any, List, Tuple, Union
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator
+from backends.qiskit_runtime.utils import pauli_cache, pauly
+
+# Hamiltonian representations accepted by VQE:
+#   'dense'  — np.ndarray, shape (2^n, 2^n) or (cutoff, cutoff) for CV
+#   'sparse' — scipy.sparse matrix of the same shape
+#   'pauli'  — Pauli sum [(pauli_str, coeff), ...], leftmost char = qubit n-1
+#   'fock'   — CV sum of local products [(coeff, ((mode, O), ...)), ...]
+#              with Hermitian (cutoff, cutoff) Fock-basis matrices O
+FockTerm = Tuple[float, Tuple[Tuple[int, np.ndarray], ...]]
+Hamiltonian = Union[np.ndarray, sp.spmatrix, List[Tuple[str, complex]], List[FockTerm]]
+
+_HERMITIAN_ATOL = 1e-8
+
+
+def _normalize_hamiltonian(hamiltonian: Any) -> Tuple[Hamiltonian, str]:
+    """
+    Validate a Hamiltonian and return it with its representation kind.
+
+    Pauli-sum objects exposing to_list() (e.g. qiskit SparsePauliOp) are
+    converted to a plain [(pauli_str, coeff), ...] list so every backend
+    receives one of the three representations above.
+
+    Raises:
+        TypeError:  Unsupported representation.
+        ValueError: Wrong shape, inconsistent Pauli strings, or non-Hermitian.
+    """
+    if hasattr(hamiltonian, "to_list") and not isinstance(hamiltonian, np.ndarray):
+        hamiltonian = [(str(label), complex(coeff)) for label, coeff in hamiltonian.to_list()]
+
+    if isinstance(hamiltonian, list):
+        if hamiltonian and not isinstance(hamiltonian[0][0], str):
+            _validate_fock_terms(hamiltonian)
+            return hamiltonian, "fock"
+        _validate_pauli_terms(hamiltonian)
+        return hamiltonian, "pauli"
+
+    if sp.issparse(hamiltonian):
+        _validate_matrix_shape(hamiltonian)
+        diff = abs(hamiltonian - hamiltonian.conj().T)
+        if diff.nnz and diff.max() > _HERMITIAN_ATOL:
+            raise ValueError("Hamiltonian must be Hermitian (H = H†)")
+        return sp.csr_matrix(hamiltonian), "sparse"
+
+    if isinstance(hamiltonian, np.ndarray):
+        _validate_matrix_shape(hamiltonian)
+        if not np.allclose(hamiltonian, hamiltonian.conj().T):
+            raise ValueError("Hamiltonian must be Hermitian (H = H†)")
+        return hamiltonian, "dense"
+
+    raise TypeError(
+        "Hamiltonian must be a numpy array, scipy.sparse matrix or Pauli sum "
+        f"[(pauli_str, coeff), ...], got {type(hamiltonian)}"
+    )
+
+
+def _validate_matrix_shape(hamiltonian) -> None:
+    if hamiltonian.ndim != 2:
+        raise ValueError(f"Hamiltonian must be 2D matrix, got shape {hamiltonian.shape}")
+    if hamiltonian.shape[0] != hamiltonian.shape[1]:
+        raise ValueError(f"Hamiltonian must be square, got shape {hamiltonian.shape}")
+
+
+def _validate_pauli_terms(terms: List[Tuple[str, complex]]) -> None:
+    if not terms:
+        raise ValueError("Pauli-sum Hamiltonian has no terms")
+    n = len(terms[0][0])
+    for label, coeff in terms:
+        if len(label) != n:
+            raise ValueError(
+                f"Pauli string '{label}' has length {len(label)}, expected {n}"
+            )
+        if set(label.upper()) - set("IXYZ"):
+            raise ValueError(f"Invalid Pauli string '{label}'")
+        if abs(complex(coeff).imag) > _HERMITIAN_ATOL:
+            raise ValueError(
+                f"Pauli term '{label}' has complex coefficient {coeff}; "
+                f"Hamiltonian must be Hermitian (H = H†)"
+            )
+
+
+def _validate_fock_terms(terms: List[FockTerm]) -> None:
+    cutoff = None
+    for coeff, factors in terms:
+        if abs(complex(coeff).imag) > _HERMITIAN_ATOL:
+            raise ValueError(
+                f"Fock term has complex coefficient {coeff}; "
+                f"Hamiltonian must be Hermitian (H = H†)"
+            )
+        modes = [mode for mode, _ in factors]
+        if len(set(modes)) != len(modes) or min(modes, default=0) < 0:
+            raise ValueError(f"Fock term acts on invalid or repeated modes {modes}")
+        for _, O in factors:
+            _validate_matrix_shape(O)
+            cutoff = O.shape[0] if cutoff is None else cutoff
+            if O.shape[0] != cutoff:
+                raise ValueError(
+                    f"Fock operator has cutoff {O.shape[0]}, expected {cutoff}"
+                )
+            if not np.allclose(O, O.conj().T):
+                raise ValueError("Fock operators must be Hermitian (O = O†)")
+    if cutoff is None:
+        raise ValueError("Fock-sum Hamiltonian has no operators")
+
+
+def _fock_shape(terms: List[FockTerm]) -> Tuple[int, int]:
+    """(n_modes, cutoff) of a Fock sum; modes are counted up to the highest used."""
+    n_modes = 1 + max(mode for _, factors in terms for mode, _ in factors)
+    cutoff = next(O.shape[0] for _, factors in terms for _, O in factors)
+    return n_modes, cutoff
+
+
+def _dimension(hamiltonian: Hamiltonian, kind: str) -> int:
+    if kind == "pauli":
+        return 2 ** len(hamiltonian[0][0])
+    if kind == "fock":
+        n_modes, cutoff = _fock_shape(hamiltonian)
+        return cutoff ** n_modes
+    return hamiltonian.shape[0]
+
+
+def _describe(hamiltonian: Hamiltonian, kind: str) -> str:
+    if kind == "pauli":
+        return f"{len(hamiltonian)} Pauli terms on {len(hamiltonian[0][0])} qubits"
+    if kind == "fock":
+        n_modes, cutoff = _fock_shape(hamiltonian)
+        return f"{len(hamiltonian)} Fock terms on {n_modes} modes, cutoff={cutoff}"
+    dim = hamiltonian.shape[0]
+    if kind == "sparse":
+        return f"{dim}×{dim} sparse, nnz={hamiltonian.nnz}"
+    return f"{dim}×{dim}"
+
+
+def _pauli_masks(terms: List[Tuple[str, complex]]) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (n, x_masks, z_masks, coeffs · i^{|x&z|}) of a Pauli sum.
+
+    Raises:
+        ValueError: No terms, or inconsistent or invalid Pauli strings.
+    """
+    x_masks, z_masks, coeffs = pauly._labels_to_masks(terms)
+    n = len(terms[0][0])
+    return n, x_masks, z_masks, coeffs * pauly._I_POWERS[pauly._popcount(x_masks & z_masks, n) % 4]
+
+
+def _pauli_operator(terms: List[Tuple[str, complex]]) -> LinearOperator:
+    """
+    Σ cᵢ Pᵢ as a matrix-free LinearOperator, O(T · n · 2^n) per matvec and
+    O(2^n) memory, for Pauli sums whose CSR form would not fit.
+    """
+    masks = pauly._labels_to_masks(terms)
+    dim = 2 ** len(terms[0][0])
+
+    def matvec(v: np.ndarray) -> np.ndarray:
+        return pauly._pauli_apply(np.asarray(v, dtype=complex).reshape(-1), *masks)
+
+    return LinearOperator((dim, dim), matvec=matvec, rmatvec=matvec, dtype=complex)
+
+
+def _content_hash(hamiltonian: Hamiltonian, kind: str) -> str:
+    """
+    SHA-256 of a normalised Hamiltonian's contents. Pauli sums are hashed
+    with duplicate labels merged and terms sorted, sparse matrices in
+    canonical CSR form (see pauli_cache.content_hash), so equal operators
+    hash equally.
+    """
+    h = hashlib.sha256(kind.encode())
+    if kind == "fock":
+        for coeff, factors in hamiltonian:
+            h.update(np.complex128(coeff).tobytes())
+            for mode, O in factors:
+                h.update(np.int64(mode).tobytes())
+                h.update(np.ascontiguousarray(O, dtype=complex).tobytes())
+            h.update(b";")
+    elif kind == "pauli":
+        merged = {}
+        for label, coeff in hamiltonian:
+            merged[label.upper()] = merged.get(label.upper(), 0.0) + complex(coeff)
+        for label in sorted(merged):
+            h.update(label.encode())
+            h.update(np.complex128(merged[label]).tobytes())
+    else:
+        # Matrices hash exactly as in the Pauli decomposition cache
+        h.update(pauli_cache.content_hash(hamiltonian).encode())
+    return h.hexdigest()
+
+
+def _pauli_to_sparse(terms: List[Tuple[str, complex]]) -> sp.csr_matrix:
+    """
+    Assemble Σ cᵢ Pᵢ as a CSR matrix in O(T · 2^n), never densifying.
+
+    With X-mask x and Z-mask z, P|k⟩ = i^{|x&z|} (-1)^{popcount(k&z)} |k⊕x⟩,
+    so every term contributes exactly one nonzero per column.
+    """
+    n, x_masks, z_masks, coeffs = _pauli_masks(terms)
+    dim = 2 ** n
+    k = np.arange(dim)
+    rows, cols, data = [], [], []
+    for x, z, c in zip(x_masks.tolist(), z_masks.tolist(), coeffs.tolist()):
+        signs = 1.0 - 2.0 * (pauly._popcount(k & z, n) & 1)
+        rows.append(k ^ x)
+        cols.append(k)
+        data.append(c * signs)
+    H = sp.coo_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(dim, dim),
+    )
+    return H.tocsr()
+
+
+def _fock_to_sparse(terms: List[FockTerm]) -> sp.csr_matrix:
+    """
+    Assemble Σ c Π_m O_m as a CSR matrix over all modes, mode 0 being the
+    most significant Kronecker factor (the first axis of a Fock ket).
+    """
+    n_modes, cutoff = _fock_shape(terms)
+    eye = sp.identity(cutoff, dtype=complex, format="csr")
+    H = sp.csr_matrix((cutoff ** n_modes, cutoff ** n_modes), dtype=complex)
+    for coeff, factors in terms:
+        local = dict(factors)
+        term = sp.csr_matrix(np.ones((1, 1), dtype=complex) * coeff)
+        for mode in range(n_modes):
+            term = sp.kron(term, sp.csr_matrix(local[mode]) if mode in local else eye, format="csr")
+        H = H + term
+    return H
+
+
+def _to_matrix(hamiltonian: Hamiltonian, kind: str) -> Union[np.ndarray, sp.csr_matrix]:
+    """Matrix form of any representation; Pauli and Fock sums become sparse."""
+    if kind == "pauli":
+        return _pauli_to_sparse(hamiltonian)
+    if kind == "fock":
+        return _fock_to_sparse(hamiltonian)
+    return hamiltonian
@@ -0,0 +1,158 @@
+import os
+import uuid
+from typing import Optional, Tuple
+import numpy as np
+
+
+class _Column:
+    """
+    Append-only float64 buffer of rows with a fixed trailing shape, held
+    in memory or in a memory-mapped file. Capacity doubles when full, so
+    appends are amortised O(1); in memory, growing briefly holds the old
+    and the new buffer, and up to half of the buffer is spare capacity
+    until trim().
+    """
+
+    def __init__(self, row_shape: Tuple[int, ...], capacity: int, path: Optional[str] = None):
+        self.row_shape = row_shape
+        self.path = path
+        self.size = 0
+        self._data = self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        shape = (capacity,) + self.row_shape
+        if self.path is None:
+            return np.empty(shape)
+        nbytes = int(np.prod(shape)) * 8
+        with open(self.path, "ab") as f:
+            f.truncate(nbytes)
+        return np.memmap(self.path, dtype=np.float64, mode="r+", shape=shape)
+
+    def append(self, row) -> None:
+        if self.size == len(self._data):
+            if self.path is None:
+                grown = self._allocate(2 * self.size)
+                grown[:self.size] = self._data
+                self._data = grown
+            else:
+                # The file grows in place; earlier views keep their mapping
+                self._data.flush()
+                self._data = self._allocate(2 * self.size)
+        self._data[self.size] = row
+        self.size += 1
+
+    def trim(self) -> None:
+        """Shrink the buffer to the rows appended so far."""
+        capacity = max(1, self.size)
+        if len(self._data) == capacity:
+            return
+        if self.path is None:
+            self._data = self._data[:capacity].copy()
+        else:
+            # _allocate() truncates the file; views handed out so far never
+            # reach past size, so dropping the spare tail leaves them valid
+            self._data.flush()
+            self._data = self._allocate(capacity)
+
+    def view(self) -> np.ndarray:
+        """The rows appended so far, as a view (no copy)."""
+        return self._data[:self.size].view(np.ndarray)
+
+    def flush(self) -> None:
+        if isinstance(self._data, np.memmap):
+            self._data.flush()
+
+
+class HistoryRecorder:
+    """
+    Columnar store for per-iteration energies, parameter vectors and
+    gradient variances.
+
+    Columns are preallocated and grow by doubling, in memory or — with a
+    directory — as memory-mapped .f64 files, so long runs stay out of RAM.
+    Parameter vectors can be decimated: with param_stride=k only
+    iterations 1, 1+k, 1+2k, ... keep theirs. The best energy and its
+    parameters are always tracked exactly, whatever the stride.
+
+    Views returned by energies / params / gradient_variances share memory
+    with the recorder; start a new recorder for the next run instead of
+    reusing one. Call trim() before handing the views out for good, so
+    they do not pin the spare capacity of the buffers.
+    """
+
+    def __init__(self, param_stride: int = 1, capacity: int = 1024, directory: Optional[str] = None):
+        """
+        Args:
+            param_stride: Keep every param_stride-th parameter vector.
+            capacity:     Initial rows per column.
+            directory:    Memory-map the columns into files in this
+                          directory (one file set per recorder).
+        """
+        if param_stride < 1:
+            raise ValueError(f"param_stride must be >= 1, got {param_stride}.")
+        self.param_stride = param_stride
+        self.capacity = capacity
+        self.directory = directory
+        self._prefix = None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._prefix = os.path.join(directory, f"history-{uuid.uuid4().hex[:12]}")
+        self._energies = _Column((), capacity, self._path("energies"))
+        self._variances = _Column((), capacity, self._path("gradient_variances"))
+        self._params: Optional[_Column] = None
+        self.iterations = 0
+        self.best_energy = np.inf
+        self.best_params: Optional[np.ndarray] = None
+
+    def _path(self, column: str) -> Optional[str]:
+        return None if self._prefix is None else f"{self._prefix}-{column}.f64"
+
+    def record(self, params: np.ndarray, energy: float) -> int:
+        """Append one iteration; returns its 1-based iteration number."""
+        params = np.asarray(params, dtype=float).reshape(-1)
+        if self._params is None:
+            rows = max(1, self.capacity // self.param_stride)
+            self._params = _Column(params.shape, rows, self._path("params"))
+        self._energies.append(energy)
+        if self.iterations % self.param_stride == 0:
+            self._params.append(params)
+        self.iterations += 1
+        if energy < self.best_energy or self.best_params is None:
+            self.best_energy = float(energy)
+            self.best_params = params.copy()
+        return self.iterations
+
+    def record_gradient_variance(self, variance: float) -> None:
+        self._variances.append(variance)
+
+    @property
+    def energies(self) -> np.ndarray:
+        return self._energies.view()
+
+    @property
+    def params(self) -> np.ndarray:
+        """Kept parameter vectors, shape (ceil(iterations / stride), P)."""
+        if self._params is None:
+            return np.empty((0, 0))
+        return self._params.view()
+
+    @property
+    def param_iterations(self) -> np.ndarray:
+        """1-based iteration number of every row of params."""
+        return np.arange(1, self.iterations + 1, self.param_stride)[:len(self.params)]
+
+    @property
+    def gradient_variances(self) -> np.ndarray:
+        return self._variances.view()
+
+    def trim(self) -> None:
+        """Shrink every column to its rows (written through to the files)."""
+        for column in (self._energies, self._variances, self._params):
+            if column is not None:
+                column.trim()
+
+    def flush(self) -> None:
+        """Write memory-mapped columns through to their files."""
+        for column in (self._energies, self._variances, self._params):
+            if column is not None:
+                column.flush()
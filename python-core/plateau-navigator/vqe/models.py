@@ -0,0 +1,114 @@
+from typing import List, Tuple, Union
+import numpy as np
+import scipy.sparse as sp
+from . import hamiltonian as ham
+
+# Benchmark Hamiltonians built term by term, in O(n) for Pauli and Fock
+# sums and O(n · 2^n) for sparse matrices — never as dense arrays.
+# Pauli strings follow the package convention: leftmost char = qubit n-1.
+
+_KINDS = ("pauli", "sparse")
+
+
+def transverse_ising(
+        n: int,
+        J: float = 1.0,
+        h: float = 1.0,
+        periodic: bool = False,
+        kind: str = "pauli"
+) -> Union[List[Tuple[str, complex]], sp.csr_matrix]:
+    """H = -J Σ Z_i Z_{i+1} - h Σ X_i"""
+    terms = [(_label(n, {i: "Z", j: "Z"}), -J) for i, j in _bonds(n, periodic)]
+    terms += [(_label(n, {i: "X"}), -h) for i in range(n)]
+    return _emit(terms, kind)
+
+
+def xxz(
+        n: int,
+        J: float = 1.0,
+        delta: float = 1.0,
+        h: float = 0.0,
+        periodic: bool = False,
+        kind: str = "pauli"
+) -> Union[List[Tuple[str, complex]], sp.csr_matrix]:
+    """H = J Σ (X_i X_{i+1} + Y_i Y_{i+1} + Δ Z_i Z_{i+1}) + h Σ Z_i"""
+    terms = []
+    for i, j in _bonds(n, periodic):
+        terms.append((_label(n, {i: "X", j: "X"}), J))
+        terms.append((_label(n, {i: "Y", j: "Y"}), J))
+        if delta:
+            terms.append((_label(n, {i: "Z", j: "Z"}), J * delta))
+    if h:
+        terms += [(_label(n, {i: "Z"}), h) for i in range(n)]
+    return _emit(terms, kind)
+
+
+def heisenberg(
+        n: int,
+        J: float = 1.0,
+        h: float = 0.0,
+        periodic: bool = False,
+        kind: str = "pauli"
+) -> Union[List[Tuple[str, complex]], sp.csr_matrix]:
+    """Isotropic XXX chain: xxz() with Δ = 1."""
+    return xxz(n, J=J, delta=1.0, h=h, periodic=periodic, kind=kind)
+
+
+def bose_hubbard(
+        n_modes: int,
+        cutoff: int,
+        t: float = 1.0,
+        U: float = 1.0,
+        mu: float = 0.0,
+        periodic: bool = False
+) -> List[ham.FockTerm]:
+    """
+    H = -t Σ (a_i† a_j + a_j† a_i) + U/2 Σ n_i (n_i - 1) - μ Σ n_i
+
+    as a Fock sum of (cutoff, cutoff) local operators, the form
+    StrawberryFieldsBackend.compute_expectation() accepts. Hopping uses
+    a_i† a_j + a_j† a_i = X_i X_j + P_i P_j, so every factor is Hermitian.
+    """
+    if cutoff < 2:
+        raise ValueError(f"cutoff must be >= 2, got {cutoff}.")
+    a = np.diag(np.sqrt(np.arange(1, cutoff, dtype=complex)), k=1)
+    x = (a + a.conj().T) / np.sqrt(2)
+    p = -1j * (a - a.conj().T) / np.sqrt(2)
+    n_op = np.diag(np.arange(cutoff, dtype=float)).astype(complex)
+    onsite = U / 2 * n_op @ (n_op - np.eye(cutoff)) - mu * n_op
+
+    terms: List[ham.FockTerm] = []
+    if t and n_modes > 1:
+        for i, j in _bonds(n_modes, periodic):
+            terms.append((-t, ((i, x), (j, x))))
+            terms.append((-t, ((i, p), (j, p))))
+    terms += [(1.0, ((i, onsite),)) for i in range(n_modes)]
+    return terms
+
+
+def _bonds(n: int, periodic: bool) -> List[Tuple[int, int]]:
+    if n < 2:
+        raise ValueError(f"A chain needs at least 2 sites, got {n}.")
+    bonds = [(i, i + 1) for i in range(n - 1)]
+    if periodic and n > 2:
+        bonds.append((n - 1, 0))
+    return bonds
+
+
+def _label(n: int, ops: dict) -> str:
+    chars = ["I"] * n
+    for q, pauli in ops.items():
+        chars[n - 1 - q] = pauli
+    return "".join(chars)
+
+
+def _emit(
+        terms: List[Tuple[str, float]],
+        kind: str
+) -> Union[List[Tuple[str, complex]], sp.csr_matrix]:
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown kind: {kind}. Must be one of {_KINDS}.")
+    terms = [(label, complex(c)) for label, c in terms]
+    if kind == "sparse":
+        return ham._pauli_to_sparse(terms)
+    return terms
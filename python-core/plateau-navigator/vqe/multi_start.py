@@ -0,0 +1,230 @@
+import math
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from . import hamiltonian as ham
+from .multi_start_result import MultiStartResult
+from .optimizer_type import OptimizerType
+from .vqe import VQE, EarlyStop
+from .vqe_result import VQEResult
+
+# Per-process state set by _init_worker(): vqe, board
+_WORKER: Dict[str, Any] = {}
+
+
+class _Scoreboard:
+    """
+    Best energy and iteration count of every start, shared by all workers
+    (through RawArray buffers in process mode).
+
+    A start is dominated once it has spent `warmup` iterations and its
+    best energy is more than `margin` above the keep-th best among all
+    starts past warm-up — i.e. at least `keep` starts beat it clearly.
+    """
+
+    def __init__(self, best: np.ndarray, iterations: np.ndarray, warmup: int, keep: int, margin: float):
+        self.best = best
+        self.iterations = iterations
+        self.warmup = warmup
+        self.keep = keep
+        self.margin = margin
+
+    def update(self, start: int, iteration: int, energy: float) -> None:
+        self.iterations[start] = iteration
+        if energy < self.best[start]:
+            self.best[start] = energy
+
+    def finish(self, start: int) -> None:
+        # A start that converged during warm-up still counts as evidence
+        self.iterations[start] = max(self.iterations[start], self.warmup)
+
+    def dominated(self, start: int) -> bool:
+        if self.iterations[start] < self.warmup:
+            return False
+        known = self.best[self.iterations >= self.warmup]
+        if len(known) <= self.keep:
+            return False
+        threshold = np.partition(known, self.keep - 1)[self.keep - 1]
+        return bool(self.best[start] > threshold + self.margin)
+
+
+def _init_worker(
+    backend_factory: Callable[[], Any],
+    size: int,
+    hamiltonian: Any,
+    ansatz: Callable,
+    vqe_kwargs: Dict[str, Any],
+    buffers: Tuple[Any, Any],
+    board_args: Tuple[int, int, float],
+) -> None:
+    backend = backend_factory()
+    backend.create_circuit(size)
+    _WORKER["vqe"] = VQE(backend, hamiltonian, ansatz, verbose=False, **vqe_kwargs)
+    best, iterations = (np.frombuffer(b, dtype=d) for b, d in zip(buffers, (np.float64, np.int64)))
+    _WORKER["board"] = _Scoreboard(best, iterations, *board_args)
+
+
+def _worker_start(args: Tuple[int, np.ndarray, OptimizerType, int, float]) -> Tuple[VQEResult, bool]:
+    return _run_start(_WORKER["vqe"], _WORKER["board"], *args)
+
+
+def _run_start(
+    vqe: VQE,
+    board: _Scoreboard,
+    start: int,
+    initial_params: np.ndarray,
+    optimizer: OptimizerType,
+    max_iter: int,
+    tol: float,
+) -> Tuple[VQEResult, bool]:
+    culled = []
+
+    def callback(iteration, energy, params, grads):
+        board.update(start, iteration, energy)
+        if board.dominated(start):
+            culled.append(iteration)
+            raise EarlyStop(
+                f"Culled at iteration {iteration}: best energy "
+                f"{board.best[start]:+.6f} dominated by other starts"
+            )
+
+    result = vqe.run(initial_params, optimizer=optimizer, max_iter=max_iter, tol=tol, callback=callback)
+    board.finish(start)
+    return result, bool(culled)
+
+
+class MultiStartVQE:
+    """
+    Runs VQE from many initial parameter vectors and culls hopeless starts.
+
+    Starts run concurrently on n_workers processes (each with its own
+    backend from backend_factory), or one after another in this process
+    when n_workers=1. Every start reports its best energy to a shared
+    scoreboard after each iteration; once past `warmup` iterations, a
+    start whose best energy is more than `margin` worse than that of
+    ceil(keep_fraction · N) other starts is stopped. Its partial result
+    is kept, so energy trajectories of all starts remain available.
+
+    Usage:
+        ms = MultiStartVQE(backend, H, ansatz, n_workers=8,
+                           backend_factory=NumpyStatevectorBackend,
+                           gradient_method="adjoint")
+        x0 = np.random.default_rng(0).uniform(0, 2 * np.pi, (32, n_params))
+        result = ms.run(x0, optimizer=OptimizerType.L_BFGS_B)
+        result.best.optimal_energy
+    """
+
+    def __init__(
+            self,
+            backend,
+            hamiltonian: ham.Hamiltonian,
+            ansatz: Callable,
+            n_workers: int = 1,
+            backend_factory: Optional[Callable[[], Any]] = None,
+            warmup: int = 20,
+            keep_fraction: float = 0.25,
+            margin: float = 1e-3,
+            verbose: bool = True,
+            **vqe_kwargs
+    ):
+        """
+        Args:
+            backend:         Backend used when n_workers=1; its qubit/mode
+                             count sizes the worker backends otherwise.
+            n_workers:       Worker processes running starts concurrently.
+            backend_factory: Picklable zero-argument backend factory,
+                             required when n_workers > 1.
+            warmup:          Iterations every start gets before it can be
+                             culled.
+            keep_fraction:   Fraction of starts (at least one) that can
+                             never be culled by the ones below them.
+            margin:          Energy gap to the keep-th best start that
+                             counts as "clearly dominated". Use
+                             float('inf') to disable culling.
+            **vqe_kwargs:    Forwarded to every VQE (gradient_method,
+                             cache_size, compile_ansatz, ...).
+        """
+        if n_workers > 1 and backend_factory is None:
+            raise ValueError(
+                "n_workers > 1 requires a picklable backend_factory that "
+                "builds a backend configured like `backend`."
+            )
+        if not 0.0 < keep_fraction <= 1.0:
+            raise ValueError(f"keep_fraction must be in (0, 1], got {keep_fraction}.")
+        self.backend = backend
+        self.hamiltonian, _ = ham._normalize_hamiltonian(hamiltonian)
+        self.ansatz = ansatz
+        self.n_workers = n_workers
+        self.backend_factory = backend_factory
+        self.warmup = warmup
+        self.keep_fraction = keep_fraction
+        self.margin = margin
+        self.verbose = verbose
+        self.vqe_kwargs = vqe_kwargs
+
+    def run(
+            self,
+            initial_params: np.ndarray,
+            optimizer: OptimizerType = OptimizerType.COBYLA,
+            max_iter: int = 1000,
+            tol: float = 1e-6
+    ) -> MultiStartResult:
+        """
+        Args:
+            initial_params: Array of shape (n_starts, n_params), one start
+                            per row.
+        """
+        initial_params = np.asarray(initial_params, dtype=float)
+        if initial_params.ndim != 2 or not len(initial_params):
+            raise ValueError(
+                f"initial_params must have shape (n_starts, n_params), got {initial_params.shape}."
+            )
+        start_time = time()
+        n_starts = len(initial_params)
+        keep = max(1, math.ceil(self.keep_fraction * n_starts))
+        board_args = (self.warmup, keep, self.margin)
+        if self.verbose:
+            print(f"Multi-start VQE: {n_starts} starts, {max(1, self.n_workers)} worker(s), "
+                  f"warm-up {self.warmup} iterations, keeping top {keep}")
+
+        tasks = [(i, x0, optimizer, max_iter, tol) for i, x0 in enumerate(initial_params)]
+        if self.n_workers <= 1:
+            board = _Scoreboard(
+                np.full(n_starts, np.inf), np.zeros(n_starts, dtype=np.int64), *board_args
+            )
+            vqe = VQE(self.backend, self.hamiltonian, self.ansatz, verbose=False, **self.vqe_kwargs)
+            outputs = [_run_start(vqe, board, *task) for task in tasks]
+        else:
+            best = mp.RawArray("d", n_starts)
+            np.frombuffer(best, dtype=np.float64)[:] = np.inf
+            iterations = mp.RawArray("q", n_starts)
+            size = self.backend.n_qubits if hasattr(self.backend, "n_qubits") else self.backend.n_modes
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.backend_factory, size, self.hamiltonian, self.ansatz,
+                    self.vqe_kwargs, (best, iterations), board_args,
+                ),
+            ) as pool:
+                outputs = list(pool.map(_worker_start, tasks))
+
+        results = [result for result, _ in outputs]
+        culled = [i for i, (_, was_culled) in enumerate(outputs) if was_culled]
+        best_index = int(np.argmin([r.optimal_energy for r in results]))
+        multi = MultiStartResult(
+            results=results,
+            best=results[best_index],
+            best_index=best_index,
+            culled=culled,
+            execution_time=time() - start_time,
+        )
+        if self.verbose:
+            print(f"Best energy: {multi.best.optimal_energy:+.8f} (start {best_index})")
+            print(f"Culled starts: {len(culled)}/{n_starts}")
+            print(f"Energy evaluations: {multi.energy_evaluations}")
+        return multi
@@ -0,0 +1,42 @@
+from dataclasses import field, dataclass
+from typing import List, Any, Dict
+
+import numpy as np
+
+from .vqe_result import VQEResult
+
+
+@dataclass
+class MultiStartResult:
+    """
+    Outcome of MultiStartVQE.run(): one VQEResult per start, in input
+    order, plus the best of them. Culled starts keep their partial
+    energy trajectories and report success=False.
+    """
+
+    results: List[VQEResult]
+    best: VQEResult
+    best_index: int
+    culled: List[int] = field(default_factory=list)
+    execution_time: float = 0.0
+
+    @property
+    def energies(self) -> np.ndarray:
+        """Final (best) energy of every start."""
+        return np.array([r.optimal_energy for r in self.results])
+
+    @property
+    def energy_evaluations(self) -> int:
+        """Energy evaluations summed over all starts."""
+        return sum(r.energy_evaluations for r in self.results)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'best_index': self.best_index,
+            'best': self.best.to_dict(),
+            'energies': self.energies.tolist(),
+            'culled': list(self.culled),
+            'energy_evaluations': self.energy_evaluations,
+            'execution_time': self.execution_time,
+            'results': [r.to_dict() for r in self.results],
+        }
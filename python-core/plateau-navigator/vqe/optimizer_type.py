@@ -7,4 +7,11 @@ class OptimizerType(Enum):
     BFGS = "BFGS"
     L_BFGS_B = "L-BFGS-B"
     NELDER_MEAD = "Nelder-Mead"
-    POWELL = "Powell"
\ No newline at end of file
+    POWELL = "Powell"
+    # Native stochastic optimizers (vqe/spsa.py), 2 or 4 energies/iteration
+    SPSA = "SPSA"
+    SPSA2 = "2-SPSA"
+    # Ask/tell optimizers (vqe/ask_tell.py), one batch per generation
+    CMA_ES = "CMA-ES"
+    # Quantum natural gradient descent with a block-diagonal metric
+    NATURAL_GRADIENT = "natural_gradient"
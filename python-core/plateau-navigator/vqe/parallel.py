@@ -0,0 +1,73 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+
+# Per-process state set by _init_worker(): backend, ansatz, hamiltonian
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(backend_factory: Callable[[], Any], size: int, ansatz: Callable, hamiltonian: Any) -> None:
+    backend = backend_factory()
+    backend.create_circuit(size)
+    _WORKER["backend"] = backend
+    _WORKER["ansatz"] = ansatz
+    _WORKER["hamiltonian"] = hamiltonian
+
+
+def _worker_batch(param_sets: np.ndarray) -> np.ndarray:
+    backend = _WORKER["backend"]
+    return np.asarray(
+        backend.batch_expectation(param_sets, _WORKER["hamiltonian"], _WORKER["ansatz"]),
+        dtype=float,
+    )
+
+
+class ParallelEvaluator:
+    """
+    Process pool in which every worker owns a backend built from a
+    picklable factory, for fanning batch_expectation() rows out over cores.
+
+    The ansatz and Hamiltonian are shipped once, when the workers start;
+    each call then only sends parameter rows and receives energies.
+    """
+
+    def __init__(
+        self,
+        backend_factory: Callable[[], Any],
+        size: int,
+        ansatz: Callable,
+        hamiltonian: Any,
+        n_workers: int,
+    ):
+        """
+        Args:
+            backend_factory: Zero-argument callable returning a fresh,
+                             identically configured backend (a class or
+                             functools.partial defined at module level).
+            size:            Qubit (DV) or mode (CV) count passed to
+                             create_circuit() in every worker.
+            n_workers:       Number of worker processes.
+        """
+        if n_workers < 2:
+            raise ValueError(f"n_workers must be >= 2, got {n_workers}.")
+        self.n_workers = n_workers
+        self._pool: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(backend_factory, size, ansatz, hamiltonian),
+        )
+
+    def batch_expectation(self, param_sets: np.ndarray) -> np.ndarray:
+        """Energies of every row, split into one contiguous chunk per worker."""
+        if self._pool is None:
+            raise RuntimeError("ParallelEvaluator is closed.")
+        param_sets = np.asarray(param_sets, dtype=float)
+        if not len(param_sets):
+            return np.empty(0)
+        chunks = [c for c in np.array_split(param_sets, self.n_workers) if len(c)]
+        return np.concatenate(list(self._pool.map(_worker_batch, chunks)))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -0,0 +1,135 @@
+from typing import Any, Callable, Optional, Tuple
+import numpy as np
+
+_ACTIONS = ("stop", "reinitialize", "reduce")
+
+
+class PlateauPolicy:
+    """
+    What VQE.run() does once plateau detection fires `patience` times in a
+    row (any gradient above threshold resets the streak):
+
+        "stop":          end the run with the best point so far.
+        "reinitialize":  restart the optimizer from a fresh uniform draw
+                         in [-init_scale, init_scale].
+        "reduce":        restart on a layerwise reduced ansatz: only the
+                         first half of the currently trained layers (of
+                         layer_size parameters each) get a fresh draw, the
+                         rest are frozen at 0, so their rotations act as
+                         identities and the circuit is effectively shallower.
+                         With one layer left it re-draws that layer.
+
+    After max_restarts restarts the next trigger stops the run. Plateaus
+    are only detected where gradients exist (gradient-based SciPy methods,
+    SPSA / 2-SPSA and natural_gradient), so the policy is inert for
+    gradient-free methods.
+    """
+
+    def __init__(
+            self,
+            patience: int = 3,
+            action: str = "stop",
+            max_restarts: int = 2,
+            init_scale: float = np.pi,
+            layer_size: Optional[int] = None,
+            seed: Optional[int] = None
+    ):
+        if action not in _ACTIONS:
+            raise ValueError(f"Unknown plateau action: {action}. Must be one of {_ACTIONS}.")
+        if patience < 1:
+            raise ValueError(f"patience must be >= 1, got {patience}.")
+        if action == "reduce" and (layer_size is None or layer_size < 1):
+            raise ValueError("The 'reduce' action needs layer_size, the number of parameters per layer.")
+        self.patience = patience
+        self.action = action
+        self.max_restarts = max_restarts
+        self.init_scale = init_scale
+        self.layer_size = layer_size
+        self.seed = seed
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Start a new run; seed overrides the policy's own seed."""
+        self.streak = 0
+        self.restarts = 0
+        self._rng = np.random.default_rng(self.seed if seed is None else seed)
+
+    def observe(self, detected: bool) -> Optional[str]:
+        """Feed one plateau check; returns the action to take, if any."""
+        self.streak = self.streak + 1 if detected else 0
+        if self.streak < self.patience:
+            return None
+        self.streak = 0
+        if self.action == "stop" or self.restarts >= self.max_restarts:
+            return "stop"
+        self.restarts += 1
+        return self.action
+
+    def restart(self, action: str, active: np.ndarray) -> np.ndarray:
+        """
+        Indices of the parameters trained after a restart, given the ones
+        trained so far; the caller draws them with draw().
+        """
+        if action == "reinitialize":
+            return active
+        n_layers = -(-len(active) // self.layer_size)
+        keep = max(1, n_layers // 2) * self.layer_size
+        return active[:keep]
+
+    def draw(self, n: int) -> np.ndarray:
+        return self._rng.uniform(-self.init_scale, self.init_scale, n)
+
+    def __repr__(self) -> str:
+        return (
+            f"PlateauPolicy(patience={self.patience}, action={self.action!r}, "
+            f"max_restarts={self.max_restarts}, init_scale={self.init_scale}, "
+            f"layer_size={self.layer_size}, seed={self.seed})"
+        )
+
+
+class ReducedAnsatz:
+    """
+    ansatz(backend, full) restricted to the parameters at `active`; all
+    others are fixed at the values in `template`. Works on traced
+    (object-dtype) parameters too, so reduced ansätze still compile.
+    """
+
+    def __init__(self, ansatz: Callable, template: np.ndarray, active: np.ndarray):
+        self.ansatz = ansatz
+        self.template = np.asarray(template, dtype=float)
+        self.active = np.asarray(active, dtype=int)
+
+    def full(self, params: np.ndarray) -> np.ndarray:
+        params = np.asarray(params)
+        full = self.template.astype(np.result_type(params.dtype, self.template.dtype))
+        full[self.active] = params
+        return full
+
+    def __call__(self, backend: Any, params: np.ndarray) -> Any:
+        return self.ansatz(backend, self.full(params))
+
+
+class PlateauRestart(Exception):
+    """Raised inside VQE.run() to restart the optimizer from `params`."""
+
+    def __init__(self, params: np.ndarray):
+        super().__init__("restart")
+        self.params = params
+
+
+def restart_point(
+        policy: PlateauPolicy,
+        action: str,
+        ansatz: Callable,
+        n_params: int,
+        current: Optional[ReducedAnsatz]
+) -> Tuple[np.ndarray, Optional[ReducedAnsatz]]:
+    """
+    Starting parameters (in the trained subspace) and the reduced ansatz,
+    if any, for a restart; `ansatz` is the full, unreduced one.
+    """
+    active = current.active if current is not None else np.arange(n_params)
+    active = policy.restart(action, active)
+    if len(active) == n_params:
+        return policy.draw(n_params), None
+    return policy.draw(len(active)), ReducedAnsatz(ansatz, np.zeros(n_params), active)
@@ -0,0 +1,289 @@
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from time import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .sweep_result import SWEEP_RECORD_DTYPE, SweepResult
+
+_GRADIENT_METHODS = ("auto", "parameter_shift", "finite_diff", "adjoint")
+
+# Backends built inside this process, keyed by (sweep id, backend, size)
+# so a worker reuses one backend for every chunk of a cell
+_PROCESS_BACKENDS: Dict[Tuple[str, str, int], Any] = {}
+
+
+@dataclass(frozen=True)
+class AnsatzSpec:
+    """
+    An ansatz family for sweeps.
+
+    ansatz(backend, params) queues the circuit and must infer its depth
+    from len(params) and backend.n_qubits / backend.n_modes;
+    n_params(size, layers) gives the parameter count for one grid cell.
+    """
+
+    ansatz: Callable
+    n_params: Callable[[int, int], int]
+
+
+@dataclass(frozen=True)
+class _Task:
+    sweep_id: str
+    cell: int
+    start: int
+    backend_name: str
+    backend_factory: Callable[[], Any]
+    circuit_options: Dict[str, Any]
+    ansatz: Callable
+    observable: Any
+    size: int
+    params: np.ndarray
+    method: str
+    batch_size: int
+
+
+class GradientVarianceSweep:
+    """
+    Barren-plateau study: Var[∂E/∂θ_k] over random parameters, on a grid of
+    (backend, ansatz, size, layers).
+
+    size is the qubit count for DVBackend factories and the mode count for
+    CVBackend factories. For every cell, n_samples parameter vectors are
+    drawn uniformly from param_range and the full gradient of each is
+    computed with batched evaluation — all shifted circuits of a chunk of
+    samples go to backend.batch_expectation() in one call. Chunks are
+    spread across a process pool.
+
+    Backends are passed as zero-argument factories (a class, or a
+    functools.partial) so every worker builds its own instance; with
+    n_workers > 1 factories, ansatz callables and observable builders must
+    be picklable, i.e. defined at module level. DV and CV backends usually
+    need different Hamiltonians, so observable may map backend labels to
+    their own builders; circuit_options passes extra create_circuit()
+    arguments per backend label, e.g. a CV cutoff_dim. To sweep a cutoff,
+    register the same factory under several labels.
+
+    Usage:
+        sweep = GradientVarianceSweep(
+            backends={"numpy": NumpyStatevectorBackend},
+            ansatze={"hea": AnsatzSpec(hea, lambda n, L: 2 * n * L)},
+            observable=global_z,
+            sizes=[2, 4, 6, 8],
+            layers=[1, 4, 16],
+        )
+        result = sweep.run(n_samples=200, seed=7)
+        result.decay_rate("numpy", "hea", 16)
+    """
+
+    def __init__(
+            self,
+            backends: Dict[str, Callable[[], Any]],
+            ansatze: Dict[str, AnsatzSpec],
+            observable: Union[Callable[[int], Any], Dict[str, Callable[[int], Any]]],
+            sizes: Sequence[int],
+            layers: Sequence[int],
+            gradient_method: str = "auto",
+            param_range: Tuple[float, float] = (0.0, 2 * np.pi),
+            circuit_options: Optional[Dict[str, Dict[str, Any]]] = None,
+            verbose: bool = True
+    ):
+        """
+        Args:
+            backends:        Label -> zero-argument backend factory.
+            ansatze:         Label -> AnsatzSpec.
+            observable:      observable(size) -> Hamiltonian accepted by
+                             the backends' batch_expectation(), or a dict
+                             of such builders, one per backend label.
+            sizes:           Qubit (DV) or mode (CV) counts.
+            layers:          Ansatz depths.
+            gradient_method: 'parameter_shift', 'finite_diff', 'adjoint',
+                             or 'auto' — parameter shift on DV backends,
+                             finite differences on CV backends, whose
+                             gates have no two-term shift rule in general.
+            param_range:     (low, high) of the uniform parameter prior.
+            circuit_options: Backend label -> keyword arguments for
+                             create_circuit(), e.g. {"sf": {"cutoff_dim": 6}}.
+        """
+        if gradient_method not in _GRADIENT_METHODS:
+            raise ValueError(
+                f"Unknown gradient method: {gradient_method}. "
+                f"Must be one of {_GRADIENT_METHODS}."
+            )
+        if not backends or not ansatze or not len(sizes) or not len(layers):
+            raise ValueError("Sweep grid is empty.")
+        if isinstance(observable, dict):
+            missing = sorted(set(backends) - set(observable))
+            if missing:
+                raise ValueError(f"No observable builder for backends {missing}.")
+        circuit_options = dict(circuit_options or {})
+        unknown = sorted(set(circuit_options) - set(backends))
+        if unknown:
+            raise ValueError(f"circuit_options given for unknown backends {unknown}.")
+        self.backends = dict(backends)
+        self.ansatze = dict(ansatze)
+        self.observable = observable
+        self.circuit_options = circuit_options
+        self.sizes = [int(s) for s in sizes]
+        self.layers = [int(L) for L in layers]
+        self.gradient_method = gradient_method
+        self.param_range = param_range
+        self.verbose = verbose
+
+    def run(
+            self,
+            n_samples: int = 100,
+            n_workers: Optional[int] = None,
+            batch_size: int = 512,
+            seed: Optional[int] = None
+    ) -> SweepResult:
+        """
+        Args:
+            n_samples:  Random parameter draws per cell.
+            n_workers:  Worker processes; None uses os.cpu_count(), and
+                        0 or 1 runs serially in this process.
+            batch_size: Maximum circuits per batch_expectation() call,
+                        bounding the (batch, 2^n) statevector stack.
+            seed:       Seeds the parameter draws. Each cell gets its own
+                        child stream, so results do not depend on
+                        n_workers or on which cells are in the grid.
+        """
+        if n_samples < 2:
+            raise ValueError(f"n_samples must be >= 2 to estimate a variance, got {n_samples}.")
+        start_time = time()
+        cells = [
+            (b, a, n, L)
+            for b in self.backends
+            for a in self.ansatze
+            for n in self.sizes
+            for L in self.layers
+        ]
+        seeds = np.random.SeedSequence(seed).spawn(len(cells))
+        sweep_id = uuid.uuid4().hex
+        # Keyed by (backend label, size), or (None, size) for a shared builder
+        observables: Dict[Tuple[Optional[str], int], Any] = {}
+        tasks: List[_Task] = []
+        n_params: List[int] = []
+        for cell, ((b, a, n, L), cell_seed) in enumerate(zip(cells, seeds)):
+            spec = self.ansatze[a]
+            P = int(spec.n_params(n, L))
+            n_params.append(P)
+            if isinstance(self.observable, dict):
+                obs_key, builder = (b, n), self.observable[b]
+            else:
+                obs_key, builder = (None, n), self.observable
+            if obs_key not in observables:
+                observables[obs_key] = builder(n)
+            low, high = self.param_range
+            draws = np.random.default_rng(cell_seed).uniform(low, high, (n_samples, P))
+            method = self._resolve_method(self.backends[b])
+            # Parameter shift and finite differences need 2P circuits/sample
+            per_chunk = max(1, batch_size // max(1, 2 * P)) if method != "adjoint" else n_samples
+            for start in range(0, n_samples, per_chunk):
+                tasks.append(_Task(
+                    sweep_id, cell, start, b, self.backends[b], self.circuit_options.get(b, {}),
+                    spec.ansatz, observables[obs_key], n, draws[start:start + per_chunk], method, batch_size,
+                ))
+
+        if self.verbose:
+            print(f"Gradient-variance sweep: {len(cells)} cells, {n_samples} samples/cell, "
+                  f"{len(tasks)} tasks")
+
+        gradients = [np.empty((n_samples, P)) for P in n_params]
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers <= 1:
+            outputs = map(_run_task, tasks)
+            for task, grads in zip(tasks, outputs):
+                gradients[task.cell][task.start:task.start + len(grads)] = grads
+            _PROCESS_BACKENDS.clear()
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                # Cells are contiguous in tasks; chunksize 1 keeps the
+                # pool balanced when cell costs differ by orders of magnitude
+                for task, grads in zip(tasks, pool.map(_run_task, tasks)):
+                    gradients[task.cell][task.start:task.start + len(grads)] = grads
+
+        records = np.empty(len(cells), dtype=SWEEP_RECORD_DTYPE)
+        param_variances = []
+        for cell, ((b, a, n, L), grads) in enumerate(zip(cells, gradients)):
+            var = np.var(grads, axis=0, ddof=1)
+            param_variances.append(var)
+            records[cell] = (
+                b, a, n, L, grads.shape[1], n_samples,
+                var.mean() if var.size else np.nan,
+                var.min() if var.size else np.nan,
+                var.max() if var.size else np.nan,
+                np.abs(grads).mean() if grads.size else np.nan,
+            )
+            if self.verbose:
+                print(f"  {b:>12s} {a:>12s} size={n:<3d} layers={L:<3d} "
+                      f"Var[∂E] = {records[cell]['variance']:.3e}")
+
+        return SweepResult(
+            records=records,
+            param_variances=param_variances,
+            gradients=gradients,
+            gradient_method=self.gradient_method,
+            n_samples=n_samples,
+            seed=seed,
+            execution_time=time() - start_time,
+        )
+
+    def _resolve_method(self, backend_factory: Callable[[], Any]) -> str:
+        if self.gradient_method != "auto":
+            return self.gradient_method
+        # CV factories are recognised by class, without instantiating
+        cls = backend_factory if isinstance(backend_factory, type) else getattr(backend_factory, "func", None)
+        if isinstance(cls, type) and hasattr(cls, "n_modes"):
+            return "finite_diff"
+        return "parameter_shift"
+
+
+def _run_task(task: _Task) -> np.ndarray:
+    """Gradients of every parameter row in task.params, shape (K, P)."""
+    key = (task.sweep_id, task.backend_name, task.size)
+    backend = _PROCESS_BACKENDS.get(key)
+    if backend is None:
+        for stale in [k for k in _PROCESS_BACKENDS if k[0] != task.sweep_id]:
+            del _PROCESS_BACKENDS[stale]
+        backend = task.backend_factory()
+        backend.create_circuit(task.size, **task.circuit_options)
+        _PROCESS_BACKENDS[key] = backend
+    return _sample_gradients(
+        backend, task.ansatz, task.observable, task.params, task.method, task.batch_size
+    )
+
+
+def _sample_gradients(
+        backend,
+        ansatz: Callable,
+        observable: Any,
+        params: np.ndarray,
+        method: str,
+        batch_size: int = 512,
+) -> np.ndarray:
+    K, P = params.shape
+    if method == "adjoint":
+        return np.stack([
+            backend.adjoint_gradient(row, observable, ansatz)[1] for row in params
+        ])
+    if method == "parameter_shift":
+        shift = np.pi / 2
+        scale = 2 * np.sin(shift)
+    else:
+        shift = 1e-5
+        scale = 2 * shift
+    # Row (k, s, j): sample k, sign s ∈ {+, -}, shifted parameter j
+    shifts = shift * np.eye(P)
+    rows = np.stack([params[:, None, :] + shifts, params[:, None, :] - shifts], axis=1)
+    rows = rows.reshape(K * 2 * P, P)
+    energies = np.concatenate([
+        np.asarray(backend.batch_expectation(rows[i:i + batch_size], observable, ansatz), dtype=float)
+        for i in range(0, len(rows), batch_size)
+    ]) if len(rows) else np.empty(0)
+    energies = energies.reshape(K, 2, P)
+    return (energies[:, 0] - energies[:, 1]) / scale
@@ -0,0 +1,122 @@
+import json
+import os
+import threading
+from collections import defaultdict
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Trace events kept per run; totals and counters stay exact beyond it
+_MAX_EVENTS = 200_000
+
+
+class _Phase:
+    """Context manager timing one phase; nested phases are subtracted from self time."""
+
+    __slots__ = ("profiler", "name", "start", "child")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> "_Phase":
+        self.child = 0.0
+        self.profiler._stack.append(self)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *_) -> None:
+        end = perf_counter()
+        profiler = self.profiler
+        elapsed = end - self.start
+        profiler._stack.pop()
+        if profiler._stack:
+            profiler._stack[-1].child += elapsed
+        stats = profiler._phases[self.name]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed - self.child
+        if len(profiler._events) < profiler.max_events:
+            profiler._events.append((self.name, self.start, elapsed))
+        else:
+            profiler.dropped_events += 1
+
+
+class Profiler:
+    """
+    Named phase timers and counters for one VQE run.
+
+        with profiler.phase("simulate"):
+            ...
+        profiler.count("http_requests")
+
+    Unprofiled VQEs and backends use backends.profiling.NULL_PROFILER
+    instead, whose phases cost one method call. VQE lends its profiler to
+    the backend for the duration of run() (as backend.profiler), so
+    backend phases nest inside VQE phases; worker processes of a pool are
+    not profiled.
+
+    breakdown() reports, per phase, the call count, inclusive (total) and
+    exclusive (self) seconds; write_chrome_trace() writes every timed
+    phase as a Chrome trace / Perfetto JSON file.
+    """
+
+    enabled = True
+
+    def __init__(self, max_events: int = _MAX_EVENTS):
+        self.max_events = max_events
+        self.reset()
+
+    def reset(self) -> None:
+        # name -> [calls, total seconds, self seconds]
+        self._phases: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._events: List[Tuple[str, float, float]] = []
+        self._stack: List[_Phase] = []
+        self.dropped_events = 0
+        self._origin = perf_counter()
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self._counters[name] += n
+
+    def breakdown(self) -> Dict[str, Any]:
+        """Per-phase {calls, total, self, mean} (seconds) and counters, JSON-ready."""
+        phases = {
+            name: {
+                "calls": int(calls),
+                "total": total,
+                "self": own,
+                "mean": total / calls if calls else 0.0,
+            }
+            for name, (calls, total, own) in sorted(self._phases.items(), key=lambda kv: -kv[1][1])
+        }
+        return {
+            "phases": phases,
+            "counters": dict(self._counters),
+            "dropped_events": self.dropped_events,
+        }
+
+    def write_chrome_trace(self, path: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Write the timed phases as Chrome trace "complete" events (chrome://tracing, Perfetto)."""
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": elapsed * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, start, elapsed in self._events
+        ]
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as fh:
+            json.dump({
+                "traceEvents": events,
+                "displayTimeUnit": "ms",
+                "otherData": {**(metadata or {}), **self.breakdown()},
+            }, fh)
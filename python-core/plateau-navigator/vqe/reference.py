@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+import numpy as np
+from scipy.sparse.linalg import eigsh
+from . import hamiltonian as ham
+
+# Below this dimension exact diagonalisation densifies and uses eigh
+_DENSE_EIGH_MAX_DIM = 256
+
+# Pauli sums with more CSR nonzeros than this (T · 2^n) are diagonalised
+# matrix-free through a Pauli-sum matvec instead (~256 MiB of CSR data)
+_SPARSE_MAX_NNZ = 1 << 24
+
+# Solved spectra, keyed by Hamiltonian content hash, least recent first
+_cache: "OrderedDict[str, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+_max_entries = 8
+_hits = 0
+_misses = 0
+
+
+def configure(max_entries: int = 8) -> None:
+    """Set how many spectra are kept (0 disables caching); clears the cache."""
+    global _max_entries
+    _max_entries = max_entries
+    clear()
+
+
+def clear() -> None:
+    global _hits, _misses
+    _cache.clear()
+    _hits = _misses = 0
+
+
+def stats() -> Dict[str, Any]:
+    return {"entries": len(_cache), "max_entries": _max_entries, "hits": _hits, "misses": _misses}
+
+
+def lowest_eigenstates(hamiltonian: ham.Hamiltonian, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The k lowest eigenvalues of a Hamiltonian and their eigenvectors.
+
+    Small problems use dense eigh; larger ones use Lanczos (eigsh) on the
+    sparse matrix, or on a matrix-free Pauli-sum operator when the Pauli
+    sum's CSR form would be too large. Results are memoised by content
+    hash, so validating many runs against one Hamiltonian diagonalises it
+    once; a cached solve with at least k states serves any smaller k.
+
+    Args:
+        hamiltonian: Any representation accepted by VQE.
+        k:           Number of states, ground state first.
+    Returns:
+        (energies of shape (k,), ascending; states of shape (dim, k)).
+    """
+    global _hits, _misses
+    hamiltonian, kind = ham._normalize_hamiltonian(hamiltonian)
+    dim = ham._dimension(hamiltonian, kind)
+    if not 1 <= k <= dim:
+        raise ValueError(f"k must be in [1, {dim}], got {k}.")
+    key = ham._content_hash(hamiltonian, kind)
+    cached = _cache.get(key)
+    if cached is not None and len(cached[0]) >= k:
+        _hits += 1
+        _cache.move_to_end(key)
+        return cached[0][:k].copy(), cached[1][:, :k].copy()
+    _misses += 1
+    energies, states = _solve(hamiltonian, kind, dim, k)
+    if _max_entries > 0:
+        _cache[key] = (energies, states)
+        _cache.move_to_end(key)
+        while len(_cache) > _max_entries:
+            _cache.popitem(last=False)
+    return energies.copy(), states.copy()
+
+
+def _solve(hamiltonian: ham.Hamiltonian, kind: str, dim: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    if dim <= _DENSE_EIGH_MAX_DIM or k >= dim - 1:
+        H = ham._to_matrix(hamiltonian, kind)
+        H = H if isinstance(H, np.ndarray) else H.toarray()
+        energies, states = np.linalg.eigh(H)
+        return energies[:k], states[:, :k]
+    if kind == "pauli" and len(hamiltonian) * dim > _SPARSE_MAX_NNZ:
+        H = ham._pauli_operator(hamiltonian)
+    else:
+        H = ham._to_matrix(hamiltonian, kind)
+    energies, states = eigsh(H, k=k, which="SA")
+    order = np.argsort(energies)
+    return energies[order], states[:, order]
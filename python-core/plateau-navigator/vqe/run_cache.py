@@ -0,0 +1,192 @@
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import types
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+from . import hamiltonian as ham
+from .vqe_result import VQEResult
+
+# Bump when the fingerprint recipe changes, so stale entries never hit
+_FINGERPRINT_VERSION = 2
+
+
+class _Unhashable(Exception):
+    """A value an ansatz depends on has no stable, content-based digest."""
+
+
+def _hash_value(h, value: Any, seen: set) -> None:
+    """Feed a content digest of value into h, or raise _Unhashable."""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            raise _Unhashable(value)
+        h.update(f"ndarray:{value.dtype.str}:{value.shape};".encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.generic):
+        _hash_value(h, value.item(), seen)
+    elif isinstance(value, (tuple, list, frozenset, set)):
+        items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        h.update(f"{type(value).__name__}:{len(items)}(".encode())
+        for item in items:
+            _hash_value(h, item, seen)
+        h.update(b")")
+    elif isinstance(value, dict):
+        h.update(f"dict:{len(value)}(".encode())
+        for key in sorted(value, key=repr):
+            _hash_value(h, key, seen)
+            _hash_value(h, value[key], seen)
+        h.update(b")")
+    elif isinstance(value, types.ModuleType):
+        h.update(f"module:{value.__name__};".encode())
+    elif isinstance(value, types.CodeType):
+        _hash_code(h, value, seen)
+    elif isinstance(value, types.FunctionType):
+        _hash_function(h, value, seen)
+    elif isinstance(value, functools.partial):
+        h.update(b"partial(")
+        _hash_value(h, value.func, seen)
+        _hash_value(h, value.args, seen)
+        _hash_value(h, value.keywords, seen)
+        h.update(b")")
+    elif isinstance(value, (type, types.BuiltinFunctionType)):
+        h.update(f"{type(value).__name__}:{value.__module__}.{value.__qualname__};".encode())
+    else:
+        raise _Unhashable(value)
+
+
+def _hash_code(h, code: types.CodeType, seen: set) -> None:
+    # Nested code objects (lambdas, comprehensions) repr with their address
+    h.update(f"code:{code.co_name}:{code.co_argcount}:{code.co_kwonlyargcount};".encode())
+    h.update(code.co_code)
+    _hash_value(h, code.co_names, seen)
+    _hash_value(h, code.co_consts, seen)
+
+
+def _hash_function(h, fn: types.FunctionType, seen: set) -> None:
+    """Code, defaults, closure cells and referenced module globals of fn."""
+    h.update(f"function:{fn.__module__}.{fn.__qualname__};".encode())
+    if id(fn) in seen:
+        return
+    seen.add(id(fn))
+    _hash_code(h, fn.__code__, seen)
+    _hash_value(h, fn.__defaults__, seen)
+    _hash_value(h, fn.__kwdefaults__, seen)
+    try:
+        cells = tuple(cell.cell_contents for cell in fn.__closure__ or ())
+    except ValueError:
+        # An empty cell: the closure is not fully built yet
+        raise _Unhashable(fn)
+    _hash_value(h, cells, seen)
+    # co_names also holds attribute names; only actual globals count, and
+    # builtins are left out
+    names = _global_names(fn.__code__)
+    _hash_value(h, {name: fn.__globals__[name] for name in names if name in fn.__globals__}, seen)
+
+
+def _global_names(code: types.CodeType) -> set:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def ansatz_fingerprint(backend, ansatz: Callable, params: np.ndarray) -> Optional[str]:
+    """
+    SHA-256 of an ansatz's traced gate list (gates, qubits, argument names
+    and the affine angle map), so two callables that build the same
+    circuit share a fingerprint. Ansätze that cannot be traced (CV
+    backends, value-dependent structure) fall back to their code,
+    defaults, closure cells and referenced globals; None when any of
+    those has no stable digest (e.g. an arbitrary object in a closure).
+    """
+    h = hashlib.sha256()
+    try:
+        tape = ansatz if hasattr(ansatz, "param_index") else backend.compile_ansatz(ansatz, params)
+    except (AttributeError, TypeError, ValueError):
+        tape = None
+    if tape is not None:
+        h.update(b"tape")
+        h.update(repr((tape.n_qubits, tape.n_params, tape.gates, tape.qubits, tape.param_names)).encode())
+        for arr in (tape.param_index, tape.coeff, tape.offset):
+            h.update(np.ascontiguousarray(arr).tobytes())
+        return h.hexdigest()
+    h.update(b"code")
+    try:
+        _hash_value(h, ansatz, set())
+    except _Unhashable:
+        return None
+    return h.hexdigest()
+
+
+def run_fingerprint(
+        backend,
+        hamiltonian: ham.Hamiltonian,
+        hamiltonian_kind: str,
+        ansatz: Callable,
+        initial_params: np.ndarray,
+        settings: Dict[str, Any]
+) -> Optional[str]:
+    """
+    Stable key of one VQE.run(): Hamiltonian contents, traced ansatz,
+    exact initial parameter bytes, backend identity and run settings.
+    None when the ansatz has no stable fingerprint.
+    """
+    params = np.ascontiguousarray(initial_params, dtype=float)
+    ansatz_key = ansatz_fingerprint(backend, ansatz, params)
+    if ansatz_key is None:
+        return None
+    size = getattr(backend, "n_qubits", None)
+    if size is None:
+        size = getattr(backend, "n_modes", None)
+    h = hashlib.sha256()
+    h.update(json.dumps({
+        "version": _FINGERPRINT_VERSION,
+        "hamiltonian": ham._content_hash(hamiltonian, hamiltonian_kind),
+        "ansatz": ansatz_key,
+        "params": hashlib.sha256(params.tobytes()).hexdigest(),
+        "shape": list(params.shape),
+        "backend": [backend.name, size, getattr(backend, "shots", None)],
+        "settings": settings,
+    }, sort_keys=True, default=repr).encode())
+    return h.hexdigest()
+
+
+class RunCache:
+    """
+    Directory of finished VQEResults, one VQEResult.save() directory per
+    run fingerprint. Entries are written to a temporary directory and
+    renamed into place, so a crash never leaves a half-written hit.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[VQEResult]:
+        path = self._path(key)
+        if not os.path.isdir(path):
+            return None
+        return VQEResult.load(path)
+
+    def put(self, key: str, result: VQEResult) -> None:
+        path = self._path(key)
+        if os.path.isdir(path):
+            return
+        staging = tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.directory)
+        try:
+            result.save(staging)
+            os.replace(staging, path)
+        except OSError:
+            # Another process stored the same run first
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
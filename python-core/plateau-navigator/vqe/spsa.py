@@ -0,0 +1,123 @@
+from typing import Callable, Optional, Union
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+# Spall's asymptotically optimal gain exponents
+_ALPHA = 0.602
+_GAMMA = 0.101
+
+# First-step size targeted when the learning rate is calibrated
+_TARGET_MAGNITUDE = 2 * np.pi / 10
+
+
+def minimize_spsa(
+    evaluate: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    maxiter: int = 100,
+    tol: float = 0.0,
+    second_order: bool = False,
+    learning_rate: Optional[float] = None,
+    perturbation: float = 0.2,
+    stability_constant: Optional[float] = None,
+    resamplings: int = 1,
+    regularization: float = 0.1,
+    calibration_steps: int = 10,
+    seed: Union[int, np.random.Generator, None] = None,
+    on_iteration: Optional[Callable[[int, np.ndarray, float, np.ndarray], None]] = None,
+) -> OptimizeResult:
+    """
+    Simultaneous-perturbation stochastic approximation (Spall 1992), and
+    its second-order variant 2-SPSA (Spall 2000).
+
+    Every iteration draws Rademacher directions Δ and estimates
+
+        ĝ = [E(x + cΔ) - E(x - cΔ)] / (2c) · Δ
+
+    from 2 energies, independent of the parameter count. 2-SPSA adds a
+    second direction Δ' and two more energies to estimate the Hessian,
+
+        Ĥ = [E(x+cΔ+cΔ') - E(x+cΔ) - E(x-cΔ+cΔ') + E(x-cΔ)] / (2c²)
+            · (ΔΔ'ᵀ + Δ'Δᵀ) / 2
+
+    reusing the gradient pair, i.e. 4 energies per iteration. The running
+    Hessian average is made positive definite (|eigenvalues| + β) and
+    preconditions the step. All energies of an iteration — for every
+    resampling — are requested in one evaluate() call.
+
+    Args:
+        evaluate:           evaluate(rows) -> energies for a (B, P) array.
+        maxiter:            Number of iterations.
+        tol:                Stop when a step moves x by less than tol.
+        second_order:       Use 2-SPSA.
+        learning_rate:      Gain a in a_k = a / (A + k + 1)^0.602. None
+                            calibrates a so the first step has magnitude
+                            2π/10, spending 2 · calibration_steps energies.
+        perturbation:       Gain c in c_k = c / (k + 1)^0.101.
+        stability_constant: A; defaults to 10% of maxiter.
+        resamplings:        Independent Δ per iteration; estimates are
+                            averaged.
+        regularization:     β added to the Hessian eigenvalues (2-SPSA).
+        seed:               Seed or Generator for the perturbations.
+        on_iteration:       on_iteration(k, x, energy, gradient) before every
+                            step, with the mean of the ± pair energies as
+                            the estimate of E(x); may raise to stop.
+    Returns:
+        OptimizeResult with x, fun (the last E(x) estimate), nit, nfev.
+    """
+    rng = np.random.default_rng(seed)
+    x = np.array(x0, dtype=float)
+    P = x.size
+    A = 0.1 * maxiter if stability_constant is None else stability_constant
+    nfev = 0
+
+    if learning_rate is None:
+        # Mean |directional derivative| at x0, all pairs in one batch
+        deltas = rng.choice([-1.0, 1.0], size=(calibration_steps, P))
+        energies = evaluate(np.concatenate([x + perturbation * deltas, x - perturbation * deltas]))
+        nfev += 2 * calibration_steps
+        slope = np.mean(np.abs(energies[:calibration_steps] - energies[calibration_steps:])) / (2 * perturbation)
+        learning_rate = _TARGET_MAGNITUDE * (A + 1) ** _ALPHA / max(slope * np.sqrt(P), 1e-12)
+
+    # The identity prior makes early 2-SPSA steps plain SPSA steps
+    hessian = np.eye(P) if second_order else None
+    energy = np.nan
+    message = "Maximum number of iterations reached"
+    k = 0
+    for k in range(maxiter):
+        a_k = learning_rate / (A + k + 1) ** _ALPHA
+        c_k = perturbation / (k + 1) ** _GAMMA
+        delta = rng.choice([-1.0, 1.0], size=(resamplings, P))
+        rows = [x + c_k * delta, x - c_k * delta]
+        if second_order:
+            delta2 = rng.choice([-1.0, 1.0], size=(resamplings, P))
+            rows += [x + c_k * (delta + delta2), x + c_k * (delta2 - delta)]
+        energies = np.asarray(evaluate(np.concatenate(rows)), dtype=float).reshape(len(rows), resamplings)
+        nfev += energies.size
+        energy = float(energies[:2].mean())
+
+        gradient = ((energies[0] - energies[1]) / (2 * c_k)) @ delta / resamplings
+        step = gradient
+        if second_order:
+            scale = (energies[2] - energies[0] - energies[3] + energies[1]) / (2 * c_k ** 2)
+            outer = np.einsum("r,ri,rj->ij", scale, delta, delta2) / resamplings
+            hessian = ((k + 1) * hessian + (outer + outer.T) / 2) / (k + 2)
+            w, V = np.linalg.eigh(hessian)
+            step = V @ ((V.T @ gradient) / (np.abs(w) + regularization))
+
+        if on_iteration is not None:
+            on_iteration(k + 1, x, energy, gradient)
+        x_new = x - a_k * step
+        moved = np.linalg.norm(x_new - x)
+        x = x_new
+        if moved < tol:
+            message = "Step size below tolerance"
+            break
+
+    return OptimizeResult(
+        x=x,
+        fun=energy,
+        nit=k + 1 if maxiter else 0,
+        nfev=nfev,
+        success=True,
+        message=message,
+    )
@@ -0,0 +1,79 @@
+from dataclasses import field, dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+# One row per (backend, ansatz, size, layers) cell of a sweep
+SWEEP_RECORD_DTYPE = np.dtype([
+    ("backend", "U64"),
+    ("ansatz", "U64"),
+    ("size", np.int64),
+    ("layers", np.int64),
+    ("n_params", np.int64),
+    ("n_samples", np.int64),
+    ("variance", np.float64),
+    ("variance_min", np.float64),
+    ("variance_max", np.float64),
+    ("mean_abs_gradient", np.float64),
+])
+
+
+@dataclass
+class SweepResult:
+    """
+    Gradient-variance scaling data from GradientVarianceSweep.run().
+
+    records is a tidy structured array — one row per grid cell — so curves
+    are plain boolean-mask selections:
+
+        rows = result.records[(result.records["backend"] == "aer")
+                              & (result.records["layers"] == 4)]
+        plt.semilogy(rows["size"], rows["variance"])
+
+    variance is the per-parameter Var[∂E/∂θ_k] over the random draws,
+    averaged over k; param_variances[i] holds the full per-parameter
+    vector of row i and gradients[i] the raw (n_samples, n_params) draws.
+    """
+
+    records: np.ndarray
+    param_variances: List[np.ndarray] = field(default_factory=list)
+    gradients: List[np.ndarray] = field(default_factory=list)
+    gradient_method: str = ""
+    n_samples: int = 0
+    seed: Any = None
+    execution_time: float = 0.0
+
+    def curve(self, backend: str, ansatz: str, layers: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(sizes, variances) for one backend/ansatz/depth, sorted by size."""
+        rows = self.records[
+            (self.records["backend"] == backend)
+            & (self.records["ansatz"] == ansatz)
+            & (self.records["layers"] == layers)
+        ]
+        rows = np.sort(rows, order="size")
+        return rows["size"], rows["variance"]
+
+    def decay_rate(self, backend: str, ansatz: str, layers: int) -> float:
+        """
+        Exponential decay rate b from a least-squares fit of
+        log Var[∂E/∂θ] = a - b·size. b > 0 signals a barren plateau.
+        """
+        sizes, variances = self.curve(backend, ansatz, layers)
+        if len(sizes) < 2:
+            raise ValueError("decay_rate() needs at least two sizes.")
+        slope, _ = np.polyfit(sizes, np.log(variances), 1)
+        return float(-slope)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'records': [
+                {name: row[name].item() for name in SWEEP_RECORD_DTYPE.names}
+                for row in self.records
+            ],
+            'param_variances': [v.tolist() for v in self.param_variances],
+            'gradient_method': self.gradient_method,
+            'n_samples': self.n_samples,
+            'seed': self.seed,
+            'execution_time': self.execution_time,
+        }
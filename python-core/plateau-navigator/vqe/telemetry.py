@@ -0,0 +1,255 @@
+import csv
+import json
+import sys
+import threading
+from collections import deque
+from time import monotonic, time
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+class TelemetrySink:
+    """Receives batches of events on the telemetry thread."""
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class StdoutSink(TelemetrySink):
+    """
+    The messages a verbose VQE prints, rendered off the optimizer thread:
+    every iteration_every-th iteration, plateau detections and policy
+    decisions.
+    """
+
+    def __init__(self, iteration_every: int = 10, stream: Optional[TextIO] = None):
+        self.iteration_every = iteration_every
+        self.stream = stream
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        lines = []
+        for event in events:
+            kind = event["type"]
+            if kind == "iteration" and event["iteration"] % self.iteration_every == 0:
+                lines.append(f"Iter {event['iteration']:4d}: E = {event['energy']:+.8f}")
+            elif kind == "plateau":
+                lines.append(
+                    f"Possible plateau detected (var={event['variance']:.2e}, norm={event['norm']:.2e})"
+                )
+            elif kind == "plateau_action":
+                lines.append(f"Plateau policy: {event['action']} at iteration {event['iteration']}")
+        if lines:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(lines) + "\n")
+
+    def flush(self) -> None:
+        (self.stream or sys.stdout).flush()
+
+
+class JSONLSink(TelemetrySink):
+    """One JSON object per event, appended to `path`."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "a")
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        self._fh.write("".join(json.dumps(e, default=_json_default) + "\n" for e in events))
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class CSVSink(TelemetrySink):
+    """
+    One row per event with a fixed set of columns; fields an event lacks
+    are left empty, fields not listed are dropped.
+    """
+
+    DEFAULT_FIELDS = ("type", "time", "iteration", "energy", "best_energy", "variance", "norm", "action")
+
+    def __init__(self, path: str, fields: Sequence[str] = DEFAULT_FIELDS):
+        self.path = path
+        self._fh = open(path, "w", newline="")
+        self._writer = csv.DictWriter(self._fh, fieldnames=list(fields), extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(events)
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class CallbackSink(TelemetrySink):
+    """Calls fn(event) for every event, on the telemetry thread."""
+
+    def __init__(self, fn: Callable[[Dict[str, Any]], None]):
+        self.fn = fn
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            self.fn(event)
+
+
+class Telemetry:
+    """
+    Event bus between a VQE run and its sinks. VQE.run() emits run_start,
+    iteration, gradient (variance and norm of every gradient), plateau,
+    plateau_action and run_end events; each is a flat dict with its
+    "type" and wall-clock "time".
+
+    emit() only filters and appends to a bounded in-memory queue — it never
+    blocks and never performs I/O. A daemon thread drains the queue every
+    `interval` seconds and hands each batch to every sink, so terminal,
+    file or network latency stays off the optimizer thread. When the queue
+    is full, new events are dropped and counted in `dropped`.
+
+    Per event type:
+        sample:   keep every k-th event, e.g. {"iteration": 10, "gradient": 5}.
+        max_rate: keep at most r events per second (token bucket holding
+                  max(r, 1) tokens), e.g. {"iteration": 50.0}.
+
+    Sink exceptions are counted in `sink_errors` (the last one is kept in
+    `last_error`) and never reach the optimizer.
+
+        with Telemetry([StdoutSink(), JSONLSink("run.jsonl")]) as telemetry:
+            VQE(backend, H, ansatz, telemetry=telemetry).run(x0)
+    """
+
+    def __init__(
+            self,
+            sinks: Sequence[TelemetrySink],
+            queue_size: int = 65536,
+            sample: Optional[Dict[str, int]] = None,
+            max_rate: Optional[Dict[str, float]] = None,
+            interval: float = 0.05
+    ):
+        self.sinks = list(sinks)
+        self.queue_size = queue_size
+        self.sample = dict(sample or {})
+        self.max_rate = dict(max_rate or {})
+        self.interval = interval
+        self.dropped = 0
+        self.sampled_out = 0
+        self.rate_limited = 0
+        self.sink_errors = 0
+        self.last_error: Optional[BaseException] = None
+        self._queue: deque = deque()
+        self._seen: Dict[str, int] = {}
+        # event type -> [tokens, last refill (monotonic)]
+        self._buckets: Dict[str, List[float]] = {}
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._drain_loop, name="vqe-telemetry", daemon=True)
+        self._thread.start()
+
+    def emit(self, event_type: str, **fields: Any) -> None:
+        every = self.sample.get(event_type)
+        if every is not None:
+            seen = self._seen.get(event_type, 0)
+            self._seen[event_type] = seen + 1
+            if seen % every:
+                self.sampled_out += 1
+                return
+        rate = self.max_rate.get(event_type)
+        if rate is not None and not self._take_token(event_type, rate):
+            self.rate_limited += 1
+            return
+        # deque.append is atomic; the length check may overshoot by a
+        # few events under contention, which is harmless
+        if len(self._queue) >= self.queue_size:
+            self.dropped += 1
+            return
+        fields["type"] = event_type
+        fields["time"] = time()
+        self._queue.append(fields)
+
+    def _take_token(self, event_type: str, rate: float) -> bool:
+        now = monotonic()
+        capacity = max(rate, 1.0)
+        bucket = self._buckets.get(event_type)
+        if bucket is None:
+            bucket = self._buckets[event_type] = [capacity, now]
+        bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if bucket[0] < 1.0:
+            return False
+        bucket[0] -= 1.0
+        return True
+
+    def _drain_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._drain()
+
+    def _drain(self) -> None:
+        with self._write_lock:
+            events = []
+            queue = self._queue
+            while queue:
+                events.append(queue.popleft())
+            if not events:
+                return
+            for sink in self.sinks:
+                try:
+                    sink.write(events)
+                except Exception as e:
+                    self.sink_errors += 1
+                    self.last_error = e
+
+    def flush(self) -> None:
+        """Deliver every queued event and flush the sinks (blocks on I/O)."""
+        self._drain()
+        with self._write_lock:
+            for sink in self.sinks:
+                try:
+                    sink.flush()
+                except Exception as e:
+                    self.sink_errors += 1
+                    self.last_error = e
+
+    def close(self) -> None:
+        """Stop the thread, deliver what is left and close the sinks."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                self.sink_errors += 1
+                self.last_error = e
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": len(self._queue),
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "rate_limited": self.rate_limited,
+            "sink_errors": self.sink_errors,
+        }
+
+    def __enter__(self) -> "Telemetry":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -1,20 +1,52 @@
 from time import time
 import numpy as np
-from scipy.optimize import minimize
-from typing import Callable, Dict, Any, Optional, Tuple
+from scipy.optimize import OptimizeResult, minimize
+from typing import Callable, Dict, Any, Optional, Tuple, Union
+from backends.profiling import NULL_PROFILER
+from . import hamiltonian as ham
+from . import reference
+from .ask_tell import AskTellOptimizer, CMAES
+from .checkpoint import EvaluationLog
+from .eval_cache import EvaluationCache
+from .history import HistoryRecorder
+from .parallel import ParallelEvaluator
+from .profiling import Profiler
+from .plateau_policy import PlateauPolicy, PlateauRestart, ReducedAnsatz, restart_point
+from .run_cache import RunCache, run_fingerprint
 from .optimizer_type import OptimizerType
+from .spsa import minimize_spsa
+from .telemetry import Telemetry
 from .vqe_result import VQEResult
 
 
+class EarlyStop(Exception):
+    """
+    Raise from a run() callback to end the optimisation early. run() then
+    returns a VQEResult for the best point evaluated so far, with
+    success=False and the exception message as its message.
+    """
+
+
 class VQE:
         def __init__(
                 self,
                 backend,
-                hamiltonian: np.ndarray,
+                hamiltonian: ham.Hamiltonian,
                 ansatz: Callable,
                 gradient_method: str = "parameter_shift",
                 plateau_threshold: float = 1e-6,
-                verbose: bool = True
+                verbose: bool = True,
+                compile_ansatz: bool = False,
+                cache_size: int = 256,
+                n_workers: int = 1,
+                backend_factory: Optional[Callable] = None,
+                param_stride: int = 1,
+                history_dir: Optional[str] = None,
+                run_cache: Optional[str] = None,
+                plateau_policy: Optional[PlateauPolicy] = None,
+                profile: bool = False,
+                profile_trace: Optional[str] = None,
+                telemetry: Optional[Telemetry] = None
         ):
             self.backend = backend
             self.hamiltonian = hamiltonian
@@ -22,53 +54,209 @@ class VQE:
             self.gradient_method = gradient_method
             self.plateau_threshold = plateau_threshold
             self.verbose = verbose
+            # Trace the ansatz into a backend gate tape on first use and
+            # rebind parameters from then on (DV backends only)
+            self.compile_ansatz = compile_ansatz
+            self._tape = None
+            # Energies and gradients memoised on exact parameter bytes;
+            # cache_size=0 disables (e.g. for shot-noise backends)
+            self._energy_cache = EvaluationCache(cache_size)
+            self._gradient_cache = EvaluationCache(cache_size)
+            # Shifted gradient evaluations fan out to n_workers processes,
+            # each holding its own backend_factory() instance
+            if n_workers > 1 and backend_factory is None:
+                raise ValueError(
+                    "n_workers > 1 requires a picklable backend_factory that "
+                    "builds a backend configured like `backend`."
+                )
+            self.n_workers = n_workers
+            self.backend_factory = backend_factory
+            self._evaluator = None
+            # backend.prepare_observable(hamiltonian), resolved once per run()
+            self._observable = None
             self._validate_hamiltonian()
-            self.energy_history = []
-            self.param_history = []
+            # Energies, every param_stride-th parameter vector and gradient
+            # variances stream into preallocated columns, memory-mapped
+            # under history_dir if given; results share these buffers.
+            # Each run() starts its own recorder (and file set)
+            self.param_stride = param_stride
+            self.history_dir = history_dir
+            self._history = HistoryRecorder(param_stride)
+            # Opt-in directory of finished runs keyed by run fingerprint;
+            # an identical run() returns the stored VQEResult immediately
+            self._run_cache = RunCache(run_cache) if run_cache else None
+            # Backend evaluations of the current run, kept when checkpointing
+            self._log: Optional[EvaluationLog] = None
+            self._checkpoint: Optional[Tuple[str, int, Dict[str, Any]]] = None
+            # Stop or restart once plateaus persist; while a reduced ansatz
+            # is trained, self.ansatz is that ReducedAnsatz
+            self.plateau_policy = plateau_policy
+            self._reduced: Optional[ReducedAnsatz] = None
+            self.plateau_decisions = []
+            # Phase timers for VQE and (lent per run) the backend; each run
+            # stores its breakdown in VQEResult.profile and, with
+            # profile_trace, rewrites that Chrome trace file
+            self.profiler = Profiler() if profile or profile_trace else NULL_PROFILER
+            self.profile_trace = profile_trace
+            # Iteration, gradient and plateau events go to this bus instead
+            # of being printed; its thread does all the I/O
+            self.telemetry = telemetry
             self.gradient_history = []
             self.iteration = 0
             self.energy_eval_count = 0
             self.gradient_eval_count = 0
+            self.metric_eval_count = 0
             self.plateau_iterations = []
-            self.gradient_variances = []
             self.start_time = None
 
         def _validate_hamiltonian(self):
-            if not isinstance(self.hamiltonian, np.ndarray):
-                raise TypeError("Hamiltonian must be numpy array")
-
-            if self.hamiltonian.ndim != 2:
-                raise ValueError(f"Hamiltonian must be 2D matrix, got shape {self.hamiltonian.shape}")
-
-            if self.hamiltonian.shape[0] != self.hamiltonian.shape[1]:
-                raise ValueError(f"Hamiltonian must be square, got shape {self.hamiltonian.shape}")
-
-            if not np.allclose(self.hamiltonian, self.hamiltonian.conj().T):
-                raise ValueError("Hamiltonian must be Hermitian (H = H†)")
+            # Accepts dense, scipy.sparse or Pauli-sum input; backends pick
+            # the cheapest evaluation path for whichever form they receive
+            self.hamiltonian, self.hamiltonian_kind = ham._normalize_hamiltonian(self.hamiltonian)
 
         def run(
                 self,
                 initial_params: np.ndarray,
-                optimizer: OptimizerType = OptimizerType.COBYLA,
+                optimizer: Union[OptimizerType, AskTellOptimizer] = OptimizerType.COBYLA,
                 max_iter: int = 1000,
                 tol: float = 1e-6,
-                callback: Optional[Callable] = None
+                callback: Optional[Callable] = None,
+                optimizer_options: Optional[Dict[str, Any]] = None,
+                checkpoint: Optional[str] = None,
+                checkpoint_every: int = 10,
+                resume_from: Optional[str] = None
             ) -> VQEResult:
+            """
+            Args:
+                optimizer:         An OptimizerType, or a ready AskTellOptimizer
+                                   instance. For ask/tell optimizers max_iter
+                                   counts generations, while history and
+                                   callbacks still see every candidate.
+                optimizer_options: Extra options for the optimizer — merged
+                                   into SciPy's options, or keyword arguments
+                                   of minimize_spsa() for SPSA / 2-SPSA
+                                   (learning_rate, perturbation,
+                                   resamplings, seed, ...), of CMAES for
+                                   CMA-ES (sigma, population_size, seed), or
+                                   learning_rate, metric_refresh and
+                                   regularization for natural_gradient.
+                checkpoint:        Directory that every checkpoint_every
+                                   iterations (and when run() exits, also
+                                   on errors) gets a new segment holding the
+                                   backend evaluations made since the last
+                                   one, the counters and the seed.
+                resume_from:       Checkpoint of an interrupted run with the
+                                   same arguments. The optimizer restarts
+                                   from initial_params and retraces its
+                                   path, served from the checkpoint, so no
+                                   completed evaluation is sent to the
+                                   backend again; checkpointing continues
+                                   into the same directory unless checkpoint
+                                   is given.
+
+            With run_cache set, a run whose Hamiltonian, traced ansatz,
+            initial parameters, optimizer settings and backend match a
+            finished one returns that result without evaluating anything
+            (and without invoking callback). Runs ended by EarlyStop, runs
+            with AskTellOptimizer instances and runs whose untraceable ansatz
+            captures objects without a stable fingerprint are not cached.
+
+            With a plateau_policy, persistent plateaus stop the run or restart
+            the optimizer (see PlateauPolicy); restarts share max_iter, the
+            result holds the best point over all stages and
+            VQEResult.plateau_decisions records every decision.
+            """
+            fingerprint = cache_key = None
+            if self._run_cache is not None or checkpoint or resume_from:
+                fingerprint = run_fingerprint(
+                    self.backend, self.hamiltonian, self.hamiltonian_kind, self.ansatz, initial_params, {
+                        "optimizer": optimizer.value if isinstance(optimizer, OptimizerType) else type(optimizer).__name__,
+                        "max_iter": max_iter,
+                        "tol": tol,
+                        "options": optimizer_options or {},
+                        "gradient_method": self.gradient_method,
+                        "plateau_threshold": self.plateau_threshold,
+                        "param_stride": self.param_stride,
+                        **({"plateau_policy": repr(self.plateau_policy)} if self.plateau_policy else {}),
+                    },
+                )
+            if self._run_cache is not None and isinstance(optimizer, OptimizerType) and fingerprint is not None:
+                cache_key = fingerprint
+                cached = self._run_cache.get(cache_key)
+                if cached is not None:
+                    if self.verbose:
+                        print(f"Run cache hit ({cache_key[:12]}): E = {cached.optimal_energy:+.8f}")
+                    return cached
+
+            log, meta = EvaluationLog(), {}
+            if resume_from is not None:
+                log, meta = EvaluationLog.load(resume_from)
+                if fingerprint is None:
+                    raise ValueError(
+                        f"Cannot verify checkpoint {resume_from}: the ansatz cannot be traced and "
+                        f"captures values without a stable fingerprint."
+                    )
+                if meta.get("fingerprint") != fingerprint:
+                    raise ValueError(
+                        f"Checkpoint {resume_from} was written by a run with a different "
+                        f"Hamiltonian, ansatz, initial parameters, optimizer or backend."
+                    )
+                checkpoint = checkpoint or resume_from
+            # Stochastic optimizers must redraw the same perturbations on
+            # resume, so an unseeded run gets a recorded seed
+            optimizer_options = dict(optimizer_options or {})
+            if (checkpoint and "seed" not in optimizer_options
+                    and optimizer in [OptimizerType.SPSA, OptimizerType.SPSA2, OptimizerType.CMA_ES]):
+                seed = meta.get("seed")
+                optimizer_options["seed"] = int(np.random.SeedSequence().generate_state(1)[0]) if seed is None else seed
+            plateau_seed = None
+            if checkpoint and self.plateau_policy is not None and self.plateau_policy.seed is None:
+                plateau_seed = meta.get("plateau_seed")
+                if plateau_seed is None:
+                    plateau_seed = int(np.random.SeedSequence().generate_state(1)[0])
 
             self.start_time = time()
             self._reset_tracking()
+            self._log = self._checkpoint = None
+            self._observable = None
+            if checkpoint:
+                self._log = log
+                self._checkpoint = (checkpoint, max(1, checkpoint_every), {
+                    "fingerprint": fingerprint, "seed": optimizer_options.get("seed"), "plateau_seed": plateau_seed,
+                })
+                if self.verbose and resume_from is not None:
+                    print(f"Resuming from {resume_from}: {len(log)} logged evaluations")
+
+            lent_profiler = self.profiler.enabled and hasattr(self.backend, "profiler")
+            if lent_profiler:
+                backend_profiler, self.backend.profiler = self.backend.profiler, self.profiler
 
             if self.verbose:
                 self._print_header(initial_params, optimizer)
+            if self.telemetry is not None:
+                self.telemetry.emit(
+                    "run_start", backend=self.backend.name, n_params=int(np.size(initial_params)),
+                    optimizer=optimizer.value if isinstance(optimizer, OptimizerType) else type(optimizer).__name__,
+                )
+
+            # Adjoint gradients come with E(θ) from the same forward pass, so
+            # when jac will be requested anyway, fun(θ) computes both and
+            # the following jac(θ) is served from the gradient cache
+            fuse_adjoint = (
+                self.gradient_method == "adjoint"
+                and optimizer in [OptimizerType.BFGS, OptimizerType.L_BFGS_B, OptimizerType.SLSQP]
+                and self._gradient_cache.max_entries > 0
+            )
 
             def objective(params: np.ndarray) -> float:
+                if fuse_adjoint:
+                    self.compute_gradients(params)
                 energy = self._evaluate_energy(params)
                 self._track_iteration(params, energy)
                 if callback:
                     grads = self._last_gradients if hasattr(self, "_last_gradients") else None
                     callback(self.iteration, energy, params, grads)
-                if self.verbose and self.iteration % 10 == 0:
-                    self._print_progress()
+                self._report_progress()
                 return energy
 
             jac = None
@@ -81,98 +269,457 @@ class VQE:
                         return gradients
                 else:
                     jac = None
-            result = minimize(
-                fun=objective,
-                x0=initial_params,
-                method=optimizer.value,
-                jac=jac,
-                tol=tol,
-                options={'maxiter': max_iter},
-            )
+
+            def optimize(x0: np.ndarray, budget: int) -> OptimizeResult:
+                if isinstance(optimizer, AskTellOptimizer):
+                    return self._run_ask_tell(optimizer, budget, callback)
+                if optimizer == OptimizerType.CMA_ES:
+                    return self._run_ask_tell(CMAES(x0, tol=tol, **optimizer_options), budget, callback)
+                if optimizer == OptimizerType.NATURAL_GRADIENT:
+                    return self._run_natural_gradient(x0, budget, tol, callback, **optimizer_options)
+                if optimizer in [OptimizerType.SPSA, OptimizerType.SPSA2]:
+                    return self._run_spsa(x0, optimizer, budget, tol, callback, optimizer_options)
+                return minimize(
+                    fun=objective,
+                    x0=x0,
+                    method=optimizer.value,
+                    jac=jac,
+                    tol=tol,
+                    options={'maxiter': budget, **optimizer_options},
+                )
+
+            # Plateau restarts share max_iter: each one gets what the
+            # iterations tracked so far have left of it
+            base_ansatz, start, budget = self.ansatz, initial_params, max_iter
+            if self.plateau_policy is not None:
+                self.plateau_policy.reset(plateau_seed)
+            try:
+                while True:
+                    try:
+                        with self.profiler.phase("vqe.optimize"):
+                            result = optimize(start, budget)
+                        break
+                    except PlateauRestart as restart:
+                        start, budget = restart.params, max(1, max_iter - self.iteration)
+                        ansatz = self._reduced if self._reduced is not None else base_ansatz
+                        if ansatz is not self.ansatz:
+                            self.ansatz, self._tape = ansatz, None
+                            self.close()
+                result.x = self._full_params(result.x)
+                if self.plateau_decisions and self._history.best_energy < result.fun:
+                    # An earlier stage found a lower point than the last one
+                    result.x, result.fun = self._history.best_params.copy(), self._history.best_energy
+            except EarlyStop as stop:
+                cache_key = None
+                result = OptimizeResult(
+                    fun=self._history.best_energy,
+                    x=(self._history.best_params.copy() if self._history.best_params is not None
+                       else np.array(initial_params, dtype=float)),
+                    success=False,
+                    message=str(stop) or "Stopped early by callback",
+                )
+            finally:
+                self.close()
+                if lent_profiler:
+                    self.backend.profiler = backend_profiler
+                if self.ansatz is not base_ansatz:
+                    self.ansatz, self._tape = base_ansatz, None
+                self._reduced = None
+                if self._checkpoint is not None:
+                    self._save_checkpoint()
             execution_time = time() - self.start_time
+            if self.telemetry is not None:
+                self.telemetry.emit(
+                    "run_end", energy=float(result.fun), iterations=self.iteration,
+                    success=bool(result.success), message=str(result.message),
+                    energy_evaluations=self.energy_eval_count, execution_time=execution_time,
+                )
+                if self.verbose:
+                    # Queued progress lines land before the summary
+                    self.telemetry.flush()
             if self.verbose:
                 self._print_summary(result, execution_time)
-            return self._build_result(result, execution_time)
+            vqe_result = self._build_result(result, execution_time)
+            if self.profile_trace:
+                self.profiler.write_chrome_trace(self.profile_trace, {
+                    "backend": self.backend.name,
+                    "optimizer": optimizer.value if isinstance(optimizer, OptimizerType) else type(optimizer).__name__,
+                })
+            self._log = self._checkpoint = None
+            if cache_key is not None:
+                self._run_cache.put(cache_key, vqe_result)
+            return vqe_result
         
+        def _run_spsa(
+                self,
+                initial_params: np.ndarray,
+                optimizer: OptimizerType,
+                max_iter: int,
+                tol: float,
+                callback: Optional[Callable],
+                options: Dict[str, Any]
+            ) -> OptimizeResult:
+            # Every iteration's perturbed energies form one batch, so they
+            # go to batch_expectation() / the worker pool in a single call.
+            # History records the ± pair mean as E(θ) at the pre-step θ, and
+            # the SPSA gradient estimate feeds plateau detection
+            def on_iteration(k, params, energy, gradients):
+                self.gradient_eval_count += 1
+                self._last_gradients = gradients
+                self._detect_plateau(gradients)
+                self._track_iteration(params, energy)
+                if callback:
+                    callback(self.iteration, energy, params, gradients)
+                self._report_progress()
+
+            result = minimize_spsa(
+                self._evaluate_energies,
+                np.asarray(initial_params, dtype=float),
+                maxiter=max_iter,
+                tol=tol,
+                second_order=optimizer == OptimizerType.SPSA2,
+                on_iteration=on_iteration,
+                **options,
+            )
+            # Report the exact energy at the final point, not an estimate
+            result.fun = self._evaluate_energy(result.x)
+            return result
+
+        def _run_ask_tell(
+                self,
+                opt: AskTellOptimizer,
+                max_generations: int,
+                callback: Optional[Callable]
+            ) -> OptimizeResult:
+            # A whole generation is one batch_expectation() / worker-pool
+            # call; its candidates are then tracked one by one, as if a
+            # SciPy method had evaluated them in sequence
+            while True:
+                message = opt.stop()
+                if message is not None:
+                    break
+                if opt.generation >= max_generations:
+                    message = "Maximum number of generations reached"
+                    break
+                candidates = opt.ask()
+                energies = self._evaluate_energies(candidates)
+                for params, energy in zip(candidates, energies):
+                    self._track_iteration(params, float(energy))
+                    if callback:
+                        callback(self.iteration, float(energy), params, None)
+                    self._report_progress()
+                opt.tell(candidates, energies)
+            return OptimizeResult(
+                x=opt.best_x.copy(),
+                fun=opt.best_f,
+                nit=opt.generation,
+                nfev=opt.nfev,
+                success=True,
+                message=message,
+            )
+
+        def _run_natural_gradient(
+                self,
+                initial_params: np.ndarray,
+                max_iter: int,
+                tol: float,
+                callback: Optional[Callable],
+                learning_rate: float = 0.05,
+                metric_refresh: int = 5,
+                regularization: float = 1e-3
+            ) -> OptimizeResult:
+            # θ ← θ - η (g + λI)⁻¹ ∇E with the block-diagonal Fubini–Study
+            # metric g, re-estimated every metric_refresh steps. Gradients
+            # come from gradient_method; with 'adjoint' the energy of each
+            # step is a cache hit from the same forward pass
+            if not hasattr(self.backend, "metric_tensor"):
+                raise TypeError(
+                    f"{self.backend.name} cannot estimate the Fubini–Study "
+                    f"metric; natural_gradient needs a DV backend."
+                )
+            params = np.array(initial_params, dtype=float)
+            previous = None
+            metric_solver = None
+            message = "Maximum number of iterations reached"
+            for k in range(max_iter):
+                gradients = self.compute_gradients(params)
+                energy = self._evaluate_energy(params)
+                self._last_gradients = gradients
+                self._detect_plateau(gradients)
+                self._track_iteration(params, energy)
+                if callback:
+                    callback(self.iteration, energy, params, gradients)
+                self._report_progress()
+                if previous is not None and abs(previous - energy) < tol:
+                    message = "Energy change below tolerance"
+                    break
+                previous = energy
+                if metric_solver is None or k % metric_refresh == 0:
+                    self.metric_eval_count += 1
+                    metric = self._log.metric(params) if self._log is not None else None
+                    if metric is None:
+                        with self.profiler.phase("vqe.metric"):
+                            metric = self.backend.metric_tensor(params, self._get_ansatz(params))
+                        if self._log is not None:
+                            self._log.add_metric(params, metric)
+                    w, V = np.linalg.eigh(metric)
+                    metric_solver = (V, np.maximum(w, 0.0) + regularization)
+                V, w = metric_solver
+                params = params - learning_rate * (V @ ((V.T @ gradients) / w))
+            return OptimizeResult(
+                x=self._history.best_params.copy(),
+                fun=self._history.best_energy,
+                nit=self.iteration,
+                success=True,
+                message=message,
+            )
+
         def _evaluate_energy(self, params: np.ndarray) -> float:
+            key = self._energy_cache.key(params)
+            energy = self._energy_cache.get(key)
+            if energy is not None:
+                return energy
             self.energy_eval_count += 1
-            self.backend.clear_circuit()
-            self.backend.reset_state()
-            self.ansatz(self.backend, params)
-            self.backend.execute_circuit()
-            energy = self.backend.compute_expectation(self.hamiltonian)
+            energy = self._log.energy(params) if self._log is not None else None
+            if energy is None:
+                with self.profiler.phase("vqe.energy"):
+                    self.backend.clear_circuit()
+                    self.backend.reset_state()
+                    ansatz = self._get_ansatz(params)
+                    with self.profiler.phase("vqe.ansatz"):
+                        ansatz(self.backend, params)
+                    self.backend.execute_circuit()
+                    energy = self.backend.compute_expectation(self._get_observable())
+                if self._log is not None:
+                    self._log.add_energy(params, energy)
+            self._energy_cache.put(key, energy)
             return energy
 
+        def _get_observable(self) -> Any:
+            if self._observable is None:
+                prepare = getattr(self.backend, "prepare_observable", None)
+                self._observable = self.hamiltonian if prepare is None else prepare(self.hamiltonian)
+            return self._observable
+
+        def _get_ansatz(self, params: np.ndarray) -> Callable:
+            if not self.compile_ansatz:
+                return self.ansatz
+            if (self._tape is None or self._tape.n_params != np.size(params)
+                    or self._tape.n_qubits != self.backend.n_qubits):
+                if not hasattr(self.backend, "compile_ansatz"):
+                    raise TypeError(
+                        f"{self.backend.name} cannot compile ansatz tapes; "
+                        f"use compile_ansatz=False."
+                    )
+                with self.profiler.phase("vqe.compile_ansatz"):
+                    self._tape = self.backend.compile_ansatz(self.ansatz, params)
+            return self._tape
+
         def compute_gradients(self, params: np.ndarray) -> np.ndarray:
+            key = self._gradient_cache.key(params, self.gradient_method)
+            gradients = self._gradient_cache.get(key)
+            if gradients is not None:
+                return gradients.copy()
             self.gradient_eval_count += 1
-            if self.gradient_method == "parameter_shift":
-                return self._parameter_shift_gradients(params)
-            elif self.gradient_method == "finite_diff":
-                return self._finite_difference_gradients(params)
-            else:
-                raise ValueError(f"Unknown gradient method: {self.gradient_method}")
+            with self.profiler.phase("vqe.gradient"):
+                if self.gradient_method == "parameter_shift":
+                    gradients = self._parameter_shift_gradients(params)
+                elif self.gradient_method == "finite_diff":
+                    gradients = self._finite_difference_gradients(params)
+                elif self.gradient_method == "adjoint":
+                    gradients = self._adjoint_gradients(params)
+                else:
+                    raise ValueError(f"Unknown gradient method: {self.gradient_method}")
+            self._gradient_cache.put(key, gradients.copy())
+            return gradients
+
+        def _evaluate_energies(self, param_sets: np.ndarray) -> np.ndarray:
+            self.energy_eval_count += len(param_sets)
+            if self._log is None:
+                return self._backend_energies(param_sets)
+            # Rows already in the checkpoint log are replayed; the rest
+            # still go to the backend as one batch
+            param_sets = np.asarray(param_sets, dtype=float)
+            logged = [self._log.energy(row) for row in param_sets]
+            energies = np.array([np.nan if e is None else e for e in logged])
+            missing = np.isnan(energies)
+            if missing.any():
+                energies[missing] = self._backend_energies(param_sets[missing])
+                for row, energy in zip(param_sets[missing], energies[missing]):
+                    self._log.add_energy(row, energy)
+            return energies
+
+        def _backend_energies(self, param_sets: np.ndarray) -> np.ndarray:
+            with self.profiler.phase("vqe.batch_energy"):
+                return self._batch_energies(param_sets)
+
+        def _batch_energies(self, param_sets: np.ndarray) -> np.ndarray:
+            if self.n_workers > 1:
+                return self._get_evaluator().batch_expectation(param_sets)
+            ansatz = self._get_ansatz(param_sets[0]) if len(param_sets) else self.ansatz
+            energies = self.backend.batch_expectation(param_sets, self._get_observable(), ansatz)
+            return np.asarray(energies, dtype=float)
+
+        def _get_evaluator(self) -> ParallelEvaluator:
+            if self._evaluator is None:
+                size = self.backend.n_qubits if hasattr(self.backend, "n_qubits") else self.backend.n_modes
+                self._evaluator = ParallelEvaluator(
+                    self.backend_factory, size, self.ansatz, self._get_observable(), self.n_workers
+                )
+            return self._evaluator
+
+        def close(self):
+            """Shut down the worker pool, if one was started."""
+            if self._evaluator is not None:
+                self._evaluator.close()
+                self._evaluator = None
+
+        def __enter__(self) -> "VQE":
+            return self
+
+        def __exit__(self, *_) -> None:
+            self.close()
 
         def _parameter_shift_gradients(self, params: np.ndarray, shift: float = np.pi / 2) -> np.ndarray:
-            gradients = np.zeros_like(params)
-            for i in range(len(params)):
-                params_plus = params.copy()
-                params_plus[i] += shift
-                energy_plus = self._evaluate_energy(params_plus)
-                params_minus = params.copy()
-                params_minus[i] -= shift
-                energy_minus = self._evaluate_energy(params_minus)
-                gradients[i] = (energy_plus - energy_minus) / (2 * np.sin(shift))
-            return gradients
+            n = len(params)
+            shifts = shift * np.eye(n)
+            param_sets = np.concatenate([params + shifts, params - shifts])
+            energies = self._evaluate_energies(param_sets)
+            return (energies[:n] - energies[n:]) / (2 * np.sin(shift))
 
         def _finite_difference_gradients(self, params: np.ndarray, epsilon: float = 1e-5) -> np.ndarray:
-            gradients = np.zeros_like(params)
-            for i in range(len(params)):
-                params_plus = params.copy()
-                params_plus[i] += epsilon
-                energy_plus = self._evaluate_energy(params_plus)
-                params_minus = params.copy()
-                params_minus[i] -= epsilon
-                energy_minus = self._evaluate_energy(params_minus)
-                gradients[i] = (energy_plus - energy_minus) / (2 * epsilon)
+            n = len(params)
+            shifts = epsilon * np.eye(n)
+            param_sets = np.concatenate([params + shifts, params - shifts])
+            energies = self._evaluate_energies(param_sets)
+            return (energies[:n] - energies[n:]) / (2 * epsilon)
+
+        def _adjoint_gradients(self, params: np.ndarray) -> np.ndarray:
+            self.energy_eval_count += 1
+            replayed = self._log.adjoint(params) if self._log is not None else None
+            if replayed is not None:
+                energy, gradients = replayed
+            else:
+                energy, gradients = self.backend.adjoint_gradient(
+                    params, self._get_observable(), self._get_ansatz(params)
+                )
+                if self._log is not None:
+                    self._log.add_adjoint(params, energy, gradients)
+            # The forward pass yields E(θ) for free; a following fun(θ) hits
+            self._energy_cache.put(self._energy_cache.key(params), energy)
             return gradients
 
         def _detect_plateau(self, gradients: np.ndarray):
             grad_variance = np.var(gradients)
             grad_norm = np.linalg.norm(gradients)
-            self.gradient_variances.append(grad_variance)
-            if grad_variance < self.plateau_threshold or grad_norm < self.plateau_threshold:
+            self._history.record_gradient_variance(grad_variance)
+            detected = grad_variance < self.plateau_threshold or grad_norm < self.plateau_threshold
+            if self.telemetry is not None:
+                self.telemetry.emit("gradient", iteration=self.iteration, variance=grad_variance, norm=grad_norm)
+            if detected:
                 self.plateau_iterations.append(self.iteration)
-                if self.verbose:
+                if self.telemetry is not None:
+                    self.telemetry.emit("plateau", iteration=self.iteration, variance=grad_variance, norm=grad_norm)
+                elif self.verbose:
                     print(f"Possible plateau detected (var={grad_variance:.2e}, norm={grad_norm:.2e})")
+            if self.plateau_policy is not None:
+                action = self.plateau_policy.observe(detected)
+                if action is not None:
+                    self._apply_plateau_action(action, np.size(gradients))
+
+        def _apply_plateau_action(self, action: str, n_trained: int):
+            policy = self.plateau_policy
+            decision = {"iteration": self.iteration, "action": action, "best_energy": float(self._history.best_energy)}
+            self.plateau_decisions.append(decision)
+            if self.telemetry is not None:
+                self.telemetry.emit("plateau_action", **decision)
+            elif self.verbose:
+                print(f"Plateau policy: {action} after {policy.patience} consecutive detections")
+            if action == "stop":
+                raise EarlyStop(f"Plateau persisted for {policy.patience} consecutive gradient evaluations")
+            if self._reduced is None:
+                params, self._reduced = restart_point(policy, action, self.ansatz, n_trained, None)
+            else:
+                params, self._reduced = restart_point(
+                    policy, action, self._reduced.ansatz, len(self._reduced.template), self._reduced
+                )
+            decision["trained_params"] = len(params)
+            raise PlateauRestart(params)
+
+        def _full_params(self, params: np.ndarray) -> np.ndarray:
+            # Parameters of a reduced stage, embedded into the full vector
+            if self._reduced is not None and np.size(params) == len(self._reduced.active):
+                return self._reduced.full(params)
+            return params
 
         def _track_iteration(self, params: np.ndarray, energy: float):
-            self.iteration += 1
-            self.energy_history.append(energy)
-            self.param_history.append(params.copy())
+            self.iteration = self._history.record(self._full_params(params), energy)
+            if self.telemetry is not None:
+                self.telemetry.emit(
+                    "iteration", iteration=self.iteration, energy=float(energy),
+                    best_energy=self._history.best_energy,
+                )
+            if self._checkpoint is not None and self.iteration % self._checkpoint[1] == 0:
+                self._save_checkpoint()
+
+        def _save_checkpoint(self):
+            path, _, meta = self._checkpoint
+            with self.profiler.phase("vqe.checkpoint"):
+                self._log.save(path, {
+                    **meta,
+                    "iteration": self.iteration,
+                    "energy_evaluations": self.energy_eval_count,
+                    "gradient_evaluations": self.gradient_eval_count,
+                    "metric_evaluations": self.metric_eval_count,
+                })
+
+        @property
+        def energy_history(self) -> np.ndarray:
+            return self._history.energies
+
+        @property
+        def param_history(self) -> np.ndarray:
+            return self._history.params
+
+        @property
+        def gradient_variances(self) -> np.ndarray:
+            return self._history.gradient_variances
 
         def _reset_tracking(self):
-            self.energy_history = []
-            self.param_history = []
+            # A fresh recorder: earlier results keep viewing the old buffers
+            self._history = HistoryRecorder(self.param_stride, directory=self.history_dir)
             self.gradient_history = []
             self.iteration = 0
             self.energy_eval_count = 0
             self.gradient_eval_count = 0
+            self.metric_eval_count = 0
             self.plateau_iterations = []
-            self.gradient_variances = []
+            self.plateau_decisions = []
+            self.profiler.reset()
+            self._energy_cache.clear()
+            self._gradient_cache.clear()
 
-        def _print_header(self, initial_params: np.ndarray, optimizer: OptimizerType):
+        def _print_header(self, initial_params: np.ndarray, optimizer: Union[OptimizerType, AskTellOptimizer]):
             print("=" * 50)
             print("VQE OPTIMIZATION")
             print("=" * 50)
             print(f"Backend:{self.backend.name}")
-            print(f"Hamiltonian:{self.hamiltonian.shape[0]}×{self.hamiltonian.shape[1]}")
+            print(f"Hamiltonian:{ham._describe(self.hamiltonian, self.hamiltonian_kind)}")
             print(f"Parameters:{len(initial_params)}")
-            print(f"Optimizer:{optimizer.value}")
+            name = optimizer.value if isinstance(optimizer, OptimizerType) else type(optimizer).__name__
+            print(f"Optimizer:{name}")
             print(f"Gradient:{self.gradient_method}")
+            print(f"Compiled ansatz:{'yes' if self.compile_ansatz else 'no'}")
+            print(f"Workers:{self.n_workers}")
             print(f"Plateau check:{'enabled' if self.plateau_threshold else 'disabled'}")
             print("=" * 50)
             print()
 
+        def _report_progress(self):
+            # With telemetry, progress is an "iteration" event (see _track_iteration)
+            if self.verbose and self.telemetry is None and self.iteration % 10 == 0:
+                self._print_progress()
+
         def _print_progress(self):
             if len(self.energy_history) == 0:
                 return
@@ -190,46 +737,84 @@ class VQE:
             print(f"Iterations: {self.iteration}")
             print(f"Energy evaluations: {self.energy_eval_count}")
             print(f"Gradient evaluations: {self.gradient_eval_count}")
+            if self.metric_eval_count:
+                print(f"Metric evaluations: {self.metric_eval_count}")
+            if self._log is not None and self._log.replayed:
+                print(f"Replayed from checkpoint: {self._log.replayed}")
+            if self._energy_cache.max_entries:
+                print(f"Cache hits: energy {self._energy_cache.hits}, "
+                      f"gradient {self._gradient_cache.hits}")
             print(f"Execution time: {execution_time:.2f} seconds")
             if self.plateau_iterations:
                 print(f"\nPlateau detected at iterations: {self.plateau_iterations}")
+            for decision in self.plateau_decisions:
+                print(f"Plateau policy: {decision['action']} at iteration {decision['iteration']}")
+            if self.profiler.enabled:
+                print(f"\n{'Phase':<28}{'calls':>8}{'total s':>10}{'self s':>10}")
+                for name, stats in self.profiler.breakdown()["phases"].items():
+                    print(f"{name:<28}{stats['calls']:>8}{stats['total']:>10.3f}{stats['self']:>10.3f}")
             print("=" * 50)
 
         def _build_result(self, scipy_result, execution_time: float) -> VQEResult:
+            self._history.trim()
             return VQEResult(
                 optimal_energy=float(scipy_result.fun),
                 optimal_params=scipy_result.x,
-                energy_history=np.array(self.energy_history),
-                param_history=np.array(self.param_history),
+                energy_history=self._history.energies,
+                param_history=self._history.params,
                 gradient_history=np.array(self.gradient_history) if self.gradient_history else None,
+                param_history_stride=self.param_stride,
                 iterations=self.iteration,
                 success=scipy_result.success,
                 message=scipy_result.message,
                 execution_time=execution_time,
                 energy_evaluations=self.energy_eval_count,
                 gradient_evaluations=self.gradient_eval_count,
+                metric_evaluations=self.metric_eval_count,
+                energy_cache_hits=self._energy_cache.hits,
+                energy_cache_misses=self._energy_cache.misses,
+                gradient_cache_hits=self._gradient_cache.hits,
+                gradient_cache_misses=self._gradient_cache.misses,
                 plateau_detected=len(self.plateau_iterations) > 0,
                 plateau_iterations=self.plateau_iterations,
-                gradient_variance=np.array(self.gradient_variances) if self.gradient_variances else None,
-                backend_name=self.backend.name
+                plateau_decisions=self.plateau_decisions,
+                gradient_variance=self._history.gradient_variances if len(self.gradient_variances) else None,
+                backend_name=self.backend.name,
+                profile=self.profiler.breakdown() if self.profiler.enabled else None
             )
 
         def compute_exact_ground_state(self) -> Tuple[float, np.ndarray]:
-            eigenvalues, eigenvectors = np.linalg.eigh(self.hamiltonian)
-            ground_energy = eigenvalues[0]
-            ground_state = eigenvectors[:, 0]
-            return ground_energy, ground_state
+            energies, states = self.compute_exact_spectrum(1)
+            return energies[0], states[:, 0]
+
+        def compute_exact_spectrum(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+            """
+            The k lowest eigenpairs of the Hamiltonian, ascending, as
+            ((k,), (dim, k)) arrays. Served from the process-wide cache in
+            vqe.reference, so repeated validation does not re-diagonalise.
+            """
+            return reference.lowest_eigenstates(self.hamiltonian, k)
 
-        def validate_result(self, result: VQEResult, tolerance: float = 1e-3) -> Dict[str, Any]:
-            exact_energy, _ = self.compute_exact_ground_state()
+        def validate_result(self, result: VQEResult, tolerance: float = 1e-3, n_excited: int = 0) -> Dict[str, Any]:
+            """
+            Args:
+                n_excited: Also report this many excited-state energies and
+                           the spectral gap E_1 - E_0.
+            """
+            energies, _ = self.compute_exact_spectrum(1 + n_excited)
+            exact_energy = energies[0]
             error = abs(result.optimal_energy - exact_energy)
             relative_error = error / abs(exact_energy) if exact_energy != 0 else error
             converged = error < tolerance
-            return {
+            validation = {
                 'exact_energy': exact_energy,
                 'vqe_energy': result.optimal_energy,
                 'error': error,
                 'relative_error': relative_error,
                 'converged': converged,
                 'tolerance': tolerance
-            }
\ No newline at end of file
+            }
+            if n_excited:
+                validation['excited_energies'] = energies[1:].tolist()
+                validation['gap'] = float(energies[1] - energies[0])
+            return validation
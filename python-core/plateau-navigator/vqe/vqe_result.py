@@ -1,8 +1,15 @@
-from dataclasses import field, dataclass
+import json
+import os
+from dataclasses import field, dataclass, fields
 from typing import List, Optional, Any, Dict
 
 import numpy as np
 
+# On-disk layout written by VQEResult.save(): one <field>.npy per array
+# field plus meta.json holding every other field
+_META_FILE = "meta.json"
+_FORMAT_VERSION = 1
+
 
 @dataclass
 class VQEResult:
@@ -12,25 +19,92 @@ class VQEResult:
     energy_history: np.ndarray
     param_history: np.ndarray
     gradient_history: Optional[np.ndarray] = None
+    # Row r of param_history is iteration 1 + r * param_history_stride
+    param_history_stride: int = 1
     iterations: int = 0
     success: bool = False
     message: str = ""
     execution_time: float = 0.0
     energy_evaluations: int = 0
     gradient_evaluations: int = 0
+    metric_evaluations: int = 0
+    energy_cache_hits: int = 0
+    energy_cache_misses: int = 0
+    gradient_cache_hits: int = 0
+    gradient_cache_misses: int = 0
     plateau_detected: bool = False
     plateau_iterations: List[int] = field(default_factory=list)
+    # PlateauPolicy decisions: iteration, action, best_energy (and the
+    # number of trained_params after a restart)
+    plateau_decisions: List[Dict[str, Any]] = field(default_factory=list)
     gradient_variance: Optional[np.ndarray] = None
     backend_name: str = ""
+    # Profiler.breakdown() of the run when VQE(profile=True)
+    profile: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-ready summary. Lossy: gradient_history, message and
+        plateau_iterations are left out and backend_name is renamed to
+        'backends', so it cannot rebuild a VQEResult — use save() and
+        load() for a full round trip.
+        """
         return {
             'optimal_energy': float(self.optimal_energy),
             'optimal_params': self.optimal_params.tolist(),
             'energy_history': self.energy_history.tolist(),
+            'param_history': self.param_history.tolist(),
+            'param_history_stride': self.param_history_stride,
+            'gradient_variance': None if self.gradient_variance is None else self.gradient_variance.tolist(),
             'iterations': self.iterations,
             'success': self.success,
             'execution_time': self.execution_time,
+            'energy_evaluations': self.energy_evaluations,
+            'gradient_evaluations': self.gradient_evaluations,
+            'metric_evaluations': self.metric_evaluations,
+            'energy_cache_hits': self.energy_cache_hits,
+            'energy_cache_misses': self.energy_cache_misses,
+            'gradient_cache_hits': self.gradient_cache_hits,
+            'gradient_cache_misses': self.gradient_cache_misses,
             'plateau_detected': self.plateau_detected,
-            'backends': self.backend_name
-        }
\ No newline at end of file
+            'plateau_decisions': self.plateau_decisions,
+            'backends': self.backend_name,
+            'profile': self.profile
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Write the result to directory `path`: every array field as its own
+        .npy file, the remaining fields as meta.json. Histories are written
+        straight from their (possibly memory-mapped) buffers.
+        """
+        os.makedirs(path, exist_ok=True)
+        meta: Dict[str, Any] = {"format": _FORMAT_VERSION, "arrays": []}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, np.ndarray):
+                np.save(os.path.join(path, f"{f.name}.npy"), value, allow_pickle=False)
+                meta["arrays"].append(f.name)
+            else:
+                meta[f.name] = value.item() if isinstance(value, np.generic) else value
+        with open(os.path.join(path, _META_FILE), "w") as fh:
+            json.dump(meta, fh, indent=1, default=lambda v: v.item() if isinstance(v, np.generic) else str(v))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "VQEResult":
+        """
+        Read a result written by save(). With mmap=True (default) the
+        arrays are memory-mapped read-only, so opening a run costs a few
+        file headers and history pages are read only when touched.
+        """
+        with open(os.path.join(path, _META_FILE)) as fh:
+            meta = json.load(fh)
+        if meta.get("format") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported VQEResult format {meta.get('format')!r} in {path}.")
+        known = {f.name for f in fields(cls)}
+        kwargs = {k: v for k, v in meta.items() if k in known}
+        for name in meta["arrays"]:
+            kwargs[name] = np.load(
+                os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None, allow_pickle=False
+            )
+        return cls(**kwargs)